@@ -16,13 +16,28 @@ Features:
 - Error handling and validation
 """
 
+import os
 import sys
 import json
+import codecs
+import cProfile
+import hashlib
 import logging
-from typing import Dict, List, Optional, Union, Tuple
+import sqlite3
+import threading
+import time
+import weakref
+import multiprocessing
+import pstats
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, stream_with_context, g
 from flask_cors import CORS
 import re
 
@@ -34,6 +49,68 @@ except ImportError:
     PYBRAILLE_AVAILABLE = False
     print("Warning: pybraille not available, using basic implementation")
 
+# The 'braille' package (also used by braille_translate.py) is a further optional backend
+try:
+    import braille as braille_package
+    BRAILLE_PACKAGE_AVAILABLE = True
+except ImportError:
+    braille_package = None
+    BRAILLE_PACKAGE_AVAILABLE = False
+
+# orjson encodes responses several times faster than the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Maximum number of items accepted by the batch endpoint
+MAX_BATCH_SIZE = int(os.environ.get('BRAILLE_MAX_BATCH_SIZE', '1000'))
+
+# Streaming translation: read size per chunk, and how much text may be held
+# back waiting for a word boundary before it is flushed regardless
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_MAX_PENDING = 64 * 1024
+
+# Upper bound on compiled (standard, language) tables kept in memory
+MAX_COMPILED_TABLES = int(os.environ.get('BRAILLE_MAX_COMPILED_TABLES', '16'))
+
+# Per-table memo of translated words for contracted standards (0 disables
+# it); longer tokens are translated but not remembered
+WORD_MEMO_ENTRIES = int(os.environ.get('BRAILLE_WORD_MEMO_ENTRIES', '50000'))
+WORD_MEMO_MAX_WORD = 64
+
+# In-process translation cache (0 bytes disables it; TTL 0 means no expiry)
+CACHE_MAX_BYTES = int(os.environ.get('BRAILLE_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))
+CACHE_TTL_SECONDS = float(os.environ.get('BRAILLE_CACHE_TTL', '0'))
+
+# Optional on-disk cache shared by all worker processes on a host (unset path
+# disables it); WARM_ENTRIES hottest entries are preloaded into memory at boot
+DISK_CACHE_PATH = os.environ.get('BRAILLE_DISK_CACHE_PATH')
+DISK_CACHE_MAX_BYTES = int(os.environ.get('BRAILLE_DISK_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+DISK_CACHE_WARM_ENTRIES = int(os.environ.get('BRAILLE_DISK_CACHE_WARM_ENTRIES', '0'))
+
+# Translation backends: consecutive failures that open a backend's circuit,
+# and how long it stays open before a single trial call is let through
+BACKEND_FAILURE_THRESHOLD = int(os.environ.get('BRAILLE_BACKEND_FAILURES', '5'))
+BACKEND_COOLDOWN_SECONDS = float(os.environ.get('BRAILLE_BACKEND_COOLDOWN', '30'))
+
+# Requests of at least OFFLOAD_THRESHOLD characters are translated in a pool
+# of OFFLOAD_WORKERS processes (0 disables it), giving up after OFFLOAD_TIMEOUT
+OFFLOAD_THRESHOLD = int(os.environ.get('BRAILLE_OFFLOAD_THRESHOLD', '4000'))
+OFFLOAD_WORKERS = int(os.environ.get('BRAILLE_OFFLOAD_WORKERS', str(min(4, os.cpu_count() or 1))))
+OFFLOAD_TIMEOUT_SECONDS = float(os.environ.get('BRAILLE_OFFLOAD_TIMEOUT', '10'))
+
+# Key expected in the X-API-KEY header of admin endpoints (unset disables them)
+ADMIN_API_KEY = os.environ.get('BRAILLE_ADMIN_KEY')
+
+# Admin requests may ask for a profile; cProfile stats and sampled stacks are
+# written to PROFILE_DIR (unset keeps them in the response only)
+PROFILE_DIR = os.environ.get('BRAILLE_PROFILE_DIR')
+PROFILE_SAMPLE_INTERVAL = float(os.environ.get('BRAILLE_PROFILE_SAMPLE_INTERVAL', '0.001'))
+PROFILE_MODES = ('stages', 'cprofile', 'sample')
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -41,6 +118,263 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Histogram buckets: seconds for latencies, bytes for payload sizes
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class _ShardOwner:
+    """Per-thread holder whose collection retires that thread's metrics shard"""
+    __slots__ = ('shard', '__weakref__')
+
+class MetricsRegistry:
+    """Counters and histograms rendered in the Prometheus text format
+    
+    Every thread records into its own shard, so the hot path takes no lock;
+    shards are only merged when /metrics is scraped. When a thread exits its
+    shard is folded into retired totals, so thread-per-request servers do not
+    accumulate shards. Collectors add values that already live elsewhere
+    (cache sizes, queue depth) at scrape time.
+    """
+    
+    def __init__(self):
+        self._definitions: Dict[str, Tuple[str, str, Optional[Tuple[float, ...]]]] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, Dict[str, str], float]]]] = []
+        self._shards: Dict[int, Dict] = {}
+        self._retired: Dict = {}
+        self._shards_lock = threading.RLock()
+        self._local = threading.local()
+    
+    def counter(self, name: str, help_text: str):
+        self._definitions[name] = ('counter', help_text, None)
+    
+    def histogram(self, name: str, help_text: str, buckets: Tuple[float, ...]):
+        self._definitions[name] = ('histogram', help_text, buckets)
+    
+    def collector(self, func: Callable[[], Iterable[Tuple[str, str, str, Dict[str, str], float]]]):
+        """Register func returning (name, type, help, labels, value) samples"""
+        self._collectors.append(func)
+    
+    def _shard(self) -> Dict:
+        owner = getattr(self._local, 'owner', None)
+        if owner is None:
+            owner = self._local.owner = _ShardOwner()
+            owner.shard = {}
+            with self._shards_lock:
+                self._shards[id(owner.shard)] = owner.shard
+            # Thread-local values are released when the thread exits
+            weakref.finalize(owner, self._retire, owner.shard)
+        return owner.shard
+    
+    def _retire(self, shard: Dict):
+        with self._shards_lock:
+            self._shards.pop(id(shard), None)
+            self._merge(self._retired, shard)
+    
+    @staticmethod
+    def _merge(total: Dict, shard: Dict):
+        for key, value in list(shard.items()):
+            if isinstance(value, list):
+                counts = total.setdefault(key, [0] * len(value))
+                for i, count in enumerate(list(value)):
+                    counts[i] += count
+            else:
+                total[key] = total.get(key, 0) + value
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add value to a counter"""
+        shard = self._shard()
+        key = (name, tuple(sorted(labels.items())))
+        shard[key] = shard.get(key, 0) + value
+    
+    def observe(self, name: str, value: float, **labels):
+        """Record one histogram observation"""
+        buckets = self._definitions[name][2]
+        shard = self._shard()
+        key = (name, tuple(sorted(labels.items())))
+        counts = shard.get(key)
+        if counts is None:
+            counts = shard[key] = [0] * (len(buckets) + 3)  # Buckets, +Inf, sum, count
+        counts[bisect_left(buckets, value)] += 1
+        counts[-2] += value
+        counts[-1] += 1
+    
+    @staticmethod
+    def _labels(labels, le: Optional[str] = None) -> str:
+        parts = [f'{k}="{_escape_label(str(v))}"' for k, v in labels]
+        if le is not None:
+            parts.append(f'le="{le}"')
+        return '{' + ','.join(parts) + '}' if parts else ''
+    
+    def render(self) -> str:
+        """Merge all shards and render them in the Prometheus text format"""
+        merged: Dict = {}
+        # Under the lock, so a shard is never counted both live and retired
+        with self._shards_lock:
+            self._merge(merged, self._retired)
+            for shard in list(self._shards.values()):
+                self._merge(merged, shard)
+        
+        by_name: Dict[str, List] = {}
+        for (name, labels), value in merged.items():
+            by_name.setdefault(name, []).append((labels, value))
+        
+        lines = []
+        for name, (kind, help_text, buckets) in self._definitions.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(by_name.get(name, []), key=lambda item: item[0]):
+                if kind == 'histogram':
+                    cumulative = 0
+                    for bound, count in zip(buckets + ('+Inf',), value):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{self._labels(labels, str(bound))} {cumulative}")
+                    lines.append(f"{name}_sum{self._labels(labels)} {value[-2]}")
+                    lines.append(f"{name}_count{self._labels(labels)} {value[-1]}")
+                else:
+                    lines.append(f"{name}{self._labels(labels)} {value}")
+        
+        # Collector samples are grouped by name, as each family must be contiguous
+        families: Dict[str, Tuple[str, str, List]] = {}
+        for collect in self._collectors:
+            try:
+                samples = list(collect())
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+                continue
+            for name, kind, help_text, labels, value in samples:
+                families.setdefault(name, (kind, help_text, []))[2].append((labels, value))
+        for name, (kind, help_text, samples) in families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{self._labels(sorted(labels.items()))} {value}")
+        return '\n'.join(lines) + '\n'
+
+metrics = MetricsRegistry()
+metrics.counter('braille_http_requests_total', 'HTTP requests by route, method and status.')
+metrics.histogram('braille_http_request_duration_seconds', 'HTTP request latency by route.', LATENCY_BUCKETS)
+metrics.histogram('braille_http_request_size_bytes', 'HTTP request body size by route.', SIZE_BUCKETS)
+metrics.histogram('braille_http_response_size_bytes', 'HTTP response body size by route.', SIZE_BUCKETS)
+metrics.counter('braille_characters_translated_total', 'Source characters translated (cache misses only).')
+metrics.counter('braille_cells_emitted_total', 'Braille cells produced (cache misses only).')
+metrics.counter('braille_cache_lookups_total', 'Translation cache lookups by tier and result.')
+metrics.counter('braille_backend_fallbacks_total', 'Translations that fell through to the next backend after a failure.')
+metrics.counter('braille_translation_errors_total', 'Translations that failed validation, timed out or raised.')
+
+class ProfilerBusy(Exception):
+    """Raised when another request is already being profiled"""
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval
+    
+    Stacks are kept in collapsed form ("outer;inner count"), which flame
+    graph tools read directly.
+    """
+    
+    def __init__(self, thread_id: int, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='braille-profile-sampler', daemon=True)
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                key = ';'.join(reversed(stack))
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+    
+    def __enter__(self) -> "StackSampler":
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+    
+    def collapsed(self) -> str:
+        return ''.join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+    
+    def top(self, limit: int = 10) -> List[Dict]:
+        """Functions most often on top of the stack"""
+        leaves: Dict[str, int] = {}
+        for stack, count in self.stacks.items():
+            leaf = stack.rsplit(';', 1)[-1]
+            leaves[leaf] = leaves.get(leaf, 0) + count
+        ranked = sorted(leaves.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [{"function": leaf, "samples": count} for leaf, count in ranked]
+
+# cProfile allows one active profiler per process
+_profile_lock = threading.Lock()
+
+def _write_profile(suffix: str, write: Callable[[str], None]) -> Optional[str]:
+    """Write a profile into PROFILE_DIR, returning its path"""
+    if not PROFILE_DIR:
+        return None
+    path = os.path.join(PROFILE_DIR, f"translate-{time.strftime('%Y%m%d-%H%M%S')}"
+                                     f"-{os.getpid()}-{threading.get_ident()}{suffix}")
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        write(path)
+    except OSError as e:
+        logger.warning(f"Could not write profile to {PROFILE_DIR}: {e}")
+        return None
+    logger.info(f"Wrote request profile {path}")
+    return path
+
+@contextmanager
+def profile_request(mode: str) -> Iterator[Dict]:
+    """Profile the enclosed block with cProfile or a stack sampler
+    
+    Yields a report dict that is filled in when the block exits. The
+    'stages' mode adds nothing, leaving only the caller's stage timings.
+    """
+    report: Dict = {"mode": mode}
+    if mode == 'stages':
+        yield report
+        return
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy("Another request is being profiled")
+    try:
+        if mode == 'cprofile':
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield report
+            finally:
+                profiler.disable()
+            stats = pstats.Stats(profiler)
+            ranked = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:10]
+            report["top"] = [
+                {"function": f"{func} ({os.path.basename(filename)}:{line})", "calls": calls,
+                 "total_ms": round(total * 1000, 3), "cumulative_ms": round(cumulative * 1000, 3)}
+                for (filename, line, func), (_, calls, total, cumulative, _) in ranked
+            ]
+            report["dump"] = _write_profile('.prof', stats.dump_stats)
+        else:
+            with StackSampler(threading.get_ident()) as sampler:
+                yield report
+            report["samples"] = sum(sampler.stacks.values())
+            report["top"] = sampler.top()
+            
+            def write_collapsed(path: str):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(sampler.collapsed())
+            report["dump"] = _write_profile('.folded', write_collapsed)
+    finally:
+        _profile_lock.release()
+
 class BrailleStandard(Enum):
     """Supported Braille standards"""
     GRADE_1 = "grade1"
@@ -58,6 +392,313 @@ class BrailleLanguage(Enum):
     ITALIAN = "it"
     PORTUGUESE = "pt"
 
+# Accented letters added to the shared Grade 1 alphabet for each language
+LANGUAGE_LETTERS = {
+    BrailleLanguage.SPANISH.value: {
+        'á': '⠷', 'é': '⠮', 'í': '⠌', 'ó': '⠬', 'ú': '⠾', 'ü': '⠳', 'ñ': '⠻'
+    },
+    BrailleLanguage.FRENCH.value: {
+        'à': '⠷', 'â': '⠡', 'ç': '⠯', 'è': '⠮', 'é': '⠿', 'ê': '⠣', 'ë': '⠫',
+        'î': '⠩', 'ï': '⠻', 'ô': '⠹', 'ù': '⠾', 'û': '⠱', 'ü': '⠳', 'œ': '⠪'
+    },
+    BrailleLanguage.GERMAN.value: {
+        'ä': '⠜', 'ö': '⠪', 'ü': '⠳', 'ß': '⠮'
+    },
+    BrailleLanguage.ITALIAN.value: {
+        'à': '⠷', 'è': '⠮', 'é': '⠿', 'ì': '⠌', 'ò': '⠬', 'ù': '⠾'
+    },
+    BrailleLanguage.PORTUGUESE.value: {
+        'á': '⠷', 'à': '⠫', 'â': '⠡', 'ã': '⠜', 'ç': '⠯', 'é': '⠿', 'ê': '⠣',
+        'í': '⠌', 'ó': '⠬', 'ô': '⠹', 'õ': '⠪', 'ú': '⠾', 'ü': '⠳'
+    }
+}
+
+class ContractionContext(Enum):
+    """Word positions in which a contraction may be applied"""
+    ANYWHERE = "anywhere"
+    NOT_INITIAL = "not_initial"  # Must follow a letter (e.g. "ing")
+    MEDIAL = "medial"  # Must have letters on both sides (e.g. "ea", "bb")
+
+class ContractionTrie:
+    """Compiled longest-match automaton over a contraction table
+    
+    The table is compiled once into a character trie, so matching at a
+    position costs at most the length of the longest contraction and is
+    independent of how many contractions the table holds.
+    """
+    
+    _TERMINAL = ''  # Never a valid single-character edge
+    
+    def __init__(self, contractions: Dict[str, str],
+                 contexts: Optional[Dict[str, ContractionContext]] = None):
+        contexts = contexts or {}
+        self._root: Dict = {}
+        self.max_length = 0
+        for source, target in contractions.items():
+            node = self._root
+            for char in source:
+                node = node.setdefault(char, {})
+            node[self._TERMINAL] = (target, contexts.get(source, ContractionContext.ANYWHERE))
+            self.max_length = max(self.max_length, len(source))
+    
+    def __contains__(self, char: str) -> bool:
+        return char in self._root
+    
+    @property
+    def first_chars(self) -> str:
+        """Characters that can start a contraction"""
+        return ''.join(sorted(self._root))
+    
+    @staticmethod
+    def _context_allows(text: str, start: int, end: int, context: ContractionContext) -> bool:
+        """Check the word-boundary context of a candidate match"""
+        if context is ContractionContext.ANYWHERE:
+            return True
+        letter_before = start > 0 and text[start - 1].isalpha()
+        if context is ContractionContext.NOT_INITIAL:
+            return letter_before
+        letter_after = end < len(text) and text[end].isalpha()
+        return letter_before and letter_after
+    
+    def longest_match(self, text: str, start: int) -> Optional[Tuple[int, str]]:
+        """Return (end, target) of the longest allowed match at start, if any"""
+        node = self._root
+        best = None
+        end = start
+        length = len(text)
+        while end < length:
+            node = node.get(text[end])
+            if node is None:
+                break
+            end += 1
+            entry = node.get(self._TERMINAL)
+            if entry is not None and self._context_allows(text, start, end, entry[1]):
+                best = (end, entry[0])
+        return best
+
+class WordMemo:
+    """Bounded LRU of translated words with hit-rate counters
+    
+    Text is split on whitespace, which never takes part in a contraction,
+    so translating word by word gives exactly the same output. Each
+    distinct word is looked up once per call, under a single lock hold.
+    """
+    
+    _TOKEN_RE = re.compile(r'(\s+)')
+    
+    def __init__(self, max_entries: int = WORD_MEMO_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def translate(self, text: str, encode_words: Callable[[List[str]], List[str]]) -> str:
+        """Translate text word by word, encoding only words not yet memoized"""
+        tokens = self._TOKEN_RE.split(text)
+        words = dict.fromkeys(tokens)
+        entries = self._entries
+        with self._lock:
+            for word in words:
+                value = entries.get(word)
+                if value is not None:
+                    entries.move_to_end(word)
+                    words[word] = value
+            missing = [word for word, value in words.items() if value is None]
+            self.hits += len(words) - len(missing)
+            self.misses += len(missing)
+        
+        if missing:
+            words.update(zip(missing, encode_words(missing)))
+            with self._lock:
+                for word in missing:
+                    if len(word) <= WORD_MEMO_MAX_WORD:
+                        entries[word] = words[word]
+                while len(entries) > self.max_entries:
+                    entries.popitem(last=False)
+                    self.evictions += 1
+        return ''.join(map(words.__getitem__, tokens))
+    
+    def stats(self) -> Dict:
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+class TranslationTable:
+    """Braille tables for one standard/language pair, compiled for bulk translation
+    
+    Grade 1 encoding runs as a fixed number of C-level passes: unknown
+    characters are blanked with one regex, number signs are inserted in
+    front of each digit run with another, and a charmap codec (or a
+    str.translate table for non Latin-1 alphabets) maps every remaining
+    character. Grade 2 adds a contraction trie whose matches are spliced
+    between those Grade 1 runs; with a word memo, each distinct word goes
+    through that splice only once.
+    
+    Decoding mirrors this: number-sign runs are cut out with one regex,
+    single cells are mapped with a translate table and multi-cell entries
+    are resolved by longest match over a trie of cell sequences. When a
+    cell means both a letter and a contraction the Grade 1 reading wins.
+    """
+    
+    NUMBER_SIGN = '⠼'
+    BLANK_CELL = '⠀'
+    UNKNOWN_TEXT = '?'
+    
+    # Digits use the a-j patterns after a number sign
+    DIGIT_MAP = {'1': '⠁', '2': '⠃', '3': '⠉', '4': '⠙', '5': '⠑',
+                 '6': '⠋', '7': '⠛', '8': '⠓', '9': '⠊', '0': '⠚'}
+    
+    # Control characters never appear in the tables, so they can stand in
+    # for blank cells and number signs until the final mapping pass
+    _BLANK_MARK = '\x00'
+    _NUMBER_MARK = '\x01'
+    _WORD_MARK = '\x02'  # Separates words encoded in one batch; maps to itself
+    _NUMBER_RUN_RE = re.compile(r'[0-9]+')
+    _BRAILLE_NUMBER_RUN_RE = re.compile(f"{NUMBER_SIGN}[{NUMBER_SIGN}{''.join(DIGIT_MAP.values())}]*")
+    
+    def __init__(self, standard: str, language: str, char_map: Dict[str, str],
+                 contractions: Optional[Dict[str, str]] = None,
+                 contexts: Optional[Dict[str, ContractionContext]] = None,
+                 memo: Optional[WordMemo] = None):
+        self.standard = standard
+        self.language = language
+        self.char_map = char_map
+        self.contractions = ContractionTrie(contractions, contexts) if contractions else None
+        self.memo = memo if self.contractions is not None else None
+        
+        # Encoder
+        mapping = {**char_map, **self.DIGIT_MAP,
+                   self._BLANK_MARK: self.BLANK_CELL, self._NUMBER_MARK: self.NUMBER_SIGN,
+                   self._WORD_MARK: self._WORD_MARK}
+        known = ''.join(sorted(set(char_map) | set(self.DIGIT_MAP)))
+        self._unknown_re = re.compile(f"[^{re.escape(known)}]")
+        self._unknown_batch_re = re.compile(f"[^{re.escape(known + self._WORD_MARK)}]")
+        
+        # Characters that come out as a blank cell. When that is their only
+        # source, blank cells can be counted to map text offsets to Braille
+        # offsets, which is what incremental retranslation relies on.
+        non_blank = set(self.DIGIT_MAP) | {c for c, b in char_map.items() if b != self.BLANK_CELL}
+        self._non_blank_run_re = re.compile(f"[{re.escape(''.join(sorted(non_blank)))}]+")
+        self.blank_countable = not any(
+            self.BLANK_CELL in braille and braille != self.BLANK_CELL
+            for braille in list(char_map.values()) + list((contractions or {}).values())
+        )
+        self._number_mark = self._NUMBER_MARK + r'\g<0>'
+        
+        if all(ord(char) < 256 for char in mapping):
+            decoding = ['\ufffe'] * 256  # U+FFFE marks undefined bytes
+            for char, braille in mapping.items():
+                decoding[ord(char)] = braille
+            self._decoding_table: Optional[str] = ''.join(decoding)
+        else:
+            self._decoding_table = None
+        self._encode_table = str.maketrans(mapping)
+        self._contraction_start_re = (
+            re.compile(f"[{re.escape(self.contractions.first_chars)}]") if self.contractions else None
+        )
+        
+        # Decoder: Grade 1 readings are inserted last so they win ties
+        reverse = {braille: word for word, braille in (contractions or {}).items()}
+        reverse.update({braille: char for char, braille in char_map.items()})
+        single_cells = {cells: text for cells, text in reverse.items() if len(cells) == 1}
+        multi_cells = {cells: text for cells, text in reverse.items() if len(cells) > 1}
+        self._unknown_cell_re = re.compile(f"[^{re.escape(''.join(sorted(single_cells)))}]")
+        self._decode_table = str.maketrans(single_cells)
+        self._digit_decode_table = str.maketrans(
+            {braille: digit for digit, braille in self.DIGIT_MAP.items()} | {self.NUMBER_SIGN: None}
+        )
+        self.decoder = ContractionTrie(multi_cells) if multi_cells else None
+        self._decoder_start_re = (
+            re.compile(f"[{re.escape(self.decoder.first_chars)}]") if self.decoder else None
+        )
+    
+    @staticmethod
+    def _splice(text: str, trie: ContractionTrie, start_re, encode_gap) -> str:
+        """Single longest-match pass: trie matches spliced between bulk-encoded gaps"""
+        pieces = []
+        run_start = 0
+        search = start_re.search
+        candidate = search(text)
+        while candidate is not None:
+            start = candidate.start()
+            match = trie.longest_match(text, start)
+            if match is None:
+                candidate = search(text, start + 1)
+                continue
+            end, replacement = match
+            if start > run_start:
+                pieces.append(encode_gap(text[run_start:start]))
+            pieces.append(replacement)
+            run_start = end
+            candidate = search(text, end)
+        if run_start < len(text):
+            pieces.append(encode_gap(text[run_start:]))
+        return ''.join(pieces)
+    
+    def encode_run(self, text: str, unknown_re=None) -> str:
+        """Encode lowercase text with the Grade 1 tables only"""
+        text = (unknown_re or self._unknown_re).sub(self._BLANK_MARK, text)
+        text = self._NUMBER_RUN_RE.sub(self._number_mark, text)
+        if self._decoding_table is not None:
+            return codecs.charmap_decode(text.encode('latin-1'), 'strict', self._decoding_table)[0]
+        return text.translate(self._encode_table)
+    
+    def encode(self, text: str) -> str:
+        """Encode lowercase text, applying contractions if the table has any"""
+        if self.contractions is None:
+            return self.encode_run(text)
+        if self.memo is not None:
+            return self.memo.translate(text, self._encode_words)
+        return self._encode_contracted(text)
+    
+    def _encode_contracted(self, text: str) -> str:
+        return self._splice(text, self.contractions, self._contraction_start_re, self.encode_run)
+    
+    def _encode_words(self, words: List[str]) -> List[str]:
+        """Encode many words in one splice pass, joined by a mark that survives encoding"""
+        joined = self._WORD_MARK.join(words)
+        if joined.count(self._WORD_MARK) != len(words) - 1:
+            return [self._encode_contracted(word) for word in words]  # Mark present in the input
+        encoded = self._splice(joined, self.contractions, self._contraction_start_re,
+                               lambda gap: self.encode_run(gap, self._unknown_batch_re))
+        return encoded.split(self._WORD_MARK)
+    
+    def count_blanks(self, text: str) -> int:
+        """Number of blank cells the (lowercase) text encodes to"""
+        return len(self._non_blank_run_re.sub('', text))
+    
+    def decode_cells(self, braille: str) -> str:
+        """Decode Braille containing no number signs, one cell at a time"""
+        braille = self._unknown_cell_re.sub(self.UNKNOWN_TEXT, braille)
+        return braille.translate(self._decode_table)
+    
+    def _decode_segment(self, braille: str) -> str:
+        if self.decoder is None:
+            return self.decode_cells(braille)
+        return self._splice(braille, self.decoder, self._decoder_start_re, self.decode_cells)
+    
+    def decode(self, braille: str) -> str:
+        """Decode Braille to text in one pass, reading digits after number signs"""
+        pieces = []
+        position = 0
+        for number in self._BRAILLE_NUMBER_RUN_RE.finditer(braille):
+            if number.start() > position:
+                pieces.append(self._decode_segment(braille[position:number.start()]))
+            pieces.append(number.group().translate(self._digit_decode_table))
+            position = number.end()
+        if position < len(braille):
+            pieces.append(self._decode_segment(braille[position:]))
+        return ''.join(pieces)
+
 @dataclass
 class BrailleTranslationRequest:
     """Request model for Braille translation"""
@@ -67,6 +708,31 @@ class BrailleTranslationRequest:
     reverse: bool = False  # True for Braille-to-text
     format_output: bool = True
     include_metadata: bool = False
+    lean: bool = False  # Leave original_text and null fields out of the response
+    
+    _STRING_FIELDS = ('text', 'standard', 'language')
+    _BOOL_FIELDS = ('reverse', 'format_output', 'include_metadata', 'lean')
+    
+    @classmethod
+    def from_dict(cls, data: Dict, defaults: Optional[Dict] = None) -> "BrailleTranslationRequest":
+        """Build a request from JSON data, raising ValueError for mistyped fields"""
+        if defaults:
+            data = {**defaults, **data}
+        values = {}
+        for name in cls._STRING_FIELDS:
+            value = data.get(name)
+            if value is not None:
+                if not isinstance(value, str):
+                    raise ValueError(f"'{name}' must be a string")
+                values[name] = value
+        for name in cls._BOOL_FIELDS:
+            value = data.get(name)
+            if value is not None:
+                if not isinstance(value, bool):
+                    raise ValueError(f"'{name}' must be true or false")
+                values[name] = value
+        values.setdefault('text', '')
+        return cls(**values)
 
 @dataclass
 class BrailleTranslationResponse:
@@ -80,11 +746,545 @@ class BrailleTranslationResponse:
     braille_cell_count: int
     metadata: Optional[Dict] = None
     error: Optional[str] = None
+    
+    def to_dict(self, lean: bool = False) -> Dict:
+        """Response as a JSON-ready dict, without asdict()'s deep copy
+        
+        Lean responses leave out the echoed original_text and null fields.
+        """
+        payload = {
+            "success": self.success,
+            "result": self.result,
+            "original_text": self.original_text,
+            "standard_used": self.standard_used,
+            "language": self.language,
+            "character_count": self.character_count,
+            "braille_cell_count": self.braille_cell_count,
+            "metadata": self.metadata,
+            "error": self.error,
+        }
+        if lean:
+            del payload["original_text"]
+            if self.metadata is None:
+                del payload["metadata"]
+            if self.error is None:
+                del payload["error"]
+        return payload
+
+@dataclass
+class BraillePatch:
+    """Replace `deleted` cells at `offset` of the previous Braille with `inserted`"""
+    offset: int
+    deleted: int
+    inserted: str
+    full_retranslation: bool = False
+
+@dataclass
+class TextEdit:
+    """Replace `deleted` characters at `offset` of the source text with `inserted`"""
+    offset: int
+    deleted: int = 0
+    inserted: str = ''
+    
+    _INT_FIELDS = ('offset', 'deleted')
+    _STRING_FIELDS = ('inserted',)
+    
+    @classmethod
+    def from_dict(cls, data: Any) -> "TextEdit":
+        """Build an edit from JSON data, raising ValueError for mistyped fields"""
+        if not isinstance(data, dict):
+            raise ValueError("'edit' must be an object")
+        values = {}
+        for name in cls._INT_FIELDS:
+            value = data.get(name)
+            if value is not None:
+                # bool is a subclass of int, but true is not a count
+                if not isinstance(value, int) or isinstance(value, bool):
+                    raise ValueError(f"'{name}' must be an integer")
+                values[name] = value
+        for name in cls._STRING_FIELDS:
+            value = data.get(name)
+            if value is not None:
+                if not isinstance(value, str):
+                    raise ValueError(f"'{name}' must be a string")
+                values[name] = value
+        if 'offset' not in values:
+            raise ValueError("'edit' must have an 'offset'")
+        return cls(**values)
+
+class TableRegistry:
+    """Compiled translation tables, built on first use and kept in a bounded LRU
+    
+    Nothing is compiled up front, so unused languages cost nothing; once a
+    table is warm, lookups do no construction on the request path.
+    """
+    
+    def __init__(self, build: Callable[[str, str], TranslationTable], max_tables: int = MAX_COMPILED_TABLES):
+        self._build = build
+        self.max_tables = max_tables
+        self._tables: "OrderedDict[Tuple[str, str], TranslationTable]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.evictions = 0
+    
+    def get(self, standard: str, language: str) -> TranslationTable:
+        """Return the compiled table for a standard and language"""
+        key = (standard, language)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                return table
+        
+        # Compile outside the lock; a concurrent duplicate build is harmless
+        table = self._build(standard, language)
+        with self._lock:
+            self.builds += 1
+            self._tables[key] = table
+            while len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+                self.evictions += 1
+        return table
+    
+    def stats(self) -> Dict:
+        """Counters for monitoring"""
+        return {
+            "compiled": [f"{standard}/{language}" for standard, language in self._tables],
+            "word_memo": {f"{standard}/{language}": table.memo.stats()
+                          for (standard, language), table in list(self._tables.items())
+                          if table.memo is not None},
+            "max_tables": self.max_tables,
+            "builds": self.builds,
+            "evictions": self.evictions
+        }
+
+class TranslationCache:
+    """Thread-safe LRU cache bounded by approximate size in bytes, with optional TTL"""
+    
+    ENTRY_OVERHEAD = 200  # Approximate bytes for the key tuple, node and timestamps
+    
+    def __init__(self, max_bytes: int, ttl: float = 0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[object, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Tuple):
+        """Return the cached value for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl and time.monotonic() - entry[2] > self.ttl:
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key: Tuple, value, size: int):
+        """Store value under key, evicting least recently used entries to fit"""
+        size += self.ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic())
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+    
+    def _remove(self, key: Tuple):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+    
+    def clear(self) -> int:
+        """Drop every entry, returning how many were removed"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self.current_bytes = 0
+            return count
+    
+    def stats(self) -> Dict:
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0
+        }
+
+class DiskTranslationCache:
+    """SQLite (WAL mode) translation cache shared by the worker processes on a host
+    
+    Entries are keyed by a SHA-256 of the request key and evicted least
+    recently used first once the stored size exceeds max_bytes. Hits only
+    read the database; their hit counts and access times are buffered and
+    written in one transaction every ACCESS_FLUSH_BATCH hits or
+    ACCESS_FLUSH_SECONDS. Database errors are logged and treated as misses
+    so the cache never fails a request.
+    """
+    
+    EVICTION_BATCH = 64
+    ACCESS_FLUSH_BATCH = 64
+    ACCESS_FLUSH_SECONDS = 1.0
+    
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        # Buffered hits: key hash -> [hit count, last access time]
+        self._accesses: Dict[bytes, List] = {}
+        self._buffered_hits = 0
+        self._accesses_lock = threading.Lock()
+        self._accesses_flushed = time.monotonic()
+        self._connection().executescript('''
+            CREATE TABLE IF NOT EXISTS entries (
+                key_hash BLOB PRIMARY KEY,
+                request TEXT NOT NULL,
+                result TEXT NOT NULL,
+                cells INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+            CREATE INDEX IF NOT EXISTS entries_hits ON entries (hits);
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            INSERT OR IGNORE INTO meta VALUES ('total_bytes', 0);
+            INSERT OR IGNORE INTO meta SELECT 'entries', COUNT(*) FROM entries;
+        ''')
+    
+    @contextmanager
+    def _transaction(self):
+        """Write transaction that takes the database lock up front"""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+    
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets readers and a writer run concurrently"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+    
+    @staticmethod
+    def key_hash(key: Tuple) -> bytes:
+        """Content hash of a request key"""
+        return hashlib.sha256(json.dumps(key, ensure_ascii=False).encode('utf-8')).digest()
+    
+    def get(self, key: Tuple) -> Optional[Tuple[str, int]]:
+        """Return (result, braille_cell_count) for key, or None on a miss"""
+        digest = self.key_hash(key)
+        try:
+            row = self._connection().execute('SELECT result, cells FROM entries WHERE key_hash = ?',
+                                             (digest,)).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._record_access(digest)
+        return row[0], row[1]
+    
+    def _record_access(self, digest: bytes):
+        now = time.monotonic()
+        with self._accesses_lock:
+            access = self._accesses.setdefault(digest, [0, 0.0])
+            access[0] += 1
+            access[1] = time.time()
+            self._buffered_hits += 1
+            due = (self._buffered_hits >= self.ACCESS_FLUSH_BATCH
+                   or now - self._accesses_flushed >= self.ACCESS_FLUSH_SECONDS)
+        if due:
+            self.flush_accesses()
+    
+    def flush_accesses(self):
+        """Write buffered hit counts and access times in one transaction"""
+        with self._accesses_lock:
+            accesses, self._accesses = self._accesses, {}
+            self._buffered_hits = 0
+            self._accesses_flushed = time.monotonic()
+        if not accesses:
+            return
+        try:
+            with self._transaction() as conn:
+                conn.executemany('UPDATE entries SET hits = hits + ?, last_access = MAX(last_access, ?) '
+                                 'WHERE key_hash = ?',
+                                 [(hits, last_access, digest) for digest, (hits, last_access) in accesses.items()])
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk cache access update failed: {e}")
+    
+    def put(self, key: Tuple, value: Tuple[str, int]):
+        """Store a translation, evicting least recently used entries to fit"""
+        request_json = json.dumps(key, ensure_ascii=False)
+        result, cells = value
+        size = len(request_json.encode('utf-8')) + len(result.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        digest = self.key_hash(key)
+        try:
+            with self._transaction() as conn:
+                old = conn.execute('SELECT size FROM entries WHERE key_hash = ?', (digest,)).fetchone()
+                conn.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, 0, ?)',
+                             (digest, request_json, result, cells, size, time.time()))
+                conn.execute("UPDATE meta SET value = value + ? WHERE name = 'total_bytes'",
+                             (size - (old[0] if old else 0),))
+                if old is None:
+                    conn.execute("UPDATE meta SET value = value + 1 WHERE name = 'entries'")
+                self._evict(conn)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk cache write failed: {e}")
+    
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+        evicted = 0
+        while total > self.max_bytes:
+            victims = conn.execute('SELECT key_hash, size FROM entries ORDER BY last_access LIMIT ?',
+                                   (self.EVICTION_BATCH,)).fetchall()
+            if not victims:
+                break
+            for digest, size in victims:
+                if total <= self.max_bytes:
+                    break
+                conn.execute('DELETE FROM entries WHERE key_hash = ?', (digest,))
+                total -= size
+                evicted += 1
+        self.evictions += evicted
+        conn.execute("UPDATE meta SET value = ? WHERE name = 'total_bytes'", (total,))
+        if evicted:
+            conn.execute("UPDATE meta SET value = value - ? WHERE name = 'entries'", (evicted,))
+    
+    def hottest(self, limit: int) -> List[Tuple[Tuple, Tuple[str, int]]]:
+        """The most frequently hit entries, for warming an in-memory cache"""
+        self.flush_accesses()
+        try:
+            rows = self._connection().execute(
+                'SELECT request, result, cells FROM entries ORDER BY hits DESC LIMIT ?', (limit,)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache warm-up failed: {e}")
+            return []
+        return [(tuple(json.loads(request_json)), (result, cells)) for request_json, result, cells in rows]
+    
+    def clear(self) -> int:
+        """Drop every entry, returning how many were removed"""
+        with self._transaction() as conn:
+            count = conn.execute('DELETE FROM entries').rowcount
+            conn.execute("UPDATE meta SET value = 0 WHERE name IN ('total_bytes', 'entries')")
+        return count
+    
+    def stats(self) -> Dict:
+        """Counters for monitoring (hits and misses are for this process)"""
+        try:
+            meta = dict(self._connection().execute(
+                "SELECT name, value FROM meta WHERE name IN ('entries', 'total_bytes')").fetchall())
+        except sqlite3.Error:
+            meta = {}
+        entries, total = meta.get('entries'), meta.get('total_bytes')
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0
+        }
+
+class TranslationBackend:
+    """A translation engine with a circuit breaker and latency/failure counters"""
+    
+    def __init__(self, name: str,
+                 encode: Callable[[str, str, str], str],
+                 decode: Optional[Callable[[str, str, str], str]] = None,
+                 standards: Optional[Iterable[str]] = None,
+                 languages: Optional[Iterable[str]] = None):
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+        self.standards = set(standards) if standards is not None else None
+        self.languages = set(languages) if languages is not None else None
+        self.verified: set = set()  # (standard, reverse) pairs that passed the probe
+        self.calibrated_ms: Optional[float] = None
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+    
+    def supports(self, standard: str, language: str, reverse: bool) -> bool:
+        """Whether this backend can handle the request at all"""
+        return ((self.standards is None or standard in self.standards)
+                and (self.languages is None or language in self.languages)
+                and (self.decode is not None or not reverse))
+    
+    def available(self, now: float) -> bool:
+        """False while the circuit is open; after the cooldown one trial call is let through"""
+        with self._lock:
+            if self.open_until == 0.0:
+                return True
+            if now >= self.open_until:
+                self.open_until = now + BACKEND_COOLDOWN_SECONDS  # Half-open: hold off others
+                return True
+            return False
+    
+    def run(self, text: str, standard: str, language: str, reverse: bool) -> str:
+        """Translate, recording latency and tripping the breaker on repeated failures"""
+        started = time.perf_counter()
+        try:
+            convert = self.decode if reverse else self.encode
+            result = convert(text, standard, language)
+        except Exception:
+            with self._lock:
+                self.calls += 1
+                self.failures += 1
+                self.consecutive_failures += 1
+                if self.consecutive_failures >= BACKEND_FAILURE_THRESHOLD:
+                    self.open_until = time.time() + BACKEND_COOLDOWN_SECONDS
+            raise
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += time.perf_counter() - started
+            self.consecutive_failures = 0
+            self.open_until = 0.0
+        return result
+    
+    def stats(self) -> Dict:
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "failures": self.failures,
+                "avg_latency_ms": round(self.total_seconds / (self.calls - self.failures) * 1000, 3)
+                                  if self.calls > self.failures else 0,
+                "calibrated_ms": self.calibrated_ms,
+                "circuit": "open" if self.open_until > time.time() else "closed",
+                "verified": sorted(f"{standard}{'/reverse' if reverse else ''}"
+                                   for standard, reverse in self.verified)
+            }
+
+class BackendRegistry:
+    """Routes each request to the fastest verified backend whose circuit is closed
+    
+    At startup every backend is checked against known-good translations and
+    timed on a short calibration text. Backends that fail the probe are never
+    routed to. The built-in engine is the fallback: it is used whenever no
+    faster backend is usable, and backends ranked after it are never tried.
+    """
+    
+    # (standard, reverse) -> (input, expected output)
+    PROBES = {
+        (BrailleStandard.GRADE_1.value, False): ("hello", "⠓⠑⠇⠇⠕"),
+        (BrailleStandard.GRADE_1.value, True): ("⠓⠑⠇⠇⠕", "hello"),
+        (BrailleStandard.GRADE_2.value, False): ("the", "⠮"),
+        (BrailleStandard.GRADE_2.value, True): ("⠮", "the"),
+    }
+    CALIBRATION_TEXT = "the quick brown fox jumps over the lazy dog " * 20
+    
+    def __init__(self, backends: List[TranslationBackend]):
+        self.backends = backends
+        self.fallback = backends[-1]
+    
+    def calibrate(self, repeat: int = 3):
+        """Probe each backend for correctness, then time it on the calibration text"""
+        for backend in self.backends:
+            for (standard, reverse), (source, expected) in self.PROBES.items():
+                if not backend.supports(standard, BrailleLanguage.ENGLISH.value, reverse):
+                    continue
+                try:
+                    convert = backend.decode if reverse else backend.encode
+                    if convert(source, standard, BrailleLanguage.ENGLISH.value) == expected:
+                        backend.verified.add((standard, reverse))
+                except Exception as e:
+                    logger.info(f"Backend {backend.name} failed probe {standard}: {e}")
+            if (BrailleStandard.GRADE_1.value, False) not in backend.verified:
+                continue
+            best = float('inf')
+            for _ in range(repeat):
+                started = time.perf_counter()
+                try:
+                    backend.encode(self.CALIBRATION_TEXT, BrailleStandard.GRADE_1.value,
+                                   BrailleLanguage.ENGLISH.value)
+                except Exception:
+                    break
+                best = min(best, time.perf_counter() - started)
+            backend.calibrated_ms = round(best * 1000, 3) if best != float('inf') else None
+        
+        # Fastest first; unverified backends sink to the end
+        self.backends.sort(key=lambda b: b.calibrated_ms if b.calibrated_ms is not None else float('inf'))
+        logger.info("Backend order: " + ", ".join(
+            f"{b.name} ({b.calibrated_ms} ms)" for b in self.backends))
+    
+    def translate(self, text: str, standard: str, language: str, reverse: bool) -> Tuple[str, str]:
+        """Translate with the preferred backend, returning (result, backend name)"""
+        now = time.time()
+        for backend in self.backends:
+            if backend is self.fallback:
+                break
+            if ((standard, reverse) not in backend.verified
+                    or not backend.supports(standard, language, reverse)
+                    or not backend.available(now)):
+                continue
+            try:
+                return backend.run(text, standard, language, reverse), backend.name
+            except Exception as e:
+                logger.warning(f"Backend {backend.name} failed, trying next: {e}")
+                metrics.inc('braille_backend_fallbacks_total', backend=backend.name)
+        return self.fallback.run(text, standard, language, reverse), self.fallback.name
+    
+    def stats(self) -> Dict:
+        """Per-backend counters, in routing order"""
+        return {backend.name: backend.stats() for backend in self.backends}
 
 class BrailleTranslator:
     """Advanced Braille translation engine"""
     
-    def __init__(self):
+    def __init__(self, cache_max_bytes: int = CACHE_MAX_BYTES, cache_ttl: float = CACHE_TTL_SECONDS,
+                 disk_cache_path: Optional[str] = DISK_CACHE_PATH,
+                 disk_cache_max_bytes: int = DISK_CACHE_MAX_BYTES,
+                 disk_cache_warm_entries: int = DISK_CACHE_WARM_ENTRIES,
+                 offload_workers: int = OFFLOAD_WORKERS,
+                 offload_threshold: int = OFFLOAD_THRESHOLD):
         self.supported_standards = [standard.value for standard in BrailleStandard]
         self.supported_languages = [lang.value for lang in BrailleLanguage]
         
@@ -112,6 +1312,55 @@ class BrailleTranslator:
             'ar': '⠜', 'gh': '⠣', 'ea': '⠂', 'bb': '⠆', 'cc': '⠒',
             'dd': '⠲', 'ff': '⠖', 'gg': '⠶'
         }
+        
+        # Word positions where Grade 2 contractions are allowed (default: anywhere)
+        self.grade2_contexts = {
+            'ing': ContractionContext.NOT_INITIAL,
+            'ea': ContractionContext.MEDIAL, 'bb': ContractionContext.MEDIAL,
+            'cc': ContractionContext.MEDIAL, 'dd': ContractionContext.MEDIAL,
+            'ff': ContractionContext.MEDIAL, 'gg': ContractionContext.MEDIAL
+        }
+        
+        # Contraction tables by language; other languages use Grade 1 for Grade 2
+        self.contractions_by_language = {BrailleLanguage.ENGLISH.value: self.grade2_contractions}
+        
+        # Compiled tables, built lazily per (standard, language)
+        self.tables = TableRegistry(self._build_table)
+        
+        # Translation engines, probed and ranked at startup
+        self.backends = self._build_backends()
+        self.backends.calibrate()
+        
+        # Whole-request result caches: in-process, then optionally shared on disk
+        self.cache = TranslationCache(cache_max_bytes, cache_ttl) if cache_max_bytes > 0 else None
+        self.disk_cache = None
+        if disk_cache_path:
+            try:
+                self.disk_cache = DiskTranslationCache(disk_cache_path, disk_cache_max_bytes)
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache disabled, could not open {disk_cache_path}: {e}")
+        if self.cache is not None and self.disk_cache is not None and disk_cache_warm_entries > 0:
+            warm = self.disk_cache.hottest(disk_cache_warm_entries)
+            for key, value in warm:
+                self.cache.put(key, value, sys.getsizeof(key[0]) + sys.getsizeof(value[0]))
+            logger.info(f"Warmed translation cache with {len(warm)} entries from {disk_cache_path}")
+        
+        # Large requests go to a process pool so they do not hold the GIL
+        self.offload_threshold = offload_threshold
+        self.offload = TranslationOffloader(offload_workers) if offload_workers > 0 else None
+    
+    def _build_table(self, standard: str, language: str) -> TranslationTable:
+        """Compile the translation table for a standard and language"""
+        char_map = {**self.grade1_map, **LANGUAGE_LETTERS.get(language, {})}
+        contractions = None
+        if standard == BrailleStandard.GRADE_2.value:
+            contractions = self.contractions_by_language.get(language)
+        memo = WordMemo() if contractions and WORD_MEMO_ENTRIES > 0 else None
+        return TranslationTable(standard, language, char_map, contractions, self.grade2_contexts, memo)
+    
+    def get_table(self, standard: str, language: str = BrailleLanguage.ENGLISH.value) -> TranslationTable:
+        """Return the compiled translation table for a standard and language"""
+        return self.tables.get(standard, language)
     
     def validate_request(self, req: BrailleTranslationRequest) -> Tuple[bool, Optional[str]]:
         """Validate translation request"""
@@ -129,115 +1378,304 @@ class BrailleTranslator:
         
         return True, None
     
-    def text_to_braille_basic(self, text: str, standard: str) -> str:
+    def text_to_braille_basic(self, text: str, standard: str,
+                              language: str = BrailleLanguage.ENGLISH.value) -> str:
         """Basic text-to-Braille conversion (fallback implementation)"""
-        text = text.lower().strip()
-        result = []
+        return self.get_table(standard, language).encode(text.lower().strip())
+    
+    @staticmethod
+    def _diff_patch(old: str, new: str, full_retranslation: bool = False) -> BraillePatch:
+        """Smallest single-range patch turning old into new"""
+        # Binary search on slice equality keeps the comparisons in C
+        low, high = 0, min(len(old), len(new))
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old[:mid] == new[:mid]:
+                low = mid
+            else:
+                high = mid - 1
+        prefix = low
+        low, high = 0, min(len(old), len(new)) - prefix
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old[len(old) - mid:] == new[len(new) - mid:]:
+                low = mid
+            else:
+                high = mid - 1
+        suffix = low
+        return BraillePatch(prefix, len(old) - prefix - suffix,
+                            new[prefix:len(new) - suffix], full_retranslation)
+    
+    @staticmethod
+    def _nth_blank(braille: str, count: int, from_end: bool) -> int:
+        """Offset just after the count-th blank cell from the start, or of the
+        count-th blank cell from the end; -1 if there are fewer blanks"""
+        blank = TranslationTable.BLANK_CELL
+        if from_end:
+            parts = braille.rsplit(blank, count)
+            return len(parts[0]) if len(parts) == count + 1 else -1
+        parts = braille.split(blank, count)
+        return len(braille) - len(parts[-1]) if len(parts) == count + 1 else -1
+    
+    def translate_edit(self, text: str, braille: str, offset: int, deleted: int, inserted: str,
+                       standard: str = BrailleStandard.GRADE_1.value,
+                       language: str = BrailleLanguage.ENGLISH.value) -> BraillePatch:
+        """Patch a previous translation after an edit to its source text
         
-        if standard == BrailleStandard.GRADE_2.value:
-            # Apply Grade 2 contractions first
-            for contraction, braille in self.grade2_contractions.items():
-                text = text.replace(contraction, f"[{braille}]")
-        
-        # Convert character by character
-        i = 0
-        while i < len(text):
-            # Handle contractions marked with brackets
-            if text[i] == '[':
-                end_bracket = text.find(']', i)
-                if end_bracket != -1:
-                    braille_char = text[i+1:end_bracket]
-                    result.append(braille_char)
-                    i = end_bracket + 1
-                    continue
+        `braille` must be the unformatted output of text_to_braille_basic for
+        `text`. Only the words touched by the edit are retranslated: no
+        contraction or number run spans whitespace, so words translate
+        independently, and the Braille offset of a word boundary is found by
+        counting blank cells on whichever side of the edit is shorter. When
+        that does not hold (a table with blanks inside multi-cell entries, or
+        Braille that does not match the text) the whole text is retranslated
+        and the patch is trimmed to what changed.
+        """
+        if offset < 0 or deleted < 0 or offset + deleted > len(text):
+            raise ValueError("Edit range is outside the text")
+        table = self.get_table(standard, language)
+        new_text = text[:offset] + inserted + text[offset + deleted:]
+        
+        if table.blank_countable:
+            # Non-whitespace spans; the translation covers these only
+            shift = len(inserted) - deleted
+            old_first = len(text) - len(text.lstrip())
+            old_last = len(text.rstrip())
+            new_first = len(new_text) - len(new_text.lstrip())
+            new_last = len(new_text.rstrip())
+            
+            # Word-aligned window around the edit in the new text. A window
+            # edge in trailing (or leading) whitespace moves to the nearest
+            # word, since stripping makes that whitespace appear or vanish.
+            start = min(offset, old_last, new_last)
+            while start > 0 and not new_text[start - 1].isspace():
+                start -= 1
+            end = offset + len(inserted)
+            if old_first >= offset + deleted:
+                end = max(end, old_first + shift)
+            end = max(end, new_first)
+            while end < len(new_text) and not new_text[end].isspace():
+                end += 1
+            old_end = end - shift
             
-            # Regular character mapping
-            char = text[i]
-            if char in self.grade1_map:
-                result.append(self.grade1_map[char])
+            # Braille offset of the window in the previous translation
+            if start <= old_first:
+                braille_start = 0
+            elif start - old_first <= old_last - start:
+                braille_start = self._nth_blank(
+                    braille, table.count_blanks(text[old_first:start].lower()), from_end=False)
             else:
-                # Handle numbers (add number sign ⠼)
-                if char.isdigit():
-                    if not result or result[-1] != '⠼':
-                        result.append('⠼')  # Number sign
-                    # Map digits to letters a-j
-                    digit_map = {'1': '⠁', '2': '⠃', '3': '⠉', '4': '⠙', '5': '⠑',
-                               '6': '⠋', '7': '⠛', '8': '⠓', '9': '⠊', '0': '⠚'}
-                    result.append(digit_map.get(char, '⠀'))
-                else:
-                    # Unknown character, use space
-                    result.append('⠀')
-            i += 1
+                braille_start = self._nth_blank(
+                    braille, table.count_blanks(text[start:old_last].lower()) + 1, from_end=True) + 1
+            
+            old_window = table.encode(text[max(start, old_first):min(old_end, old_last)].lower())
+            braille_end = braille_start + len(old_window)
+            if (braille_start >= 0 and braille[braille_start:braille_end] == old_window
+                    and (old_end < old_last or braille_end == len(braille))):
+                new_window = table.encode(new_text[max(start, new_first):min(end, new_last)].lower())
+                patch = self._diff_patch(old_window, new_window)
+                patch.offset += braille_start
+                return patch
         
-        return ''.join(result)
+        return self._diff_patch(braille, self.text_to_braille_basic(new_text, standard, language),
+                                full_retranslation=True)
     
-    def braille_to_text_basic(self, braille: str, standard: str) -> str:
+    def braille_to_text_basic(self, braille: str, standard: str,
+                              language: str = BrailleLanguage.ENGLISH.value) -> str:
         """Basic Braille-to-text conversion (fallback implementation)"""
-        result = []
-        i = 0
-        number_mode = False
+        return self.get_table(standard, language).decode(braille)
+    
+    def _build_backends(self) -> BackendRegistry:
+        """Register the available translation engines, built-in engine last"""
+        english = [BrailleLanguage.ENGLISH.value]
+        grades = [BrailleStandard.GRADE_1.value, BrailleStandard.GRADE_2.value]
+        backends = []
+        if PYBRAILLE_AVAILABLE:
+            backends.append(TranslationBackend(
+                "pybraille",
+                encode=lambda text, standard, language: pybraille.to_braille(
+                    text, grade=2 if standard == BrailleStandard.GRADE_2.value else 1),
+                decode=lambda text, standard, language: pybraille.to_text(text),
+                standards=grades, languages=english))
+        if BRAILLE_PACKAGE_AVAILABLE:
+            backends.append(TranslationBackend(
+                "braille",
+                encode=lambda text, standard, language: braille_package.encode(text),
+                decode=lambda text, standard, language: braille_package.decode(text),
+                standards=[BrailleStandard.GRADE_1.value], languages=english))
+        backends.append(TranslationBackend(
+            "basic", encode=self.text_to_braille_basic, decode=self.braille_to_text_basic))
+        return BackendRegistry(backends)
+    
+    # Reversed-text patterns for the tail that must wait for the next chunk:
+    # the last word plus the whitespace before it (forward), or the last
+    # run of non-blank cells (reverse)
+    _TEXT_TAIL_RE = re.compile(r'\S*\s*')
+    _BRAILLE_TAIL_RE = re.compile(r'[^\s⠀]*')
+    
+    def translate_stream(self, chunks: Iterable[str],
+                         standard: str = BrailleStandard.GRADE_1.value,
+                         language: str = BrailleLanguage.ENGLISH.value,
+                         reverse: bool = False,
+                         format_output: bool = False) -> Iterator[str]:
+        """Translate an iterable of text chunks, yielding Braille incrementally
         
-        while i < len(braille):
-            char = braille[i]
-            
-            # Handle number sign
-            if char == '⠼':
-                number_mode = True
-                i += 1
+        Text is only cut at word boundaries, so contractions and number signs
+        come out exactly as for a single translate call on the whole input.
+        Memory is bounded by the chunk size plus the longest word (or
+        STREAM_MAX_PENDING, after which a word is flushed regardless).
+        """
+        table = self.get_table(standard, language)
+        convert = table.decode if reverse else table.encode
+        tail_re = self._BRAILLE_TAIL_RE if reverse else self._TEXT_TAIL_RE
+        spaced = format_output and not reverse
+        pending = ''
+        emitted = False
+        
+        for chunk in chunks:
+            if not chunk:
                 continue
+            pending += chunk if reverse else chunk.lower()
+            if not reverse and not emitted:
+                pending = pending.lstrip()  # Leading whitespace is stripped
             
-            if number_mode and char in '⠁⠃⠉⠙⠑⠋⠛⠓⠊⠚':
-                # Convert Braille digits back to numbers
-                digit_map = {'⠁': '1', '⠃': '2', '⠉': '3', '⠙': '4', '⠑': '5',
-                           '⠋': '6', '⠛': '7', '⠓': '8', '⠊': '9', '⠚': '0'}
-                result.append(digit_map[char])
-                # Continue in number mode until space or punctuation
-                if i + 1 < len(braille) and braille[i + 1] in '⠀⠂⠲⠦⠖':
-                    number_mode = False
-            else:
-                number_mode = False
-                if char in self.reverse_grade1_map:
-                    result.append(self.reverse_grade1_map[char])
-                else:
-                    # Check Grade 2 contractions
-                    if standard == BrailleStandard.GRADE_2.value:
-                        for word, braille_word in self.grade2_contractions.items():
-                            if braille.startswith(braille_word, i):
-                                result.append(word)
-                                i += len(braille_word) - 1
-                                break
-                        else:
-                            result.append('?')  # Unknown character
-                    else:
-                        result.append('?')  # Unknown character
-            i += 1
-        
-        return ''.join(result)
-    
-    def translate_with_pybraille(self, text: str, standard: str, reverse: bool = False) -> str:
-        """Use pybraille library for translation (if available)"""
-        if not PYBRAILLE_AVAILABLE:
-            return self.text_to_braille_basic(text, standard) if not reverse else self.braille_to_text_basic(text, standard)
+            cut = len(pending) - tail_re.match(pending[::-1]).end()
+            if cut == 0:
+                if len(pending) <= STREAM_MAX_PENDING:
+                    continue
+                cut = len(pending)
+            
+            piece, pending = pending[:cut], pending[cut:]
+            braille = convert(piece)
+            if spaced:
+                braille = (' ' if emitted else '') + ' '.join(braille)
+            emitted = True
+            yield braille
         
-        try:
-            if reverse:
-                # Braille to text
-                return pybraille.to_text(text)
-            else:
-                # Text to Braille
-                if standard == BrailleStandard.GRADE_2.value:
-                    return pybraille.to_braille(text, grade=2)
-                else:
-                    return pybraille.to_braille(text, grade=1)
-        except Exception as e:
-            logger.warning(f"pybraille failed, using fallback: {e}")
-            return self.text_to_braille_basic(text, standard) if not reverse else self.braille_to_text_basic(text, standard)
+        if not reverse:
+            pending = pending.rstrip() if emitted else pending.strip()
+        if pending:
+            braille = convert(pending)
+            if spaced:
+                braille = (' ' if emitted else '') + ' '.join(braille)
+            yield braille
+    
+    def translate_batch(self, reqs: List[BrailleTranslationRequest]) -> List[BrailleTranslationResponse]:
+        """Translate several requests, compiling each table once for the whole batch
+        
+        An offload timeout fails only its own item, so the rest of the batch
+        is still returned.
+        """
+        for key in {(req.standard, req.language) for req in reqs}:
+            if key[0] in self.supported_standards and key[1] in self.supported_languages:
+                self.get_table(*key)
+        responses = []
+        for req in reqs:
+            try:
+                responses.append(self.translate(req))
+            except OffloadTimeout as e:
+                responses.append(BrailleTranslationResponse(
+                    success=False,
+                    result="",
+                    original_text=req.text,
+                    standard_used=req.standard,
+                    language=req.language,
+                    character_count=0,
+                    braille_cell_count=0,
+                    error=f"{e}, retry later"
+                ))
+        return responses
+    
+    # Post-processing tables over the 6-dot cell range U+2800-U+283F
+    _CELL_SPACED = {cp: chr(cp) + ' ' for cp in range(0x2800, 0x2840)}
+    _CELL_DROPPED = dict.fromkeys(range(0x2800, 0x2840))
+    
+    @classmethod
+    def postprocess(cls, result: str, format_output: bool) -> Tuple[str, int]:
+        """Format the output and count its cells in one table-driven pass
+        
+        Each cell maps to itself plus a space (or to nothing when not
+        formatting), so the cell count falls out of the length difference.
+        """
+        if format_output:
+            spaced = result.translate(cls._CELL_SPACED)
+            return spaced.strip(), len(spaced) - len(result)
+        return result, len(result) - len(result.translate(cls._CELL_DROPPED))
+    
+    def _build_response(self, req: BrailleTranslationRequest, result: str,
+                        braille_cell_count: int, cached: bool = False,
+                        timings: Optional[Dict[str, float]] = None,
+                        method: str = "cache") -> BrailleTranslationResponse:
+        """Build a successful response, with metadata if requested"""
+        char_count = len(req.text)
+        
+        # Prepare metadata
+        metadata = None
+        if req.include_metadata:
+            metadata = {
+                "translation_method": method,
+                "contractions_used": (req.standard == BrailleStandard.GRADE_2.value
+                                      and req.language in self.contractions_by_language),
+                "unicode_range": "U+2800-U+283F",
+                "compression_ratio": round(braille_cell_count / char_count, 2) if char_count > 0 else 0,
+                "cached": cached,
+                "timing_ms": {stage: round(seconds * 1000, 3) for stage, seconds in (timings or {}).items()},
+                "supported_features": [
+                    "Grade 1 Braille",
+                    "Grade 2 Braille" if req.standard == BrailleStandard.GRADE_2.value else None,
+                    "Numbers",
+                    "Basic punctuation"
+                ]
+            }
+        
+        return BrailleTranslationResponse(
+            success=True,
+            result=result,
+            original_text=req.text,
+            standard_used=req.standard,
+            language=req.language,
+            character_count=char_count,
+            braille_cell_count=braille_cell_count,
+            metadata=metadata
+        )
     
-    def translate(self, req: BrailleTranslationRequest) -> BrailleTranslationResponse:
-        """Main translation method"""
+    def translate(self, req: BrailleTranslationRequest,
+                  timings: Optional[Dict[str, float]] = None,
+                  bypass_cache: bool = False) -> BrailleTranslationResponse:
+        """Main translation method (stage durations in seconds are added to timings)
+        
+        With bypass_cache the result caches are not consulted, so the full
+        translation path runs; the result is still stored.
+        """
+        timings = {} if timings is None else timings
+        started = time.perf_counter()
+        
+        # Only valid requests are cached, so a hit can skip validation
+        cache_key = (req.text, req.standard, req.language, req.reverse, req.format_output)
+        cached = None
+        if self.cache is not None and not bypass_cache:
+            cached = self.cache.get(cache_key)
+            metrics.inc('braille_cache_lookups_total', tier='memory', result='miss' if cached is None else 'hit')
+        if cached is None and self.disk_cache is not None and not bypass_cache:
+            cached = self.disk_cache.get(cache_key)
+            metrics.inc('braille_cache_lookups_total', tier='disk', result='miss' if cached is None else 'hit')
+            if cached is not None and self.cache is not None:
+                self.cache.put(cache_key, cached, sys.getsizeof(req.text) + sys.getsizeof(cached[0]))
+        if not bypass_cache:
+            timings["cache_lookup"] = time.perf_counter() - started
+        if cached is not None:
+            result, braille_cell_count = cached
+            started = time.perf_counter()
+            response = self._build_response(req, result, braille_cell_count, cached=True, timings=timings)
+            timings["metrics"] = time.perf_counter() - started
+            return response
+        
         # Validate request
+        started = time.perf_counter()
         is_valid, error_msg = self.validate_request(req)
+        timings["validate"] = time.perf_counter() - started
         if not is_valid:
+            metrics.inc('braille_translation_errors_total', reason='invalid')
             return BrailleTranslationResponse(
                 success=False,
                 result="",
@@ -251,58 +1689,47 @@ class BrailleTranslator:
         
         try:
             # Perform translation
-            if PYBRAILLE_AVAILABLE:
-                result = self.translate_with_pybraille(req.text, req.standard, req.reverse)
-            else:
-                if req.reverse:
-                    result = self.braille_to_text_basic(req.text, req.standard)
-                else:
-                    result = self.text_to_braille_basic(req.text, req.standard)
-            
-            # Format output if requested
-            if req.format_output and not req.reverse:
-                # Add spaces between Braille cells for readability
-                formatted_result = []
-                for char in result:
-                    if ord(char) >= 0x2800 and ord(char) <= 0x283F:  # Braille Unicode range
-                        formatted_result.append(char + ' ')
-                    else:
-                        formatted_result.append(char)
-                result = ''.join(formatted_result).strip()
+            started = time.perf_counter()
+            result = None
+            if self.offload is not None and len(req.text) >= self.offload_threshold:
+                try:
+                    result, method = self.offload.translate(req.text, req.standard, req.language, req.reverse)
+                except BrokenProcessPool as e:
+                    logger.warning(f"Offload pool failed, translating inline: {e}")
+            if result is None:
+                result, method = self.backends.translate(req.text, req.standard, req.language, req.reverse)
+            timings["translate"] = time.perf_counter() - started
             
-            # Calculate metrics
-            char_count = len(req.text)
-            braille_cell_count = len([c for c in result if ord(c) >= 0x2800 and ord(c) <= 0x283F])
+            # Format output if requested and count cells
+            started = time.perf_counter()
+            result, braille_cell_count = self.postprocess(result, req.format_output and not req.reverse)
+            timings["postprocess"] = time.perf_counter() - started
             
-            # Prepare metadata
-            metadata = None
-            if req.include_metadata:
-                metadata = {
-                    "translation_method": "pybraille" if PYBRAILLE_AVAILABLE else "basic",
-                    "contractions_used": req.standard == BrailleStandard.GRADE_2.value,
-                    "unicode_range": "U+2800-U+283F",
-                    "compression_ratio": round(braille_cell_count / char_count, 2) if char_count > 0 else 0,
-                    "supported_features": [
-                        "Grade 1 Braille",
-                        "Grade 2 Braille" if req.standard == BrailleStandard.GRADE_2.value else None,
-                        "Numbers",
-                        "Basic punctuation"
-                    ]
-                }
-            
-            return BrailleTranslationResponse(
-                success=True,
-                result=result,
-                original_text=req.text,
-                standard_used=req.standard,
-                language=req.language,
-                character_count=char_count,
-                braille_cell_count=braille_cell_count,
-                metadata=metadata
-            )
+            started = time.perf_counter()
+            if self.cache is not None:
+                self.cache.put(cache_key, (result, braille_cell_count),
+                               sys.getsizeof(req.text) + sys.getsizeof(result))
+            if self.disk_cache is not None:
+                self.disk_cache.put(cache_key, (result, braille_cell_count))
+            timings["cache_store"] = time.perf_counter() - started
             
+            started = time.perf_counter()
+            direction = 'decode' if req.reverse else 'encode'
+            metrics.inc('braille_characters_translated_total', len(req.text),
+                        standard=req.standard, direction=direction)
+            metrics.inc('braille_cells_emitted_total', braille_cell_count,
+                        standard=req.standard, direction=direction)
+            response = self._build_response(req, result, braille_cell_count, timings=timings, method=method)
+            timings["metrics"] = time.perf_counter() - started
+            return response
+        
+        except OffloadTimeout:
+            # A server-side failure, not a bad request; callers map it to 503
+            metrics.inc('braille_translation_errors_total', reason='timeout')
+            raise
         except Exception as e:
             logger.error(f"Translation error: {e}")
+            metrics.inc('braille_translation_errors_total', reason='exception')
             return BrailleTranslationResponse(
                 success=False,
                 result="",
@@ -314,6 +1741,113 @@ class BrailleTranslator:
                 error=f"Translation failed: {str(e)}"
             )
 
+def _init_offload_worker():
+    """Warm the worker's translator once per worker process
+    
+    Importing braille_api in the worker already built the module-level
+    translator, so it is reused; workers only run its backends, so its
+    result caches and offload pool are dropped.
+    """
+    translator.cache = None
+    translator.disk_cache = None
+    translator.offload = None
+    for standard in (BrailleStandard.GRADE_1.value, BrailleStandard.GRADE_2.value):
+        translator.get_table(standard)
+
+def _offloaded_translate(text: str, standard: str, language: str, reverse: bool) -> Tuple[str, str]:
+    return translator.backends.translate(text, standard, language, reverse)
+
+class OffloadTimeout(Exception):
+    """An offloaded translation did not finish in time"""
+
+class TranslationOffloader:
+    """Process pool of warm translators for requests too large to run inline
+    
+    The pool starts on first use. A request that times out is cancelled if
+    it is still queued; one already running is left to finish and its result
+    is dropped. A broken pool is discarded and rebuilt on the next request.
+    """
+    
+    def __init__(self, workers: int = OFFLOAD_WORKERS, timeout: float = OFFLOAD_TIMEOUT_SECONDS):
+        self.workers = workers
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.queue_depth = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.failures = 0
+        self._latencies: "deque[float]" = deque(maxlen=1000)
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Spawned workers do not inherit the server's threads or locks
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_offload_worker)
+            return self._pool
+    
+    def _reset_pool(self, pool: ProcessPoolExecutor):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def translate(self, text: str, standard: str, language: str, reverse: bool) -> Tuple[str, str]:
+        """Translate in a worker process, returning (result, backend name)"""
+        pool = self._get_pool()
+        started = time.perf_counter()
+        with self._lock:
+            self.queue_depth += 1
+        try:
+            future = pool.submit(_offloaded_translate, text, standard, language, reverse)
+            try:
+                result, method = future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                with self._lock:
+                    self.timeouts += 1
+                    self.cancelled += future.cancel()
+                raise OffloadTimeout(f"Translation timed out after {self.timeout:g}s")
+        except BrokenProcessPool:
+            with self._lock:
+                self.failures += 1
+            self._reset_pool(pool)
+            raise
+        finally:
+            with self._lock:
+                self.queue_depth -= 1
+        with self._lock:
+            self.completed += 1
+            self._latencies.append(time.perf_counter() - started)
+        return result, f"{method} (offloaded)"
+    
+    def stats(self) -> Dict:
+        """Counters for monitoring; latencies cover the last 1000 requests"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "workers": self.workers,
+                "started": self._pool is not None,
+                "queue_depth": self.queue_depth,
+                "completed": self.completed,
+                "timeouts": self.timeouts,
+                "cancelled": self.cancelled,
+                "failures": self.failures,
+                "latency_ms": {
+                    "p50": round(latencies[len(latencies) // 2] * 1000, 3) if latencies else 0,
+                    "p99": round(latencies[int(len(latencies) * 0.99)] * 1000, 3) if latencies else 0,
+                    "max": round(latencies[-1] * 1000, 3) if latencies else 0
+                }
+            }
+    
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Flutter integration
@@ -321,49 +1855,121 @@ CORS(app)  # Enable CORS for Flutter integration
 # Initialize translator
 translator = BrailleTranslator()
 
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
+# Response payloads shared by the Flask routes and the ASGI app (braille_asgi.py)
+
+def health_payload() -> Dict:
+    """Service status and cache/engine counters"""
+    return {
         "status": "healthy",
         "service": "Braille Translation API",
         "version": "1.0.0",
-        "pybraille_available": PYBRAILLE_AVAILABLE
-    })
+        "pybraille_available": PYBRAILLE_AVAILABLE,
+        "cache": translator.cache.stats() if translator.cache is not None else None,
+        "disk_cache": translator.disk_cache.stats() if translator.disk_cache is not None else None,
+        "tables": translator.tables.stats(),
+        "backends": translator.backends.stats(),
+        "offload": translator.offload.stats() if translator.offload is not None else None
+    }
 
-@app.route('/api/braille/translate', methods=['POST'])
-def translate_text():
-    """Main translation endpoint"""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
-        
+def engine_gauges() -> Iterator[Tuple[str, str, str, Dict[str, str], float]]:
+    """Current cache, backend and offload state, read when /metrics is scraped"""
+    if translator.cache is not None:
+        stats = translator.cache.stats()
+        yield ('braille_cache_entries', 'gauge', 'Entries in the translation cache.', {'tier': 'memory'}, stats['entries'])
+        yield ('braille_cache_bytes', 'gauge', 'Approximate size of the translation cache.', {'tier': 'memory'}, stats['bytes'])
+    if translator.disk_cache is not None:
+        stats = translator.disk_cache.stats()
+        yield ('braille_cache_entries', 'gauge', 'Entries in the translation cache.', {'tier': 'disk'}, stats['entries'])
+        yield ('braille_cache_bytes', 'gauge', 'Approximate size of the translation cache.', {'tier': 'disk'}, stats['bytes'])
+    for table, stats in translator.tables.stats()['word_memo'].items():
+        yield ('braille_word_memo_entries', 'gauge', 'Words memoized per compiled table.', {'table': table}, stats['entries'])
+    now = time.time()
+    for backend in translator.backends.backends:
+        yield ('braille_backend_circuit_open', 'gauge', '1 while a backend is skipped after repeated failures.',
+               {'backend': backend.name}, int(backend.open_until > now))
+    if translator.offload is not None:
+        yield ('braille_offload_queue_depth', 'gauge', 'Translations waiting for or running in the process pool.',
+               {}, translator.offload.queue_depth)
+
+metrics.collector(engine_gauges)
+
+def metrics_payload() -> str:
+    """Prometheus text exposition of the request and engine metrics"""
+    return metrics.render()
+
+def record_request(route: str, method: str, status: int, seconds: float,
+                   request_bytes: int, response_bytes: int):
+    """Record one HTTP request against its route template"""
+    metrics.inc('braille_http_requests_total', route=route, method=method, status=str(status))
+    metrics.observe('braille_http_request_duration_seconds', seconds, route=route)
+    metrics.observe('braille_http_request_size_bytes', request_bytes, route=route)
+    metrics.observe('braille_http_response_size_bytes', response_bytes, route=route)
+
+def dumps_json(payload) -> bytes:
+    """Encode a payload as compact UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def json_response(payload, status: int = 200) -> Response:
+    """Flask response for a payload encoded with dumps_json"""
+    return Response(dumps_json(payload), status=status, mimetype='application/json')
+
+def translate_payload(data: Any, admin: bool = False) -> Tuple[Dict, int]:
+    """Translate one JSON request body, returning the payload and HTTP status"""
+    if not data:
+        return {"error": "No JSON data provided"}, 400
+    if not isinstance(data, dict):
+        return {"error": "Request body must be a JSON object"}, 400
+    
+    profile = data.get('profile')
+    if not profile:
         # Create request object
-        req = BrailleTranslationRequest(
-            text=data.get('text', ''),
-            standard=data.get('standard', BrailleStandard.GRADE_1.value),
-            language=data.get('language', BrailleLanguage.ENGLISH.value),
-            reverse=data.get('reverse', False),
-            format_output=data.get('format_output', True),
-            include_metadata=data.get('include_metadata', False)
-        )
+        try:
+            req = BrailleTranslationRequest.from_dict(data)
+        except ValueError as e:
+            return {"error": str(e)}, 400
         
         # Perform translation
-        response = translator.translate(req)
-        
-        # Return response
-        status_code = 200 if response.success else 400
-        return jsonify(asdict(response)), status_code
-        
-    except Exception as e:
-        logger.error(f"API error: {e}")
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+        try:
+            response = translator.translate(req)
+        except OffloadTimeout as e:
+            return {"error": f"{e}, retry later"}, 503
+        return response.to_dict(req.lean), 200 if response.success else 400
+    
+    if not admin:
+        return {"error": "Forbidden: profiling requires an admin API key"}, 403
+    mode = 'stages' if profile is True else str(profile)
+    if mode not in PROFILE_MODES:
+        return {"error": f"Unsupported profile mode: {mode}. Use one of: {', '.join(PROFILE_MODES)}"}, 400
+    
+    started = time.perf_counter()
+    try:
+        req = BrailleTranslationRequest.from_dict({**data, 'include_metadata': True})
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    timings = {"parse": time.perf_counter() - started}
+    try:
+        with profile_request(mode) as report:
+            # A cache hit would only profile the lookup
+            response = translator.translate(req, timings, bypass_cache=True)
+            started = time.perf_counter()
+            payload = response.to_dict(req.lean)
+            dumps_json(payload)
+            timings["serialize"] = time.perf_counter() - started
+    except ProfilerBusy as e:
+        return {"error": f"{e}, retry later"}, 429
+    except OffloadTimeout as e:
+        return {"error": f"{e}, retry later"}, 503
+    report["stages_ms"] = {stage: round(seconds * 1000, 3) for stage, seconds in timings.items()}
+    if payload.get("metadata") is None:
+        payload["metadata"] = {}
+    payload["metadata"]["profile"] = report
+    return payload, 200 if response.success else 400
 
-@app.route('/api/braille/standards', methods=['GET'])
-def get_standards():
-    """Get supported Braille standards"""
-    return jsonify({
+def standards_payload() -> Dict:
+    """Supported Braille standards"""
+    return {
         "standards": [
             {
                 "code": standard.value,
@@ -372,11 +1978,10 @@ def get_standards():
             }
             for standard in BrailleStandard
         ]
-    })
+    }
 
-@app.route('/api/braille/languages', methods=['GET'])
-def get_languages():
-    """Get supported languages"""
+def languages_payload() -> Dict:
+    """Supported languages"""
     language_names = {
         'en': 'English',
         'es': 'Spanish',
@@ -386,7 +1991,7 @@ def get_languages():
         'pt': 'Portuguese'
     }
     
-    return jsonify({
+    return {
         "languages": [
             {
                 "code": lang.value,
@@ -394,11 +1999,10 @@ def get_languages():
             }
             for lang in BrailleLanguage
         ]
-    })
+    }
 
-@app.route('/api/braille/demo', methods=['GET'])
-def demo():
-    """Demo endpoint with sample translations"""
+def demo_payload() -> Dict:
+    """Sample Grade 1 translations"""
     demo_texts = [
         "Hello World",
         "The quick brown fox jumps over the lazy dog",
@@ -420,10 +2024,220 @@ def demo():
             "success": response.success
         })
     
-    return jsonify({
+    return {
         "demo_translations": results,
         "note": "These are sample translations using Grade 1 Braille"
-    })
+    }
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    started = getattr(g, 'request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        # Streamed responses have no length up front; count them as zero bytes
+        record_request(route, request.method, response.status_code, time.perf_counter() - started,
+                       request.content_length or 0, response.calculate_content_length() or 0)
+    return response
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus scrape endpoint"""
+    return Response(metrics_payload(), content_type=METRICS_CONTENT_TYPE)
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    """Health check endpoint"""
+    return jsonify(health_payload())
+
+def is_admin_key(key: Optional[str]) -> bool:
+    """Check an X-API-KEY header value against BRAILLE_ADMIN_KEY"""
+    return bool(ADMIN_API_KEY) and key == ADMIN_API_KEY
+
+def is_admin_request() -> bool:
+    """Check the X-API-KEY header of the current Flask request"""
+    return is_admin_key(request.headers.get('X-API-KEY'))
+
+@app.route('/api/admin/cache/clear', methods=['POST'])
+def clear_cache():
+    """Admin endpoint: drop every cached translation (add ?disk=true for the shared tier)"""
+    if not is_admin_request():
+        return jsonify({"error": "Forbidden: Invalid API Key"}), 403
+    cleared = translator.cache.clear() if translator.cache is not None else 0
+    logger.info(f"Translation cache cleared ({cleared} entries)")
+    response = {"success": True, "cleared": cleared}
+    if request.args.get('disk', 'false').lower() == 'true' and translator.disk_cache is not None:
+        response["disk_cleared"] = translator.disk_cache.clear()
+        logger.info(f"Disk translation cache cleared ({response['disk_cleared']} entries)")
+    return jsonify(response)
+
+@app.route('/api/braille/translate', methods=['POST'])
+def translate_text():
+    """Main translation endpoint"""
+    try:
+        payload, status_code = translate_payload(request.get_json(), admin=is_admin_request())
+        return json_response(payload, status_code)
+        
+    except Exception as e:
+        logger.error(f"API error: {e}")
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+@app.route('/api/braille/translate/batch', methods=['POST'])
+def translate_batch():
+    """Batch translation endpoint: results are returned in request order"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No JSON data provided"}), 400
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must be a JSON object"}), 400
+        
+        items = data.get('items')
+        defaults = data.get('defaults') or {}
+        if not isinstance(items, list) or not items:
+            return jsonify({"error": "'items' must be a non-empty list"}), 400
+        if len(items) > MAX_BATCH_SIZE:
+            return jsonify({"error": f"Batch too large (max {MAX_BATCH_SIZE} items)"}), 400
+        if not isinstance(defaults, dict):
+            return jsonify({"error": "'defaults' must be an object"}), 400
+        
+        # Malformed items get their own error instead of failing the batch
+        reqs = []
+        malformed = {}
+        for index, item in enumerate(items):
+            if isinstance(item, str):
+                item = {'text': item}
+            if not isinstance(item, dict):
+                malformed[index] = "Item must be an object or a string"
+                continue
+            try:
+                reqs.append(BrailleTranslationRequest.from_dict(item, defaults))
+            except ValueError as e:
+                malformed[index] = str(e)
+        
+        translated = iter(zip(reqs, translator.translate_batch(reqs)))
+        results = []
+        for index in range(len(items)):
+            if index in malformed:
+                results.append({"success": False, "error": malformed[index]})
+            else:
+                req, response = next(translated)
+                results.append(response.to_dict(req.lean))
+        
+        return json_response({
+            "success": all(result["success"] for result in results),
+            "count": len(results),
+            "results": results
+        })
+        
+    except Exception as e:
+        logger.error(f"API error: {e}")
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+def _read_stream_chunks(stream) -> Iterator[str]:
+    """Decode a binary stream as UTF-8 text, one chunk at a time"""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    while True:
+        data = stream.read(STREAM_CHUNK_SIZE)
+        if not data:
+            break
+        yield decoder.decode(data)
+    yield decoder.decode(b'', final=True)
+
+@app.route('/api/braille/translate/stream', methods=['POST'])
+def translate_stream():
+    """Streaming translation endpoint for documents of any size
+    
+    The document is sent as the raw (optionally chunked) request body or as
+    a multipart upload named 'file'. Options are query parameters. Braille
+    is returned incrementally as text/plain with chunked transfer encoding.
+    """
+    standard = request.args.get('standard', BrailleStandard.GRADE_1.value)
+    language = request.args.get('language', BrailleLanguage.ENGLISH.value)
+    reverse = request.args.get('reverse', 'false').lower() == 'true'
+    format_output = request.args.get('format_output', 'false').lower() == 'true'
+    
+    if standard not in translator.supported_standards:
+        return jsonify({"error": f"Unsupported standard: {standard}"}), 400
+    if language not in translator.supported_languages:
+        return jsonify({"error": f"Unsupported language: {language}"}), 400
+    
+    def generate():
+        # Only multipart bodies are parsed as a form: reading request.files would
+        # consume any other body (e.g. curl -d, sent as form-urlencoded) as form fields
+        upload = request.files.get('file') if request.mimetype == 'multipart/form-data' else None
+        chunks = _read_stream_chunks(upload.stream if upload is not None else request.stream)
+        for braille in translator.translate_stream(chunks, standard, language, reverse, format_output):
+            yield braille.encode('utf-8')
+    
+    return Response(stream_with_context(generate()), mimetype='text/plain; charset=utf-8')
+
+@app.route('/api/braille/translate/incremental', methods=['POST'])
+def translate_incremental():
+    """Incremental translation endpoint for live-typing clients
+    
+    Takes the previous source text, its unformatted Braille and one edit,
+    and returns a patch against that Braille.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No JSON data provided"}), 400
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must be a JSON object"}), 400
+        
+        fields = {}
+        for name, default in (('text', ''), ('braille', ''),
+                              ('standard', BrailleStandard.GRADE_1.value),
+                              ('language', BrailleLanguage.ENGLISH.value)):
+            value = data.get(name)
+            if value is not None and not isinstance(value, str):
+                return jsonify({"error": f"'{name}' must be a string"}), 400
+            fields[name] = default if value is None else value
+        standard, language = fields['standard'], fields['language']
+        try:
+            edit = TextEdit.from_dict(data.get('edit'))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if standard not in translator.supported_standards:
+            return jsonify({"error": f"Unsupported standard: {standard}"}), 400
+        if language not in translator.supported_languages:
+            return jsonify({"error": f"Unsupported language: {language}"}), 400
+        
+        try:
+            patch = translator.translate_edit(fields['text'], fields['braille'], edit.offset, edit.deleted,
+                                              edit.inserted, standard, language)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        return jsonify({
+            "success": True,
+            "patch": asdict(patch),
+            "standard_used": standard,
+            "language": language
+        })
+        
+    except Exception as e:
+        logger.error(f"API error: {e}")
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+@app.route('/api/braille/standards', methods=['GET'])
+def get_standards():
+    """Get supported Braille standards"""
+    return jsonify(standards_payload())
+
+@app.route('/api/braille/languages', methods=['GET'])
+def get_languages():
+    """Get supported languages"""
+    return jsonify(languages_payload())
+
+@app.route('/api/braille/demo', methods=['GET'])
+def demo():
+    """Demo endpoint with sample translations"""
+    return jsonify(demo_payload())
 
 def main():
     """Main entry point for command line usage"""
@@ -0,0 +1,212 @@
+"""
+Braille Translation API - ASGI Serving Mode
+===========================================
+
+Serves the core routes of braille_api.py as an ASGI application, so slow
+or idle clients wait on the event loop instead of holding a worker thread.
+Translation is CPU-bound and runs in a bounded thread pool; when that pool
+and its queue are full, requests are refused with 503 rather than piling up.
+
+Usage:
+    uvicorn braille_asgi:app --host 0.0.0.0 --port 8000
+    python braille_asgi.py [--host HOST] [--port PORT]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from braille_api import (
+    health_payload, translate_payload, standards_payload, languages_payload, demo_payload,
+    metrics_payload, record_request, is_admin_key, dumps_json, METRICS_CONTENT_TYPE, logger
+)
+
+# Translation threads, and how many requests may wait for one before 503
+ASGI_WORKERS = int(os.environ.get('BRAILLE_ASGI_WORKERS', str(min(32, (os.cpu_count() or 1) + 4))))
+ASGI_MAX_PENDING = int(os.environ.get('BRAILLE_ASGI_MAX_PENDING', '256'))
+
+# Request bodies: size limit, and how long a client may take to send one
+ASGI_MAX_BODY_BYTES = int(os.environ.get('BRAILLE_ASGI_MAX_BODY_BYTES', str(1024 * 1024)))
+ASGI_BODY_TIMEOUT = float(os.environ.get('BRAILLE_ASGI_BODY_TIMEOUT', '30'))
+
+class HTTPError(Exception):
+    """An error response raised while handling a request"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class BrailleASGIApp:
+    """Minimal ASGI application routing to the shared braille_api payloads"""
+
+    def __init__(self, workers: int = ASGI_WORKERS, max_pending: int = ASGI_MAX_PENDING):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.routes: Dict[Tuple[str, str], Callable] = {
+            ('GET', '/health'): self.health,
+            ('POST', '/api/braille/translate'): self.translate,
+            ('GET', '/api/braille/standards'): self.standards,
+            ('GET', '/api/braille/languages'): self.languages,
+            ('GET', '/api/braille/demo'): self.demo,
+        }
+        self.raw_routes: Dict[Tuple[str, str], Callable] = {
+            ('GET', '/metrics'): self.metrics,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    def _start(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix='braille-translate')
+            self._slots = asyncio.Semaphore(self.workers + self.max_pending)
+
+    async def run_bounded(self, func: Callable, *args):
+        """Run func in the translation pool, or refuse if the pool is saturated"""
+        self._start()
+        if self._slots.locked():
+            raise HTTPError(503, "Server busy, retry later")
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _http(self, scope, receive, send):
+        method, path = scope['method'], scope['path']
+        known = any(route_path == path for _, route_path in [*self.routes, *self.raw_routes])
+        if method == 'OPTIONS' and known:
+            await self._send(send, 204, b'', extra_headers=[
+                (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
+                (b'access-control-allow-headers', b'Content-Type, X-API-KEY'),
+            ])
+            return
+
+        started = time.perf_counter()
+        request_bytes = [0]
+
+        async def counting_receive():
+            message = await receive()
+            request_bytes[0] += len(message.get('body', b''))
+            return message
+
+        route = path if (method, path) in self.routes or (method, path) in self.raw_routes else 'unmatched'
+        raw_handler = self.raw_routes.get((method, path))
+        handler = self.routes.get((method, path))
+        try:
+            if raw_handler is not None:
+                body, content_type = await raw_handler(scope, counting_receive)
+                status = 200
+            elif handler is not None:
+                payload, status = await handler(scope, counting_receive)
+                body, content_type = dumps_json(payload), 'application/json'
+            else:
+                raise HTTPError(405 if known else 404, "Method not allowed" if known else "Not found")
+        except HTTPError as e:
+            body, status, content_type = dumps_json({"error": e.message}), e.status, 'application/json'
+        except Exception as e:
+            logger.error(f"API error: {e}")
+            body, status = dumps_json({"error": f"Internal server error: {str(e)}"}), 500
+            content_type = 'application/json'
+        await self._send(send, status, body, content_type=content_type)
+        record_request(route, method, status, time.perf_counter() - started, request_bytes[0], len(body))
+
+    async def _send(self, send, status: int, body: bytes,
+                    extra_headers: Optional[List[Tuple[bytes, bytes]]] = None,
+                    content_type: str = 'application/json'):
+        headers = [
+            (b'content-type', content_type.encode('ascii')),
+            (b'content-length', str(len(body)).encode('ascii')),
+            (b'access-control-allow-origin', b'*'),
+        ] + (extra_headers or [])
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def read_body(self, receive) -> bytes:
+        """Read the request body without blocking a thread, with size and time limits"""
+        async def read():
+            chunks = []
+            size = 0
+            while True:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    raise HTTPError(400, "Client disconnected")
+                chunk = message.get('body', b'')
+                size += len(chunk)
+                if size > ASGI_MAX_BODY_BYTES:
+                    raise HTTPError(413, f"Request body too large (max {ASGI_MAX_BODY_BYTES} bytes)")
+                chunks.append(chunk)
+                if not message.get('more_body', False):
+                    return b''.join(chunks)
+        try:
+            return await asyncio.wait_for(read(), ASGI_BODY_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HTTPError(408, "Request body not received in time")
+
+    async def health(self, scope, receive):
+        return health_payload(), 200
+
+    async def translate(self, scope, receive):
+        body = await self.read_body(receive)
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            raise HTTPError(400, "Invalid JSON")
+        headers = dict(scope.get('headers', []))
+        admin = is_admin_key(headers.get(b'x-api-key', b'').decode('latin-1'))
+        return await self.run_bounded(translate_payload, data, admin)
+
+    async def standards(self, scope, receive):
+        return standards_payload(), 200
+
+    async def languages(self, scope, receive):
+        return languages_payload(), 200
+
+    async def demo(self, scope, receive):
+        return await self.run_bounded(demo_payload), 200
+
+    async def metrics(self, scope, receive):
+        return metrics_payload().encode('utf-8'), METRICS_CONTENT_TYPE
+
+app = BrailleASGIApp()
+
+def main():
+    """Serve the ASGI app with uvicorn"""
+    parser = argparse.ArgumentParser(description="Serve the Braille Translation API over ASGI.")
+    parser.add_argument("--host", default="0.0.0.0", help="Bind address (default 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=8000, help="Port (default 8000)")
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        print("Please install uvicorn to serve the ASGI app: pip install uvicorn")
+        sys.exit(1)
+
+    print(f"Starting Braille Translation API (ASGI) on http://{args.host}:{args.port}")
+    print(f"Translation workers: {ASGI_WORKERS}, max pending: {ASGI_MAX_PENDING}")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+
+if __name__ == '__main__':
+    main()
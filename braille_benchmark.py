@@ -0,0 +1,342 @@
+"""
+Braille Translation Benchmarks
+==============================
+
+Benchmarks for the Braille translation engine in braille_api.py.
+
+The suite times the basic encoder and decoder, every registered translation
+backend and the full translate() path. It covers Grade 1 and Grade 2, both
+directions, and inputs from 10 B to 1 MB. The word memo is off for the main
+cases, and memoized Grade 2 encoding is reported separately as "+memo".
+Results are written as JSON, and a previous run can be given as a baseline
+to catch throughput regressions.
+
+Usage:
+    python braille_benchmark.py [--sizes 10,1000,100000] [--output results.json]
+    python braille_benchmark.py --baseline results.json [--tolerance 0.2]
+    python braille_benchmark.py --legacy [--size CHARS] [--repeat N]
+    python braille_benchmark.py --image-renderer [--image-size 2480x3508]
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional
+
+# braille_api prints optional-dependency warnings on import; keep stdout pure JSON
+with contextlib.redirect_stdout(sys.stderr):
+    from braille_api import BrailleTranslator, BrailleTranslationRequest, BrailleStandard
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+STANDARDS = (BrailleStandard.GRADE_1.value, BrailleStandard.GRADE_2.value)
+
+# Longest input translate() accepts (see BrailleTranslator.validate_request)
+MAX_REQUEST_CHARS = 10000
+
+# Vocabulary for the generated corpus: common words (many with Grade 2
+# contractions), numbers and punctuation
+CORPUS_WORDS = (
+    "the and for of with you it this that was his her have from they which but not all "
+    "can do people so will like more time out about just knowledge braille reading child "
+    "children accessibility important street because through would could should together "
+    "quick brown fox jumps over lazy dog information system translation every great little "
+    "123 2024 42 7, isn't it? yes! (maybe) \"quoted\" well-known; done: ok."
+).split()
+
+SAMPLE_TEXT = (
+    "The quick brown fox jumps over the lazy dog. "
+    "Accessibility is important for 123 Main Street, isn't it? "
+)
+
+def legacy_grade1_encode(translator: BrailleTranslator, text: str) -> str:
+    """Per-character Grade 1 loop used before the compiled tables (reference)"""
+    text = text.lower().strip()
+    result = []
+    for char in text:
+        if char in translator.grade1_map:
+            result.append(translator.grade1_map[char])
+        elif char.isdigit():
+            if not result or result[-1] != '⠼':
+                result.append('⠼')
+            digit_map = {'1': '⠁', '2': '⠃', '3': '⠉', '4': '⠙', '5': '⠑',
+                         '6': '⠋', '7': '⠛', '8': '⠓', '9': '⠊', '0': '⠚'}
+            result.append(digit_map.get(char, '⠀'))
+        else:
+            result.append('⠀')
+    return ''.join(result)
+
+def legacy_image_to_braille(img) -> str:
+    """Per-pixel renderer used by preprocess.image_to_braille before vectorizing (reference)"""
+    braille_base = 0x2800
+    h, w = img.shape
+    lines = []
+    for y in range(0, h, 4):
+        line = ''
+        for x in range(0, w, 2):
+            dots = 0
+            for dy in range(4):
+                for dx in range(2):
+                    yy, xx = y + dy, x + dx
+                    if yy < h and xx < w:
+                        # Braille dot order: 1,2,3,7,4,5,6,8
+                        dot_idx = [0,1,2,6,3,4,5,7][dy*2+dx]
+                        if img[yy, xx] == 0:  # black pixel = raised dot
+                            dots |= 1 << dot_idx
+            line += chr(braille_base + dots)
+        lines.append(line)
+    return '\n'.join(lines)
+
+def make_corpus(size: int) -> str:
+    """Build a deterministic corpus of exactly size characters"""
+    return (SAMPLE_TEXT * (size // len(SAMPLE_TEXT) + 1))[:size]
+
+def make_word_corpus(size: int, seed: int = 1729) -> str:
+    """Build a fixed pseudo-random corpus of exactly size ASCII characters
+    
+    Unlike make_corpus, word order varies, but the vocabulary is only
+    CORPUS_WORDS; a warm word memo serves every word, so run_suite times the
+    engine with the memo off and reports memoized cases separately.
+    """
+    rng = random.Random(seed)
+    words: List[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(CORPUS_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:size].strip().ljust(size, '.')
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """Best-of-repeat wall time for one call, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_grade1_encoder(size: int = 10000, repeat: int = 20) -> Dict[str, float]:
+    """Compare the compiled Grade 1 encoder against the legacy loop"""
+    translator = BrailleTranslator()
+    text = make_corpus(size)
+    translator.get_table(BrailleStandard.GRADE_1.value)  # Compile outside the timing
+
+    legacy = time_call(lambda: legacy_grade1_encode(translator, text), repeat)
+    compiled = time_call(
+        lambda: translator.text_to_braille_basic(text, BrailleStandard.GRADE_1.value), repeat
+    )
+    return {
+        "size": size,
+        "legacy_ms": round(legacy * 1000, 3),
+        "compiled_ms": round(compiled * 1000, 3),
+        "speedup": round(legacy / compiled, 1) if compiled > 0 else 0,
+    }
+
+def benchmark_image_renderer(width: int = 2480, height: int = 3508, repeat: int = 3) -> Dict[str, float]:
+    """Compare preprocess's vectorized Braille renderer against the per-pixel loop
+    
+    The default size is an A4 page scanned at 300 dpi.
+    """
+    import numpy as np
+    with contextlib.redirect_stdout(sys.stderr):
+        import preprocess
+    
+    img = np.where(np.random.default_rng(0).random((height, width)) < 0.5, 0, 255).astype(np.uint8)
+    if preprocess.render_braille_text(img) != legacy_image_to_braille(img):
+        raise AssertionError("Vectorized renderer output differs from the per-pixel loop")
+    legacy = time_call(lambda: legacy_image_to_braille(img), repeat)
+    vectorized = time_call(lambda: preprocess.render_braille_text(img), repeat)
+    return {
+        "width": width,
+        "height": height,
+        "legacy_ms": round(legacy * 1000, 3),
+        "vectorized_ms": round(vectorized * 1000, 3),
+        "speedup": round(legacy / vectorized, 1) if vectorized > 0 else 0,
+    }
+
+def measure(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Time func with enough calls per run to be measurable, best and median per call"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    runs = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {"best_s": min(runs), "median_s": statistics.median(runs), "calls": number * repeat}
+
+def benchmark_cases(translator: BrailleTranslator, standard: str, reverse: bool,
+                    text: str, braille: str) -> Dict[str, Optional[Callable[[], object]]]:
+    """Callables to time for one standard and direction (None marks a skipped case)"""
+    source = braille if reverse else text
+    cases: Dict[str, Optional[Callable[[], object]]] = {}
+    if reverse:
+        cases["braille_to_text_basic"] = lambda: translator.braille_to_text_basic(braille, standard)
+    else:
+        cases["text_to_braille_basic"] = lambda: translator.text_to_braille_basic(text, standard)
+    
+    for backend in translator.backends.backends:
+        if (standard, reverse) not in backend.verified:
+            continue
+        convert = backend.decode if reverse else backend.encode
+        cases[f"backend:{backend.name}"] = (lambda convert=convert: convert(source, standard, 'en'))
+    
+    if len(source) <= MAX_REQUEST_CHARS:
+        req = BrailleTranslationRequest(text=source, standard=standard, reverse=reverse)
+        cases["translate"] = lambda: translator.translate(req)
+    else:
+        cases["translate"] = None
+    return cases
+
+def with_word_memo(table, memo, func: Callable[[], object]) -> Callable[[], object]:
+    """Wrap func so it runs with the table's word memo switched on"""
+    def run():
+        table.memo = memo
+        try:
+            return func()
+        finally:
+            table.memo = None
+    return run
+
+def run_suite(sizes=SIZES, standards=STANDARDS, repeat: int = 5) -> Dict:
+    """Time every case at every size, returning a JSON-ready report
+    
+    Cases run with the word memo off, so they time contraction matching
+    itself; for memoized standards, forward cases are also reported with a
+    warm memo under a "+memo" suffix.
+    """
+    # No caches or worker processes, so translate() measures the engine itself
+    translator = BrailleTranslator(cache_max_bytes=0, disk_cache_path=None, offload_workers=0)
+    results = []
+    for standard in standards:
+        table = translator.get_table(standard)  # Compile outside the timing
+        memo, table.memo = table.memo, None
+        for size in sizes:
+            text = make_word_corpus(size)
+            braille = translator.text_to_braille_basic(text, standard)
+            for reverse in (False, True):
+                source = braille if reverse else text
+                cases = benchmark_cases(translator, standard, reverse, text, braille)
+                if memo is not None and not reverse:
+                    cases.update({f"{case}+memo": func and with_word_memo(table, memo, func)
+                                  for case, func in list(cases.items())})
+                for case, func in cases.items():
+                    entry = {
+                        "case": case,
+                        "standard": standard,
+                        "direction": "reverse" if reverse else "forward",
+                        "size": size,
+                        "input_chars": len(source),
+                    }
+                    if func is None:
+                        entry["skipped"] = f"input over {MAX_REQUEST_CHARS} characters"
+                    else:
+                        timing = measure(func, repeat)
+                        entry.update({
+                            "best_ms": round(timing["best_s"] * 1000, 4),
+                            "median_ms": round(timing["median_s"] * 1000, 4),
+                            "calls": timing["calls"],
+                            "chars_per_s": round(len(source) / timing["best_s"]) if timing["best_s"] > 0 else 0,
+                        })
+                    results.append(entry)
+    return {
+        "meta": {
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backends": [backend.name for backend in translator.backends.backends],
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+def compare_to_baseline(report: Dict, baseline: Dict, tolerance: float = 0.2) -> Dict:
+    """Compare throughput with a previous report; drops beyond tolerance are regressions"""
+    def key(entry):
+        return entry["case"], entry["standard"], entry["direction"], entry["size"]
+    
+    previous = {key(entry): entry for entry in baseline.get("results", []) if "chars_per_s" in entry}
+    changes = []
+    for entry in report["results"]:
+        old = previous.get(key(entry))
+        if old is None or "chars_per_s" not in entry or not old["chars_per_s"]:
+            continue
+        ratio = entry["chars_per_s"] / old["chars_per_s"]
+        changes.append({
+            "case": entry["case"],
+            "standard": entry["standard"],
+            "direction": entry["direction"],
+            "size": entry["size"],
+            "baseline_chars_per_s": old["chars_per_s"],
+            "chars_per_s": entry["chars_per_s"],
+            "ratio": round(ratio, 3),
+            "regression": ratio < 1 - tolerance,
+        })
+    return {
+        "tolerance": tolerance,
+        "compared": len(changes),
+        "regressions": [change for change in changes if change["regression"]],
+        "changes": changes,
+    }
+
+def main():
+    """Main entry point for command line usage"""
+    parser = argparse.ArgumentParser(description="Benchmark the Braille translation engine.")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES),
+                        help="Comma-separated input sizes in bytes (default 10 B to 1 MB)")
+    parser.add_argument("--standards", default=",".join(STANDARDS), help="Comma-separated standards")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per case, best and median reported (default 5)")
+    parser.add_argument("--output", help="Write the JSON report to this file as well as stdout")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare throughput against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Throughput drop counted as a regression (default 0.2 = 20%%)")
+    parser.add_argument("--legacy", action="store_true",
+                        help="Only compare the compiled Grade 1 encoder with the legacy loop")
+    parser.add_argument("--size", type=int, default=10000, help="Input size for --legacy (default 10000)")
+    parser.add_argument("--image-renderer", action="store_true",
+                        help="Only compare preprocess's vectorized image renderer with the per-pixel loop")
+    parser.add_argument("--image-size", default="2480x3508",
+                        help="WIDTHxHEIGHT for --image-renderer (default: A4 at 300 dpi)")
+    args = parser.parse_args()
+
+    if args.image_renderer:
+        width, height = (int(part) for part in args.image_size.lower().split('x'))
+        result = benchmark_image_renderer(width, height, min(args.repeat, 3))
+        print(f"Image to Braille, {result['width']}x{result['height']} pixels:")
+        print(f"  per-pixel loop:   {result['legacy_ms']} ms")
+        print(f"  vectorized:       {result['vectorized_ms']} ms")
+        print(f"  speed-up:         {result['speedup']}x")
+        return
+
+    if args.legacy:
+        result = benchmark_grade1_encoder(args.size, args.repeat)
+        print(f"Grade 1 encoding, {result['size']} characters:")
+        print(f"  legacy loop:      {result['legacy_ms']} ms")
+        print(f"  compiled tables:  {result['compiled_ms']} ms")
+        print(f"  speed-up:         {result['speedup']}x")
+        return
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    standards = [standard for standard in args.standards.split(',') if standard]
+    report = run_suite(sizes, standards, args.repeat)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            report["comparison"] = compare_to_baseline(report, json.load(f), args.tolerance)
+    
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    print(output)
+    
+    regressions = report.get("comparison", {}).get("regressions", [])
+    if regressions:
+        for change in regressions:
+            print(f"Regression: {change['case']} {change['standard']} {change['direction']} "
+                  f"{change['size']} B at {change['ratio']}x baseline throughput", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,7 @@ from Python or can be adapted for Flutter/Dart HTTP requests.
 
 import requests
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 class BrailleAPIClient:
     """Client for interacting with the Braille Translation API"""
@@ -51,6 +51,48 @@ class BrailleAPIClient:
         except Exception as e:
             return {"error": str(e)}
     
+    def translate_batch(self, items: List[Any], **defaults: Any) -> Dict[str, Any]:
+        """Translate many texts (or request dicts) in a single request"""
+        payload = {"items": items, "defaults": defaults}
+        
+        try:
+            response = requests.post(
+                f"{self.base_url}/api/braille/translate/batch",
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            )
+            return response.json()
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def translate_file(self,
+                       path: str,
+                       standard: str = "grade1",
+                       language: str = "en",
+                       reverse: bool = False,
+                       format_output: bool = False) -> Iterator[str]:
+        """Stream a text file of any size through the API, yielding Braille chunks"""
+        params = {
+            "standard": standard,
+            "language": language,
+            "reverse": str(reverse).lower(),
+            "format_output": str(format_output).lower()
+        }
+        
+        # A file object as the raw body is sent in blocks; files= would
+        # build the whole multipart body in memory first
+        with open(path, 'rb') as f:
+            response = requests.post(
+                f"{self.base_url}/api/braille/translate/stream",
+                params=params,
+                data=f,
+                headers={"Content-Type": "application/octet-stream"},
+                stream=True
+            )
+            response.raise_for_status()
+            response.encoding = 'utf-8'
+            yield from response.iter_content(chunk_size=None, decode_unicode=True)
+    
     def get_standards(self) -> Dict[str, Any]:
         """Get supported Braille standards"""
         try:
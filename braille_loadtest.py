@@ -0,0 +1,332 @@
+"""
+Braille Translation API Load Test
+=================================
+
+Drives a request mix against any server exposing the translation API (the
+Flask app in braille_api.py or the ASGI app in braille_asgi.py). It can
+start the server itself, so server modes and worker counts can be compared
+side by side on the same machine.
+
+Usage:
+    python braille_loadtest.py --url http://localhost:5000 [--concurrency 32] [--requests 2000]
+    python braille_loadtest.py --url http://localhost:8000 --slow-clients 16
+    python braille_loadtest.py --server gunicorn:4 --rate 200 --requests 4000
+    python braille_loadtest.py --compare flask gunicorn:2 gunicorn:4 asgi:1 asgi:4
+
+With --rate the load is open-loop: requests are scheduled at that average
+rate (Poisson arrivals) whether or not earlier ones have finished, and
+latency is measured from the scheduled time. Without it, each client thread
+sends its next request as soon as the previous one returns.
+
+Slow clients open a connection and trickle their request body one byte at
+a time for the whole run, the way a phone on a poor network would.
+"""
+
+import argparse
+import json
+import os
+import queue
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+SAMPLE_TEXT = "The quick brown fox jumps over the lazy dog. "
+SAMPLE_BRAILLE = "⠓⠑⠇⠇⠕ ⠺⠕⠗⠇⠙ ⠮ ⠟⠊⠉⠅ ⠃⠗⠪⠝ ⠋⠕⠭ "
+
+# Seconds to wait for a locally started server to answer /health
+SERVER_START_TIMEOUT = 60
+
+def sized(sample: str, size: int) -> str:
+    """Repeat sample to exactly size characters"""
+    return (sample * (size // len(sample) + 1))[:size]
+
+def translate_scenario(size: int, standard: str, reverse: bool = False,
+                       metadata: bool = False) -> Callable[[random.Random], Dict]:
+    """Build translate payloads; a random tail keeps the server's cache out of the measurement"""
+    def payload(rng: random.Random) -> Dict:
+        if reverse:
+            text = sized(SAMPLE_BRAILLE, size) + ''.join(chr(0x2801 + rng.randrange(63)) for _ in range(4))
+        else:
+            text = f"{sized(SAMPLE_TEXT, size)} {rng.randrange(10 ** 9)}"
+        return {"text": text, "standard": standard, "reverse": reverse,
+                "format_output": not reverse, "include_metadata": metadata}
+    return payload
+
+# Request mixes: (scenario, weight, method, path, payload builder or None)
+MIXES: Dict[str, List[Tuple[str, int, str, str, Optional[Callable[[random.Random], Dict]]]]] = {
+    "realistic": [
+        ("short-grade1", 30, "POST", "/api/braille/translate", translate_scenario(40, "grade1")),
+        ("short-grade2-metadata", 20, "POST", "/api/braille/translate", translate_scenario(40, "grade2", metadata=True)),
+        ("paragraph-grade2", 15, "POST", "/api/braille/translate", translate_scenario(600, "grade2")),
+        ("long-grade1-metadata", 5, "POST", "/api/braille/translate", translate_scenario(5000, "grade1", metadata=True)),
+        ("long-grade2", 5, "POST", "/api/braille/translate", translate_scenario(5000, "grade2")),
+        ("reverse-grade1", 10, "POST", "/api/braille/translate", translate_scenario(60, "grade1", reverse=True)),
+        ("reverse-grade2-metadata", 5, "POST", "/api/braille/translate", translate_scenario(300, "grade2", reverse=True, metadata=True)),
+        ("standards", 5, "GET", "/api/braille/standards", None),
+        ("health", 5, "GET", "/health", None),
+    ],
+}
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def summarize(latencies: List[float], statuses: Dict[str, int], duration: float) -> Dict:
+    """Throughput and latency percentiles for one group of requests"""
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / duration, 1) if duration > 0 else 0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies, default=0) * 1000, 2),
+        },
+        "statuses": statuses,
+    }
+
+def slow_client(url: str, stop: threading.Event, interval: float = 0.5):
+    """Hold a connection open by sending a JSON body one byte per interval"""
+    parsed = urlparse(url)
+    body = json.dumps({"text": SAMPLE_TEXT}).encode('utf-8')
+    while not stop.is_set():
+        try:
+            with socket.create_connection((parsed.hostname, parsed.port or 80), timeout=30) as sock:
+                sock.sendall((f"POST /api/braille/translate HTTP/1.1\r\n"
+                              f"Host: {parsed.netloc}\r\n"
+                              f"Content-Type: application/json\r\n"
+                              f"Content-Length: {len(body)}\r\n\r\n").encode('ascii'))
+                for byte in body:
+                    if stop.wait(interval):
+                        return
+                    sock.sendall(bytes([byte]))
+                sock.recv(65536)
+        except OSError:
+            if stop.wait(interval):
+                return
+
+def run_load_test(url: str, concurrency: int = 32, total_requests: int = 2000,
+                  text_size: int = 200, standard: str = 'grade2', slow_clients: int = 0,
+                  mix: str = 'translate', rate: float = 0.0, seed: int = 0) -> Dict:
+    """Send total_requests from concurrency threads and summarise latency per endpoint
+
+    The 'translate' mix sends text_size characters of the given standard;
+    other mixes come from MIXES. A rate above zero schedules requests
+    open-loop at that many per second.
+    """
+    base = url.rstrip('/')
+    if mix == 'translate':
+        scenarios = [("translate", 1, "POST", "/api/braille/translate",
+                      translate_scenario(text_size, standard))]
+    else:
+        scenarios = MIXES[mix]
+
+    # Pick every request up front so all compared runs send the same sequence
+    rng = random.Random(seed)
+    weights = [scenario[1] for scenario in scenarios]
+    plan = rng.choices(scenarios, weights=weights, k=total_requests)
+
+    samples: List[Tuple[str, str, str, float]] = []  # scenario, endpoint, status, seconds
+    lock = threading.Lock()
+    work: "queue.Queue[Optional[Tuple[int, float]]]" = queue.Queue()
+
+    def worker(worker_id: int):
+        session = requests.Session()
+        worker_rng = random.Random(seed * 1000 + worker_id)
+        while True:
+            item = work.get()
+            if item is None:
+                return
+            index, scheduled = item
+            name, _, method, path, build = plan[index]
+            payload = build(worker_rng) if build is not None else None
+            started = scheduled if rate > 0 else time.perf_counter()
+            try:
+                response = session.request(method, base + path, json=payload, timeout=60)
+                status = str(response.status_code)
+            except requests.RequestException as e:
+                status = type(e).__name__
+            elapsed = time.perf_counter() - started
+            with lock:
+                samples.append((name, f"{method} {path}", status, elapsed))
+
+    stop = threading.Event()
+    slow = [threading.Thread(target=slow_client, args=(url, stop), daemon=True)
+            for _ in range(slow_clients)]
+    for thread in slow:
+        thread.start()
+    time.sleep(1 if slow_clients else 0)  # Let slow clients occupy their connections
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    if rate > 0:
+        # Open loop: arrivals follow the schedule even when the server falls behind
+        arrival_rng = random.Random(seed + 1)
+        due = started
+        for index in range(total_requests):
+            due += arrival_rng.expovariate(rate)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            work.put((index, due))
+    else:
+        for index in range(total_requests):
+            work.put((index, 0.0))
+    for _ in threads:
+        work.put(None)
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+    stop.set()
+
+    def group(key_index: int) -> Dict[str, Dict]:
+        grouped: Dict[str, Tuple[List[float], Dict[str, int]]] = {}
+        for sample in samples:
+            latencies, statuses = grouped.setdefault(sample[key_index], ([], {}))
+            latencies.append(sample[3])
+            statuses[sample[2]] = statuses.get(sample[2], 0) + 1
+        return {key: summarize(latencies, statuses, duration)
+                for key, (latencies, statuses) in sorted(grouped.items())}
+
+    statuses: Dict[str, int] = {}
+    for sample in samples:
+        statuses[sample[2]] = statuses.get(sample[2], 0) + 1
+    overall = summarize([sample[3] for sample in samples], statuses, duration)
+    return {
+        "url": url,
+        "mix": mix,
+        "concurrency": concurrency,
+        "rate": rate or None,
+        "slow_clients": slow_clients,
+        "requests": overall["requests"],
+        "duration_s": round(duration, 3),
+        "throughput_rps": overall["throughput_rps"],
+        "latency_ms": overall["latency_ms"],
+        "statuses": overall["statuses"],
+        "endpoints": group(1),
+        "scenarios": group(0),
+    }
+
+def free_port() -> int:
+    """A TCP port that is free right now on localhost"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def server_command(mode: str, workers: int, port: int) -> List[str]:
+    """Command line that serves the API in the given mode on port"""
+    if mode == 'flask':
+        # Flask's threaded development server; it has a single process
+        return [sys.executable, '-m', 'flask', '--app', 'braille_api', 'run',
+                '--host', '127.0.0.1', '--port', str(port), '--no-reload', '--no-debugger']
+    if mode == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', '--workers', str(workers), '--threads', '4',
+                '--bind', f'127.0.0.1:{port}', 'braille_api:app']
+    if mode == 'asgi':
+        return [sys.executable, '-m', 'uvicorn', 'braille_asgi:app', '--host', '127.0.0.1',
+                '--port', str(port), '--workers', str(workers), '--log-level', 'warning']
+    raise ValueError(f"Unknown server mode: {mode} (use flask, gunicorn or asgi)")
+
+def parse_server_spec(spec: str) -> Tuple[str, int]:
+    """Split MODE[:WORKERS] into its parts"""
+    mode, _, workers = spec.partition(':')
+    return mode, int(workers) if workers else 1
+
+@contextmanager
+def local_server(mode: str, workers: int = 1) -> Iterator[str]:
+    """Start the API in the given mode, yield its base URL and stop it afterwards"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    log = tempfile.TemporaryFile()
+    process = subprocess.Popen(server_command(mode, workers, port),
+                               cwd=os.path.dirname(os.path.abspath(__file__)),
+                               stdout=log, stderr=subprocess.STDOUT)
+    try:
+        deadline = time.time() + SERVER_START_TIMEOUT
+        while True:
+            if process.poll() is not None:
+                log.seek(0)
+                raise RuntimeError(f"{mode} server exited during startup:\n"
+                                   f"{log.read().decode('utf-8', 'replace')[-2000:]}")
+            try:
+                if requests.get(url + '/health', timeout=2).status_code == 200:
+                    break
+            except requests.RequestException:
+                pass
+            if time.time() > deadline:
+                raise RuntimeError(f"{mode} server did not answer /health within {SERVER_START_TIMEOUT}s")
+            time.sleep(0.2)
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        log.close()
+
+def print_comparison(results: List[Dict]):
+    """Print compared runs as a table on stderr"""
+    print(f"{'server':<14}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}", file=sys.stderr)
+    for result in results:
+        errors = sum(count for status, count in result["statuses"].items() if not status.startswith('2'))
+        latency = result["latency_ms"]
+        print(f"{result['server']:<14}{result['throughput_rps']:>9}{latency['p50']:>10}"
+              f"{latency['p95']:>10}{latency['p99']:>10}{errors:>8}", file=sys.stderr)
+
+def main():
+    """Main entry point for command line usage"""
+    parser = argparse.ArgumentParser(description="Load test a Braille Translation API server.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default="http://localhost:5000", help="Base URL of a running server")
+    target.add_argument("--server", metavar="MODE[:WORKERS]",
+                        help="Start a local server first: flask, gunicorn or asgi, e.g. gunicorn:4")
+    target.add_argument("--compare", nargs='+', metavar="MODE[:WORKERS]",
+                        help="Run the same load against each local server in turn")
+    parser.add_argument("--mix", default="realistic", choices=["translate"] + sorted(MIXES),
+                        help="Request mix (default realistic; 'translate' sends one request shape)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent client threads (default 32)")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests (default 2000)")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="Open-loop arrival rate in requests per second (default: closed loop)")
+    parser.add_argument("--text-size", type=int, default=200, help="Characters per request for --mix translate")
+    parser.add_argument("--standard", default="grade2", help="Braille standard for --mix translate")
+    parser.add_argument("--slow-clients", type=int, default=0, help="Connections trickling their body during the run")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the request sequence (default 0)")
+    args = parser.parse_args()
+
+    def load(url: str) -> Dict:
+        return run_load_test(url, args.concurrency, args.requests, args.text_size, args.standard,
+                             args.slow_clients, args.mix, args.rate, args.seed)
+
+    if args.compare or args.server:
+        results = []
+        for spec in args.compare or [args.server]:
+            mode, workers = parse_server_spec(spec)
+            with local_server(mode, workers) as url:
+                result = load(url)
+            results.append({"server": spec, **result})
+        if args.compare:
+            print_comparison(results)
+        print(json.dumps(results if args.compare else results[0], indent=2))
+    else:
+        print(json.dumps(load(args.url), indent=2))
+
+if __name__ == '__main__':
+    main()
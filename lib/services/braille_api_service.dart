@@ -133,7 +133,72 @@ class BrailleApiService {
     };
   }
 
+  /// Retranslates only the words touched by an edit while typing.
+  /// [braille] is the unformatted Braille of [previousText]; the returned
+  /// 'result' is the Braille of the edited text. [offset] and [deleted]
+  /// count Unicode code points (runes), not UTF-16 units.
+  static Future<Map<String, dynamic>> translateEdit({
+    required String previousText,
+    required String braille,
+    required int offset,
+    int deleted = 0,
+    String inserted = '',
+    String standard = 'grade1',
+    String language = 'en',
+  }) async {
+    for (int attempt = 0; attempt < retryAttempts; attempt++) {
+      try {
+        final response = await http.post(
+          Uri.parse('$baseUrl/api/braille/translate/incremental'),
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          body: json.encode({
+            'text': previousText,
+            'braille': braille,
+            'edit': {'offset': offset, 'deleted': deleted, 'inserted': inserted},
+            'standard': standard,
+            'language': language,
+          }),
+        ).timeout(Duration(milliseconds: timeout));
 
+        if (response.statusCode == 200) {
+          final patch = json.decode(response.body)['patch'];
+          final int start = patch['offset'];
+          final int end = start + (patch['deleted'] as int);
+          // The patch counts code points; String.replaceRange counts UTF-16 units
+          final runes = braille.runes.toList()
+            ..replaceRange(start, end, (patch['inserted'] as String).runes);
+          return {
+            'success': true,
+            'result': String.fromCharCodes(runes),
+            'patch': patch,
+          };
+        } else if (attempt == retryAttempts - 1) {
+          return {
+            'success': false,
+            'error': 'API request failed with status: ${response.statusCode}',
+            'result': braille,
+          };
+        }
+      } catch (e) {
+        if (attempt == retryAttempts - 1) {
+          return {
+            'success': false,
+            'error': 'Connection error after $retryAttempts attempts: ${e.toString()}',
+            'result': braille,
+          };
+        }
+        await Future.delayed(Duration(milliseconds: retryDelay));
+      }
+    }
+
+    return {
+      'success': false,
+      'error': 'All retry attempts failed',
+      'result': braille,
+    };
+  }
 
   /// Get supported Braille standards with timeout and retry
   static Future<Map<String, dynamic>> getSupportedStandards() async {
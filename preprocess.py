@@ -1,4 +1,5 @@
 import cv2
+import numpy as np
 import sys
 import os
 import argparse
@@ -40,7 +41,15 @@ except ImportError:
     MediaFileUpload = None
 
 import hashlib
+import mmap
+import re
+import shutil
+import struct
 import time as _time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 try:
     import smtplib
     from email.mime.text import MIMEText
@@ -98,12 +107,238 @@ def normalize_african_text(text, lang):
     # Add more language-specific normalization as needed
     return text
 
-# Example: custom Braille translation table loader
+# --- Compiled Braille tables ---
+# Layout (all integers little-endian uint32 after the header):
+#   header    magic, version, entry count, node count, edge count, pool size
+#   index     sorted codepoints of single-character keys, then (offset, length) into the pool
+#   trie      nodes as (first edge, edge count, value offset, value length) for multi-character keys
+#   edges     edge codepoints (sorted per node), then target node per edge
+#   pool      UTF-8 values
+BRAILLE_TABLE_MAGIC = b'GBT1'
+BRAILLE_TABLE_VERSION = 1
+BRAILLE_TABLE_SUFFIX = '.gbt'
+_TABLE_HEADER = struct.Struct('<4sHHIIII')
+_NO_VALUE = 0xFFFFFFFF
+
+def read_braille_table_source(table_path):
+    # Parse and validate a JSON or YAML table: a mapping of non-empty text to Braille text
+    if table_path.endswith('.yaml') or table_path.endswith('.yml'):
+        if not yaml:
+            raise ValueError('YAML tables require pyyaml. Install with pip install pyyaml')
+        with open(table_path, 'r', encoding='utf-8') as f:
+            mapping = yaml.safe_load(f)
+    else:
+        with open(table_path, 'r', encoding='utf-8') as f:
+            mapping = json.load(f)
+    if not isinstance(mapping, dict):
+        raise ValueError(f'{table_path}: table must be a mapping of text to Braille')
+    for key, value in mapping.items():
+        if not isinstance(key, str) or not key:
+            raise ValueError(f'{table_path}: invalid key {key!r}')
+        if not isinstance(value, str):
+            raise ValueError(f'{table_path}: value for {key!r} must be a string')
+    return mapping
+
+def build_braille_table_bytes(mapping):
+    # Serialize a validated mapping to the compiled table layout
+    pool = bytearray()
+    offsets = {}
+    def intern(value):
+        if value not in offsets:
+            data = value.encode('utf-8')
+            offsets[value] = (len(pool), len(data))
+            pool.extend(data)
+        return offsets[value]
+
+    singles = sorted((ord(k), intern(v)) for k, v in mapping.items() if len(k) == 1)
+
+    # Multi-character keys: build a nested trie, then flatten breadth-first
+    root = {}
+    for key, value in mapping.items():
+        if len(key) > 1:
+            node = root
+            for char in key:
+                node = node.setdefault(char, {})
+            node[''] = intern(value)
+    nodes, edge_cps, edge_nodes = [], [], []
+    queue = [root]
+    while len(nodes) < len(queue):
+        node = queue[len(nodes)]
+        children = sorted((ord(c), child) for c, child in node.items() if c)
+        value_off, value_len = node.get('', (_NO_VALUE, 0))
+        nodes.append((len(edge_cps), len(children), value_off, value_len))
+        for cp, child in children:
+            edge_cps.append(cp)
+            edge_nodes.append(len(queue))
+            queue.append(child)
+
+    out = bytearray(_TABLE_HEADER.pack(BRAILLE_TABLE_MAGIC, BRAILLE_TABLE_VERSION, 0,
+                                       len(singles), len(nodes), len(edge_cps), len(pool)))
+    out += struct.pack(f'<{len(singles)}I', *(cp for cp, _ in singles))
+    out += struct.pack(f'<{2 * len(singles)}I', *(x for _, ref in singles for x in ref))
+    out += struct.pack(f'<{4 * len(nodes)}I', *(x for node in nodes for x in node))
+    out += struct.pack(f'<{len(edge_cps)}I', *edge_cps)
+    out += struct.pack(f'<{len(edge_nodes)}I', *edge_nodes)
+    out += pool
+    return bytes(out)
+
+class _TranslateMemo(dict):
+    # Codepoint -> text cache for str.translate, filled from the compiled index on first sight
+    def __init__(self, table):
+        super().__init__()
+        self.table = table
+    def __missing__(self, cp):
+        value = self.table.lookup(cp)
+        self[cp] = value = chr(cp) if value is None else value
+        return value
+
+class BinaryBrailleTable:
+    """Read-only Braille table backed by a compiled (memory-mapped) buffer"""
+
+    def __init__(self, buffer, path=None):
+        self.path = path
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, _, n_singles, n_nodes, n_edges, pool_size = _TABLE_HEADER.unpack_from(view)
+        if magic != BRAILLE_TABLE_MAGIC or version != BRAILLE_TABLE_VERSION:
+            raise ValueError(f'{path or "buffer"}: not a compiled Braille table (version {BRAILLE_TABLE_VERSION})')
+        pos = _TABLE_HEADER.size
+        def section(count):
+            nonlocal pos
+            part = view[pos:pos + 4 * count]
+            pos += 4 * count
+            if sys.byteorder != 'little':
+                import array
+                values = array.array('I', part.tobytes())
+                values.byteswap()
+                return values
+            return part.cast('I')
+        self._keys = section(n_singles)
+        self._refs = section(2 * n_singles)
+        self._nodes = section(4 * n_nodes)
+        self._edge_cps = section(n_edges)
+        self._edge_nodes = section(n_edges)
+        self._pool = view[pos:pos + pool_size]
+        self._memo = _TranslateMemo(self)
+        self._start_re = None
+        if n_nodes and self._nodes[1]:
+            first = self._edge_cps[self._nodes[0]:self._nodes[0] + self._nodes[1]]
+            self._start_re = re.compile('[' + ''.join(re.escape(chr(cp)) for cp in first) + ']')
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        return cls(build_braille_table_bytes(mapping))
+
+    @classmethod
+    def open(cls, path):
+        # Map the artifact read-only so processes loading the same table share its pages
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path)
+
+    def _value(self, offset, length):
+        return str(self._pool[offset:offset + length], 'utf-8')
+
+    def lookup(self, cp):
+        # Single-character lookup by codepoint, None when absent
+        i = bisect_left(self._keys, cp)
+        if i < len(self._keys) and self._keys[i] == cp:
+            return self._value(self._refs[2 * i], self._refs[2 * i + 1])
+        return None
+
+    def _child(self, node, cp):
+        start, count = self._nodes[4 * node], self._nodes[4 * node + 1]
+        i = bisect_left(self._edge_cps, cp, start, start + count)
+        if i < start + count and self._edge_cps[i] == cp:
+            return self._edge_nodes[i]
+        return None
+
+    def longest_match(self, text, start):
+        # Longest multi-character key at text[start:], as (end, value) or None
+        node, best = 0, None
+        for end in range(start, len(text)):
+            node = self._child(node, ord(text[end]))
+            if node is None:
+                break
+            offset, length = self._nodes[4 * node + 2], self._nodes[4 * node + 3]
+            if offset != _NO_VALUE:
+                best = (end + 1, self._value(offset, length))
+        return best
+
+    def get(self, key, default=None):
+        if len(key) == 1:
+            value = self.lookup(ord(key))
+            return default if value is None else value
+        match = self.longest_match(key, 0) if key else None
+        return match[1] if match and match[0] == len(key) else default
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        return len(self._keys) + sum(1 for i in range(2, len(self._nodes), 4) if self._nodes[i] != _NO_VALUE)
+
+    def translate(self, text):
+        # Multi-character keys win over single characters; unknown characters pass through
+        if self._start_re is None:
+            return text.translate(self._memo)
+        out = []
+        pos = 0
+        for m in self._start_re.finditer(text):
+            i = m.start()
+            if i < pos:
+                continue
+            match = self.longest_match(text, i)
+            if match:
+                out.append(text[pos:i].translate(self._memo))
+                out.append(match[1])
+                pos = match[0]
+        out.append(text[pos:].translate(self._memo))
+        return ''.join(out)
+
+def compiled_table_path(table_path):
+    return table_path + BRAILLE_TABLE_SUFFIX
+
+def compile_braille_table(table_path, output_path=None):
+    # Validate a JSON/YAML table and write its compiled artifact atomically
+    output_path = output_path or compiled_table_path(table_path)
+    data = build_braille_table_bytes(read_braille_table_source(table_path))
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return output_path
+
+# Custom Braille translation table loader: uses the compiled artifact when it is
+# newer than the source, (re)compiling it otherwise
 def load_braille_table(table_path):
     if not table_path or not os.path.exists(table_path):
         return None
-    with open(table_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    if table_path.endswith(BRAILLE_TABLE_SUFFIX):
+        return BinaryBrailleTable.open(table_path)
+    artifact = compiled_table_path(table_path)
+    try:
+        if os.path.getmtime(artifact) >= os.path.getmtime(table_path):
+            return BinaryBrailleTable.open(artifact)
+    except (OSError, ValueError):
+        pass
+    try:
+        return BinaryBrailleTable.open(compile_braille_table(table_path, artifact))
+    except OSError as e:
+        # Read-only location: keep the compiled table in memory for this run
+        print(f"Could not write compiled table {artifact}: {e}")
+        return BinaryBrailleTable.from_mapping(read_braille_table_source(table_path))
 
 try:
     from langdetect import detect as langdetect_detect
@@ -171,6 +406,10 @@ def normalize_african_text(text, lang, script=None, normalize_hook=None):
 
 def text_to_braille(text, table=None, script=None):
     # Use custom table if provided, else fallback to Unicode Braille
+    if isinstance(table, str):
+        table = load_braille_table(table)
+    if isinstance(table, BinaryBrailleTable):
+        return table.translate(text)
     if table:
         return ''.join(table.get(c, c) for c in text)
     # Ethiopic, Tifinagh, N'Ko, Vai: fallback to transliteration if possible
@@ -213,99 +452,189 @@ def preprocess_image(input_path, output_path, method='mean', block_size=15, c=10
     except Exception as e:
         print(f"Unexpected error: {e}")
 
+# Bit set in a cell's dot pattern for a raised pixel at (dy, dx) of its block.
+# 8-dot cells cover 2x4 pixels, pixel order dy*2+dx mapping to dots
+# 1,2,3,7,4,5,6,8; 6-dot cells cover 2x3 pixels with dots 1-3 down the left
+# column and 4-6 down the right (bit n-1 is dot n, as in Unicode Braille)
+CELL_DOT_WEIGHTS = {
+    8: np.array([1 << i for i in (0, 1, 2, 6, 3, 4, 5, 7)], dtype=np.uint8).reshape(4, 2),
+    6: np.array([[1 << 0, 1 << 3], [1 << 1, 1 << 4], [1 << 2, 1 << 5]], dtype=np.uint8),
+}
+BRAILLE_DOT_WEIGHTS = CELL_DOT_WEIGHTS[8]
+
+# North American Braille ASCII (NABCC): the BRF character for each 6-dot
+# pattern, indexed by its dot bits (dot 1 = bit 0 ... dot 6 = bit 5)
+NABCC = ' A1B\'K2L@CIF/MSP"E3H9O6R^DJG>NTQ,*5<-U8V.%[$+X!&;:4\\0Z7(_?W]#Y)='
+ASCII_BRAILLE = np.frombuffer(NABCC.encode('ascii'), dtype=np.uint8).astype(np.uint32)
+
+# str.translate tables between Unicode Braille and NABCC. Dots 7 and 8 have
+# no BRF equivalent and are dropped; lowercase BRF letters read as uppercase
+UNICODE_TO_NABCC = {0x2800 + pattern: NABCC[pattern & 0x3F] for pattern in range(256)}
+NABCC_TO_UNICODE = {ord(char): chr(0x2800 + pattern) for pattern, char in enumerate(NABCC)}
+NABCC_TO_UNICODE.update({ord(char.lower()): chr(0x2800 + pattern)
+                         for pattern, char in enumerate(NABCC) if char.isalpha()})
+
+def unicode_to_brf_ascii(text):
+    # Unicode Braille to ASCII BRF; other characters (line breaks, form feeds) pass through
+    return text.translate(UNICODE_TO_NABCC)
+
+def brf_ascii_to_unicode(text):
+    # ASCII BRF to Unicode Braille; BRF spaces become blank cells (U+2800)
+    return text.translate(NABCC_TO_UNICODE)
+
+def transcode_brf_file(input_path, output_path, to='ascii', chunk_size=1 << 20):
+    # Convert a whole BRF file between Unicode Braille ('unicode') and ASCII
+    # BRF ('ascii') in chunks, keeping line endings as they are
+    if to == 'ascii':
+        convert, source_encoding, target_encoding = unicode_to_brf_ascii, 'utf-8', 'ascii'
+    elif to == 'unicode':
+        convert, source_encoding, target_encoding = brf_ascii_to_unicode, 'ascii', 'utf-8'
+    else:
+        raise ValueError(f"Unknown BRF target {to!r}, expected 'ascii' or 'unicode'")
+    with open(input_path, 'r', encoding=source_encoding, newline='') as src, \
+            open(output_path, 'w', encoding=target_encoding, newline='') as dst:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(convert(chunk))
+    print(f"Transcoded {input_path} to {to} BRF at {output_path}")
+    return output_path
+
+def cell_dots(raised, weights):
+    # uint8 dot patterns for every block of a boolean raised-pixel array, one
+    # cell per weights.shape block; partial blocks are padded with lowered dots
+    cell_h, cell_w = weights.shape
+    h, w = raised.shape
+    padded = np.pad(raised, ((0, -h % cell_h), (0, -w % cell_w)), constant_values=False)
+    rows, cols = padded.shape[0] // cell_h, padded.shape[1] // cell_w
+    # blocks[r, dy, c, dx] is pixel (dy, dx) of cell (r, c); OR-ing one weighted
+    # dot plane at a time stays in uint8 and avoids a (rows, cols, h, w) temporary
+    blocks = padded.view(np.uint8).reshape(rows, cell_h, cols, cell_w)
+    dots = np.zeros((rows, cols), dtype=np.uint8)
+    for dy in range(cell_h):
+        for dx in range(cell_w):
+            dots |= blocks[:, dy, :, dx] * weights[dy, dx]
+    return dots
+
+class BrailleCellMatrix:
+    """Dot patterns of a binary image (0/255), shared by every output writer.
+
+    Black pixels are raised dots (white ones with invert). The 8-dot and 6-dot
+    cell arrays are each computed once, on first use, so writing several
+    formats from one matrix costs one render per cell size.
+    """
+    def __init__(self, img, invert=False):
+        self.height, self.width = img.shape
+        self.invert = invert
+        self.raised = (img == 255) if invert else (img == 0)
+        self._dots = {}
+
+    def dots(self, cell_dots_count=8):
+        # (rows, cols) uint8 dot patterns for 8-dot (2x4) or 6-dot (2x3) cells
+        if cell_dots_count not in self._dots:
+            self._dots[cell_dots_count] = cell_dots(self.raised, CELL_DOT_WEIGHTS[cell_dots_count])
+        return self._dots[cell_dots_count]
+
+    def unicode(self, cell_dots_count=8):
+        # Unicode Braille code points (U+2800 + pattern) as uint32
+        return self.dots(cell_dots_count).astype(np.uint32) + 0x2800
+
+    def ascii_braille(self):
+        # NABCC (ASCII Braille) code points of the 6-dot cells
+        return ASCII_BRAILLE[self.dots(6)]
+
+def as_cell_matrix(img, invert=False):
+    # Writers accept a binary image or a BrailleCellMatrix (whose own invert applies)
+    return img if isinstance(img, BrailleCellMatrix) else BrailleCellMatrix(img, invert)
+
+def grid_text(codes, eol='\n', width=None, fill=' '):
+    # Text of a (rows, cols) array of code points, each row cut or padded to
+    # width and ended with eol, decoded in one go; the last row has no eol
+    rows, cols = codes.shape
+    if rows == 0:
+        return ''
+    width = cols if width is None else width
+    grid = np.full((rows, width + len(eol)), ord(fill), dtype='<u4')
+    grid[:, :min(width, cols)] = codes[:, :width]
+    for i, char in enumerate(eol):
+        grid[:, width + i] = ord(char)
+    return grid.tobytes().decode('utf-32-le')[:-len(eol)]
+
+def braille_cells(img):
+    # Code points (U+2800 + dots) for every 2x4 block of a binary image (0/255),
+    # as a (rows, cols) uint32 array; partial blocks are padded with white
+    return as_cell_matrix(img).unicode(8)
+
+def render_braille_text(img):
+    # Unicode Braille text for a binary image, one line per 4 pixel rows
+    return grid_text(braille_cells(img))
+
 def image_to_braille(img, txt_output_path):
     # Convert a binary image (0/255) to Unicode Braille text
     # Each Braille char represents a 2x4 pixel block
-    braille_base = 0x2800
-    h, w = img.shape
-    lines = []
-    for y in range(0, h, 4):
-        line = ''
-        for x in range(0, w, 2):
-            dots = 0
-            for dy in range(4):
-                for dx in range(2):
-                    yy, xx = y + dy, x + dx
-                    if yy < h and xx < w:
-                        # Braille dot order: 1,2,3,7,4,5,6,8
-                        dot_idx = [0,1,2,6,3,4,5,7][dy*2+dx]
-                        if img[yy, xx] == 0:  # black pixel = raised dot
-                            dots |= 1 << dot_idx
-            line += chr(braille_base + dots)
-        lines.append(line)
     with open(txt_output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+        f.write(render_braille_text(img))
     print(f"Braille text output saved to {txt_output_path}")
 
-def image_to_ascii(img, txt_output_path, invert=False):
-    # Convert a binary image (0/255) to ASCII art
-    chars = ['#', ' '] if not invert else [' ', '#']
-    h, w = img.shape
-    lines = []
-    for y in range(h):
-        line = ''.join(chars[0] if img[y, x] == 0 else chars[1] for x in range(w))
-        lines.append(line)
-    with open(txt_output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+# ASCII art byte for each pixel value: '#' for black (0), ' ' otherwise; the
+# inverted table swaps them. RAISED_ASCII_ART maps a raised-pixel mask (0/1)
+ASCII_ART_BYTES = np.full(256, ord(' '), dtype=np.uint8)
+ASCII_ART_BYTES[0] = ord('#')
+ASCII_ART_INVERTED_BYTES = np.full(256, ord('#'), dtype=np.uint8)
+ASCII_ART_INVERTED_BYTES[0] = ord(' ')
+RAISED_ASCII_ART = np.array([ord(' '), ord('#')], dtype=np.uint8)
+
+# Output bytes buffered per band of rows when writing ASCII art
+ASCII_ART_BAND_BYTES = 16 * 1024 * 1024
+
+def ascii_art_band(pixels, table):
+    # ASCII art bytes for a band of rows, each ended with a newline, as a
+    # (rows, width + 1) uint8 array built with one table lookup
+    if pixels.dtype != np.uint8:
+        pixels = (pixels != 0).view(np.uint8)  # Any non-zero value reads as white
+    rows, width = pixels.shape
+    band = np.empty((rows, width + 1), dtype=np.uint8)
+    np.take(table, pixels, out=band[:, :width])
+    band[:, width] = ord('\n')
+    return band
+
+def write_ascii_art(pixels, f, table=ASCII_ART_BYTES, band_rows=None):
+    # Write ASCII art for a 2D array (which may be a np.memmap) to a binary file,
+    # one band of rows at a time, so only one band is ever held as output
+    height, width = pixels.shape
+    if band_rows is None:
+        band_rows = max(1, ASCII_ART_BAND_BYTES // (width + 1))
+    for top in range(0, height, band_rows):
+        band = ascii_art_band(pixels[top:top + band_rows], table)
+        data = band.reshape(-1).data
+        # No newline after the last row, as in a '\n'.join of the lines
+        f.write(data[:-1] if top + band_rows >= height else data)
+
+def image_to_ascii(img, txt_output_path, invert=False, band_rows=None):
+    # Convert a binary image (0/255) to ASCII art, written as raw bytes in bands of rows
+    if isinstance(img, BrailleCellMatrix):
+        pixels, table = img.raised.view(np.uint8), RAISED_ASCII_ART
+    else:
+        pixels, table = img, ASCII_ART_INVERTED_BYTES if invert else ASCII_ART_BYTES
+    with open(txt_output_path, 'wb') as f:
+        write_ascii_art(pixels, f, table, band_rows)
     print(f"ASCII art output saved to {txt_output_path}")
 
 def image_to_brf(img, brf_output_path, line_length=40, header=None, footer=None, invert=False):
     # Convert a binary image (0/255) to BRF (Braille Ready Format) text
-    braille_base = 0x2800
-    h, w = img.shape
-    lines = []
-    if header:
-        lines.append(header)
-    for y in range(0, h, 4):
-        line = ''
-        for x in range(0, w, 2):
-            dots = 0
-            for dy in range(4):
-                for dx in range(2):
-                    yy, xx = y + dy, x + dx
-                    if yy < h and xx < w:
-                        dot_idx = [0,1,2,6,3,4,5,7][dy*2+dx]
-                        pixel = img[yy, xx]
-                        if (pixel == 0 and not invert) or (pixel == 255 and invert):
-                            dots |= 1 << dot_idx
-        # Pad or trim to line_length
-        if len(line) < line_length:
-            line = line.ljust(line_length)
-        else:
-            line = line[:line_length]
-        lines.append(line)
-    if footer:
-        lines.append(footer)
+    # One Unicode 8-dot cell per 2x4 block, each line padded or trimmed to line_length
+    body = grid_text(as_cell_matrix(img, invert).unicode(8), eol='\r\n', width=line_length)
+    lines = ([header] if header else []) + ([body] if body else []) + ([footer] if footer else [])
     # Write with CRLF endings
-    with open(brf_output_path, 'w', encoding='utf-8', newline='\r\n') as f:
+    with open(brf_output_path, 'w', encoding='utf-8', newline='') as f:
         f.write('\r\n'.join(lines))
     print(f"BRF Braille output saved to {brf_output_path}")
 
 def binary_to_ascii_braille(img, line_length=40, invert=False):
-    # Map 2x3 blocks to ASCII Braille (BRF) chars (dots 1-6)
-    # Dots: 1=a, 2=b, ..., 26=z, 27='{' ... 63='?'
-    ascii_braille = [chr(i) for i in range(0x61, 0x7B)] + [chr(i) for i in range(0x7B, 0x7B+37)]
-    h, w = img.shape
-    lines = []
-    for y in range(0, h, 3):
-        line = ''
-        for x in range(0, w, 2):
-            dots = 0
-            for dy in range(3):
-                for dx in range(2):
-                    yy, xx = y + dy, x + dx
-                    if yy < h and xx < w:
-                        dot_idx = dy*2+dx
-                        pixel = img[yy, xx]
-                        if (pixel == 0 and not invert) or (pixel == 255 and invert):
-                            dots |= 1 << dot_idx
-            line += ascii_braille[dots] if dots < len(ascii_braille) else '?'
-        if len(line) < line_length:
-            line = line.ljust(line_length)
-        else:
-            line = line[:line_length]
-        lines.append(line)
-    return lines
+    # Map 2x3 blocks to North American ASCII Braille (BRF) chars (dots 1-6), one line per cell row
+    text = grid_text(as_cell_matrix(img, invert).ascii_braille(), width=line_length)
+    return text.split('\n') if text else []
 
 def image_to_brf_ascii(img, brf_output_path, line_length=40, header=None, footer=None, invert=False, page_break=None, margin_top=0, margin_bottom=0, margin_left=0, margin_right=0, line_numbers=False, legend=False):
     # Output ASCII Braille BRF with advanced options
@@ -329,11 +658,217 @@ def image_to_brf_ascii(img, brf_output_path, line_length=40, header=None, footer
     if footer:
         lines.append(footer)
     if legend:
-        lines.append('ASCII Braille legend: a=dot1, b=dot2, ...')
-    with open(brf_output_path, 'w', encoding='ascii', newline='\r\n') as f:
+        lines.append('ASCII Braille legend: North American Braille ASCII (NABCC), A=dot1, 1=dot2, B=dots12, ...')
+    with open(brf_output_path, 'w', encoding='ascii', newline='') as f:
         f.write('\r\n'.join(lines))
     print(f"ASCII BRF Braille output saved to {brf_output_path}")
 
+# Streamed output formats: pixel rows per cell row and line ending
+STREAM_FORMATS = {
+    'braille': (4, '\n'),
+    'brf': (4, '\r\n'),
+    'brf-ascii': (3, '\r\n'),
+    'ascii': (1, '\n'),
+}
+
+_PGM_TOKEN = re.compile(rb'(?:\s|#[^\n]*\n)*(\S+)')
+
+def _raw_image_layout(path):
+    # (height, width, dtype, data offset) of an uncompressed .npy or binary PGM
+    # (P5) file, or None when rows cannot be read straight from the file
+    ext = Path(path).suffix.lower()
+    with open(path, 'rb') as f:
+        if ext == '.npy':
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            else:
+                return None
+            if fortran_order or len(shape) != 2 or dtype.hasobject:
+                return None
+            return shape[0], shape[1], dtype, f.tell()
+        if ext in ('.pgm', '.pnm') and f.read(2) == b'P5':
+            f.seek(0)
+            head = f.read(4096)
+            tokens, pos = [], 0
+            while len(tokens) < 4:
+                match = _PGM_TOKEN.match(head, pos)
+                if not match:
+                    raise ValueError(f"Truncated PGM header in {path}")
+                tokens.append(match.group(1))
+                pos = match.end()
+            width, height, maxval = (int(token) for token in tokens[1:])
+            # 16-bit PGM is left to _pnm_strip_reader, which scales it to 8 bits
+            if maxval > 255:
+                return None
+            # One whitespace byte separates the header from the pixels
+            return height, width, np.dtype(np.uint8), pos + 1
+    return None
+
+# Netpbm converters that decode these formats row by row to PNM on stdout
+PNM_CONVERTERS = {
+    '.png': 'pngtopnm',
+    '.tif': 'tifftopnm',
+    '.tiff': 'tifftopnm',
+    '.jpg': 'jpegtopnm',
+    '.jpeg': 'jpegtopnm',
+}
+
+def _pnm_token(stream):
+    # Next whitespace-separated PNM header token, skipping comments; consumes
+    # the single whitespace byte after it
+    c = stream.read(1)
+    while c.isspace() or c == b'#':
+        if c == b'#':
+            stream.readline()
+        c = stream.read(1)
+    token = b''
+    while c and not c.isspace():
+        token += c
+        c = stream.read(1)
+    return token
+
+def _pnm_strip_reader(stream, path):
+    # (height, width, read) for a binary PBM, PGM or PPM (P4, P5, P6) stream read
+    # front to back, so it also works on pipes; read(top, bottom) must be called
+    # for consecutive strips from the top and returns 8-bit grayscale rows
+    magic = _pnm_token(stream)
+    if magic not in (b'P4', b'P5', b'P6'):
+        raise ValueError(f"{path} did not decode to a binary PNM image")
+    try:
+        width, height = int(_pnm_token(stream)), int(_pnm_token(stream))
+        maxval = 1 if magic == b'P4' else int(_pnm_token(stream))
+    except ValueError:
+        raise ValueError(f"Truncated PNM header in {path}")
+    channels = 3 if magic == b'P6' else 1
+    dtype = np.dtype(np.uint8 if maxval < 256 else '>u2')
+    row_bytes = (width + 7) // 8 if magic == b'P4' else width * channels * dtype.itemsize
+    next_top = [0]
+
+    def read(top, bottom):
+        if top != next_top[0]:
+            raise ValueError(f"{path} can only be read in order from the top")
+        bottom = min(bottom, height)
+        next_top[0] = bottom
+        data = stream.read((bottom - top) * row_bytes)
+        if len(data) != (bottom - top) * row_bytes:
+            raise ValueError(f"{path} is shorter than its header says")
+        if magic == b'P4':
+            bits = np.unpackbits(np.frombuffer(data, np.uint8).reshape(bottom - top, row_bytes), axis=1)
+            return np.where(bits[:, :width], np.uint8(0), np.uint8(255))  # 1 is black
+        rows = np.frombuffer(data, dtype).reshape(bottom - top, width, channels)
+        if maxval != 255:
+            rows = ((rows.astype(np.uint32) * 255 + maxval // 2) // maxval).astype(np.uint8)
+        if channels == 3:
+            return cv2.cvtColor(np.ascontiguousarray(rows), cv2.COLOR_RGB2GRAY)
+        return rows[:, :, 0]
+    return height, width, read
+
+@contextmanager
+def open_image_strips(path):
+    # Yields (height, width, read), where read(top, bottom) returns those image
+    # rows as a grayscale array; strips must be read in order from the top.
+    # Peak memory follows the strip size for .npy and binary PBM/PGM/PPM files
+    # and, when Netpbm is installed, for PNG, TIFF and JPEG (decoded row by row
+    # through PNM_CONVERTERS). Anything else is decoded whole by OpenCV
+    ext = Path(path).suffix.lower()
+    layout = _raw_image_layout(path)
+    if layout is not None:
+        height, width, dtype, offset = layout
+
+        def read(top, bottom):
+            bottom = min(bottom, height)
+            with open(path, 'rb') as f:
+                f.seek(offset + top * width * dtype.itemsize)
+                rows = np.fromfile(f, dtype=dtype, count=(bottom - top) * width)
+            if rows.size != (bottom - top) * width:
+                raise ValueError(f"{path} is shorter than its header says")
+            return rows.reshape(bottom - top, width)
+        yield height, width, read
+        return
+    if ext in ('.pbm', '.pgm', '.ppm', '.pnm'):
+        with open(path, 'rb') as f:
+            if f.read(2) in (b'P4', b'P5', b'P6'):  # Plain (ASCII) PNM is left to OpenCV
+                f.seek(0)
+                yield _pnm_strip_reader(f, path)
+                return
+    converter = shutil.which(PNM_CONVERTERS[ext]) if ext in PNM_CONVERTERS else None
+    if converter is not None:
+        proc = subprocess.Popen([converter, path], stdout=subprocess.PIPE)
+        try:
+            yield _pnm_strip_reader(proc.stdout, path)
+        finally:
+            # Stops the converter early if rendering failed or it has more pages
+            proc.stdout.close()
+            proc.terminate()
+            proc.wait()
+        return
+    if ext in PNM_CONVERTERS:
+        print(f"{PNM_CONVERTERS[ext]} (Netpbm) not found, decoding {path} whole")
+    pixels = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if pixels is None:
+        raise ValueError(f"Could not read image {path}")
+    yield pixels.shape[0], pixels.shape[1], lambda top, bottom: pixels[top:bottom]
+
+def render_strip(strip, fmt, threshold=None, invert=False, line_length=40):
+    # Output bytes for one strip of image rows in a STREAM_FORMATS format, with
+    # every line ended; strips must start on a cell boundary
+    if threshold is not None:
+        _, strip = cv2.threshold(np.ascontiguousarray(strip), threshold, 255, cv2.THRESH_BINARY)
+    if fmt == 'ascii':
+        return ascii_art_band(strip, ASCII_ART_INVERTED_BYTES if invert else ASCII_ART_BYTES).tobytes()
+    cells = BrailleCellMatrix(strip, invert)
+    eol = STREAM_FORMATS[fmt][1]
+    if fmt == 'braille':
+        return (grid_text(cells.unicode(8), eol) + eol).encode('utf-8')
+    if fmt == 'brf':
+        return (grid_text(cells.unicode(8), eol, width=line_length) + eol).encode('utf-8')
+    return (grid_text(cells.ascii_braille(), eol, width=line_length) + eol).encode('ascii')
+
+def stream_render_image(input_path, output_path, fmt='braille', threshold=None, invert=False,
+                        line_length=40, header=None, footer=None, strip_cells=256, workers=None):
+    # Render an image in horizontal strips of strip_cells cell rows on a thread
+    # pool (OpenCV and NumPy release the GIL), writing each strip's lines once
+    # it and every strip above it are done. Strips are read in order on this
+    # thread and at most 2 * workers are in flight, so peak memory follows the
+    # strip size rather than the image size for the inputs open_image_strips
+    # reads in strips. Output matches the whole-image writers
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"Unknown stream format {fmt!r}, expected one of {', '.join(STREAM_FORMATS)}")
+    cell_rows, eol = STREAM_FORMATS[fmt]
+    strip_rows = max(1, strip_cells) * cell_rows
+    workers = workers or min(4, os.cpu_count() or 1)
+
+    encoding = 'ascii' if fmt == 'brf-ascii' else 'utf-8'
+    with open_image_strips(input_path) as (height, width, read), \
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix='braille-strip') as pool, \
+            open(output_path, 'wb') as f:
+        separate = False  # Whether a line ending is due before more output
+        if header:
+            f.write(header.encode(encoding))
+            separate = True
+        if height and separate:
+            f.write(eol.encode(encoding))
+        pending = deque()
+        for top in range(0, height, strip_rows):
+            strip = read(top, top + strip_rows)
+            pending.append(pool.submit(render_strip, strip, fmt, threshold, invert, line_length))
+            if len(pending) >= 2 * workers:
+                f.write(pending.popleft().result())
+        while pending:
+            f.write(pending.popleft().result())
+        # No line ending after the last row, as in the whole-image writers
+        if height:
+            f.truncate(f.tell() - len(eol))
+            f.seek(0, os.SEEK_END)
+            separate = True
+        if footer:
+            f.write(((eol if separate else '') + footer).encode(encoding))
+    print(f"Streamed {fmt} output of {width}x{height} image to {output_path}")
+    return output_path
+
 def brf_add_embosser_settings(brf_path, embosser_name=None, chars_per_line=None, lines_per_page=None):
     # Insert embosser settings as a header in the BRF file
     settings = []
@@ -344,22 +879,24 @@ def brf_add_embosser_settings(brf_path, embosser_name=None, chars_per_line=None,
     if lines_per_page:
         settings.append(f";LINES_PER_PAGE: {lines_per_page}")
     if settings:
-        with open(brf_path, 'r', encoding='ascii') as f:
+        # UTF-8 covers both --to-brf (Unicode cells) and --to-brf-ascii files
+        with open(brf_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        with open(brf_path, 'w', encoding='ascii', newline='\r\n') as f:
-            f.write('\r\n'.join(settings) + '\r\n' + content)
+        with open(brf_path, 'w', encoding='utf-8', newline='\r\n') as f:
+            f.write('\n'.join(settings) + '\n' + content)
         print(f"Embosser settings added to {brf_path}")
 
 def brf_split_pages(brf_path, output_dir, lines_per_page=25):
     # Split a BRF file into multiple files, one per page
-    with open(brf_path, 'r', encoding='ascii') as f:
+    # UTF-8 covers both --to-brf (Unicode cells) and --to-brf-ascii files
+    with open(brf_path, 'r', encoding='utf-8') as f:
         lines = f.read().splitlines()
     page = 1
     for i in range(0, len(lines), lines_per_page):
         page_lines = lines[i:i+lines_per_page]
         out_path = os.path.join(output_dir, f"page_{page:03d}.brf")
-        with open(out_path, 'w', encoding='ascii', newline='\r\n') as f:
-            f.write('\r\n'.join(page_lines))
+        with open(out_path, 'w', encoding='utf-8', newline='\r\n') as f:
+            f.write('\n'.join(page_lines))
         print(f"Wrote {out_path}")
         page += 1
 
@@ -438,13 +975,18 @@ def full_automated_workflow(args):
         print(f"Scanned image saved to {scan_path}")
     # 2. Preprocess
     preprocess_image(args.input_image, args.output_image, args.method, args.block_size, args.c, args.skip_gray)
-    # 3. Generate BRF (Unicode or ASCII)
+    # 3. Generate BRF (Unicode or ASCII) and text outputs from one cell matrix
     img = cv2.imread(args.output_image, cv2.IMREAD_GRAYSCALE)
     if img is not None:
         _, binary = cv2.threshold(img, args.braille_thresh, 255, cv2.THRESH_BINARY)
+        cells = BrailleCellMatrix(binary, invert=args.invert)
+        if getattr(args, 'to_braille', None):
+            image_to_braille(cells, args.to_braille)
+        if getattr(args, 'to_ascii', None):
+            image_to_ascii(cells, args.to_ascii)
         if args.to_brf:
             image_to_brf(
-                binary,
+                cells,
                 args.to_brf,
                 line_length=args.brf_linelength,
                 header=args.brf_header,
@@ -453,7 +995,7 @@ def full_automated_workflow(args):
             )
         if args.to_brf_ascii:
             image_to_brf_ascii(
-                binary,
+                cells,
                 args.to_brf_ascii,
                 line_length=args.brf_linelength,
                 header=args.brf_header,
@@ -1062,7 +1604,13 @@ if __name__ == "__main__":
     parser.add_argument('--webhook-event', metavar='URL', help='Webhook URL to notify on all major events')
     parser.add_argument('--results-dir', metavar='DIR', help='Save all outputs to a timestamped subdir of DIR')
     parser.add_argument('--lang', metavar='LANG', default='en', help='Language code for OCR/Braille (e.g. sw, yo, am, zu, ig, af, so, sn, st, tn, ts, ve, xh, rw, ln, kg, ss, ny, bm, wo, mg, ti, om, lg, lu, kr, ee, ff)')
-    parser.add_argument('--braille-table', metavar='JSON', help='Custom Braille translation table (JSON)')
+    parser.add_argument('--braille-table', metavar='JSON', help='Custom Braille translation table (JSON/YAML, compiled on first use)')
+    parser.add_argument('--compile-braille-table', metavar='TABLE', help='Validate a JSON/YAML Braille table, write its compiled .gbt artifact and exit')
+    parser.add_argument('--brf-to-ascii', nargs=2, metavar=('UNICODE_BRF', 'ASCII_BRF'), help='Transcode a Unicode Braille BRF file to North American ASCII Braille and exit')
+    parser.add_argument('--brf-to-unicode', nargs=2, metavar=('ASCII_BRF', 'UNICODE_BRF'), help='Transcode an ASCII Braille BRF file to Unicode Braille and exit')
+    parser.add_argument('--stream-render', nargs=2, metavar=('FORMAT', 'OUTPUT'), help='Render input_image strip by strip to OUTPUT (braille, brf, brf-ascii or ascii) and exit. Memory stays bounded for .npy and binary PBM/PGM/PPM inputs, and for PNG, TIFF and JPEG when Netpbm (pngtopnm, tifftopnm, jpegtopnm) is installed; other inputs are decoded whole')
+    parser.add_argument('--strip-cells', type=int, default=256, help='Cell rows per strip for --stream-render (default 256)')
+    parser.add_argument('--stream-workers', type=int, default=None, help='Threads rendering strips for --stream-render (default: CPU count, at most 4)')
     parser.add_argument('--output-lang', action='store_true', help='Output detected language and script')
     parser.add_argument('--script', metavar='SCRIPT', help='Script name for OCR/Braille (e.g. Ethiopic, Tifinagh, Nko, Vai, Latin)')
     parser.add_argument('--normalize-hook', metavar='PY', help='Custom Python script for text normalization')
@@ -1158,6 +1706,35 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    if args.compile_braille_table:
+        try:
+            artifact = compile_braille_table(args.compile_braille_table)
+        except (OSError, ValueError) as e:
+            print(f"Table compilation failed: {e}")
+            sys.exit(1)
+        print(f"Compiled Braille table written to {artifact}")
+        sys.exit(0)
+
+    if args.brf_to_ascii or args.brf_to_unicode:
+        source, target = args.brf_to_ascii or args.brf_to_unicode
+        try:
+            transcode_brf_file(source, target, to='ascii' if args.brf_to_ascii else 'unicode')
+        except (OSError, UnicodeError) as e:
+            print(f"BRF transcoding failed: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    if args.stream_render:
+        fmt, output = args.stream_render
+        try:
+            stream_render_image(args.input_image, output, fmt, threshold=args.braille_thresh, invert=args.invert,
+                                line_length=args.brf_linelength, strip_cells=args.strip_cells,
+                                workers=args.stream_workers)
+        except (OSError, ValueError) as e:
+            print(f"Streamed rendering failed: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
     # Hardware detection and selection
     available_hw = detect_hardware()
     print(f"Available hardware: {available_hw}")
@@ -0,0 +1,31 @@
+import contextlib
+import io
+import os
+import sys
+
+import pytest
+
+# The API modules live at the repository root; make them importable when
+# pytest is run without `python -m`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from braille_api import BrailleTranslator  # noqa: E402
+
+@pytest.fixture(scope='session')
+def translator():
+    # No result caches or worker processes, so every call runs the engine
+    return BrailleTranslator(cache_max_bytes=0, disk_cache_path=None, offload_workers=0)
+
+@pytest.fixture
+def client():
+    # The Flask app and its module-level translator, as deployed
+    import braille_api
+    return braille_api.app.test_client()
+
+@pytest.fixture(scope='session')
+def preprocess():
+    # The image pipeline needs OpenCV and reports optional components on import
+    pytest.importorskip('cv2')
+    with contextlib.redirect_stdout(io.StringIO()):
+        import preprocess
+    return preprocess
@@ -0,0 +1,27 @@
+"""Random inputs for the equivalence tests; seeded by each test for reproducibility"""
+
+import random
+
+# Words with and without contractions, numbers, punctuation and case
+FUZZ_WORDS = (
+    "the and for of with you child bread eat sea sing ingot offer knowledge "
+    "thee rabbit accept add off egg ear ahead 123 7 2024 Hello WORLD it's ok, "
+    "done. (yes) well-known; a b c"
+).split()
+FUZZ_SPACES = (' ', ' ', ' ', '  ', '\n', '\t')
+
+def random_text(rng: random.Random, max_words: int = 12) -> str:
+    """Random words joined by random whitespace, sometimes padded at either end"""
+    parts = [rng.choice(FUZZ_SPACES)] if rng.random() < 0.2 else []
+    for _ in range(rng.randint(0, max_words)):
+        parts.append(rng.choice(FUZZ_WORDS))
+        parts.append(rng.choice(FUZZ_SPACES))
+    if parts and rng.random() < 0.7:
+        parts.pop()
+    return ''.join(parts)
+
+def random_chunks(rng: random.Random, text: str) -> list:
+    """Split text at random points, including empty chunks"""
+    cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 8)))
+    return [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
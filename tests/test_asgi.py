@@ -0,0 +1,97 @@
+"""ASGI serving mode, driven directly through the ASGI interface"""
+
+import asyncio
+import json
+
+import pytest
+
+import braille_asgi
+from braille_asgi import BrailleASGIApp
+
+@pytest.fixture
+def app():
+    app = BrailleASGIApp(workers=2, max_pending=2)
+    yield app
+    if app._executor is not None:
+        app._executor.shutdown(wait=True)
+
+def call(app, method, path, body=b'', headers=()):
+    """Send one HTTP request, returning (status, headers, body)"""
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': method, 'path': path, 'headers': list(headers)}
+    asyncio.run(app(scope, receive, send))
+    start, response = sent
+    return start['status'], dict(start['headers']), response['body']
+
+def test_health_and_listings(app):
+    status, headers, body = call(app, 'GET', '/health')
+    assert status == 200 and headers[b'content-type'] == b'application/json'
+    assert json.loads(body)['status'] == 'healthy'
+    status, _, body = call(app, 'GET', '/api/braille/standards')
+    assert status == 200 and 'grade2' in body.decode('utf-8')
+
+def test_translate(app, translator):
+    request = {'text': 'hello', 'format_output': False}
+    status, _, body = call(app, 'POST', '/api/braille/translate', json.dumps(request).encode())
+    assert status == 200
+    response = json.loads(body)
+    assert response['success'] and response['result'] == translator.text_to_braille_basic('hello', 'grade1')
+
+@pytest.mark.parametrize('body, status', [
+    (b'{not json', 400),
+    (b'', 400),
+    (json.dumps({'text': 'abc', 'standard': 'grade9'}).encode(), 400),
+])
+def test_translate_rejects_bad_requests(app, body, status):
+    assert call(app, 'POST', '/api/braille/translate', body)[0] == status
+
+def test_body_size_limit(app, monkeypatch):
+    monkeypatch.setattr(braille_asgi, 'ASGI_MAX_BODY_BYTES', 16)
+    status, _, body = call(app, 'POST', '/api/braille/translate', json.dumps({'text': 'a' * 64}).encode())
+    assert status == 413 and 'too large' in json.loads(body)['error']
+
+def test_unknown_routes_and_methods(app):
+    assert call(app, 'GET', '/nowhere')[0] == 404
+    assert call(app, 'GET', '/api/braille/translate')[0] == 405
+
+def test_metrics_are_plain_text(app):
+    call(app, 'GET', '/health')
+    status, headers, body = call(app, 'GET', '/metrics')
+    assert status == 200 and headers[b'content-type'].startswith(b'text/plain')
+    assert b'braille_http_requests_total' in body
+
+def test_busy_pool_is_refused(app):
+    app._start()
+    app._slots = asyncio.Semaphore(0)
+    status, _, body = call(app, 'POST', '/api/braille/translate', json.dumps({'text': 'hello'}).encode())
+    assert status == 503 and json.loads(body)['error'] == 'Server busy, retry later'
+
+@pytest.mark.parametrize('body', [b'[1]', b'"x"'])
+def test_translate_rejects_non_object_body(app, body):
+    status, _, response = call(app, 'POST', '/api/braille/translate', body)
+    assert status == 400 and json.loads(response)['error'] == 'Request body must be a JSON object'
+
+def test_preflight_only_for_known_paths(app):
+    status, headers, _ = call(app, 'OPTIONS', '/api/braille/translate')
+    assert status == 204 and b'POST' in headers[b'access-control-allow-methods']
+    assert call(app, 'OPTIONS', '/metrics')[0] == 204
+    assert call(app, 'OPTIONS', '/nowhere')[0] == 404
+
+def test_failing_raw_handler_is_a_recorded_500(app, monkeypatch):
+    def broken():
+        raise RuntimeError('collector exploded')
+    monkeypatch.setattr(braille_asgi, 'metrics_payload', broken)
+    status, headers, body = call(app, 'GET', '/metrics')
+    assert status == 500 and headers[b'content-type'] == b'application/json'
+    assert 'collector exploded' in json.loads(body)['error']
+    monkeypatch.undo()
+    scrape = call(app, 'GET', '/metrics')[2].decode('utf-8')
+    assert 'braille_http_requests_total{method="GET",route="/metrics",status="500"}' in scrape
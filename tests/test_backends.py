@@ -0,0 +1,90 @@
+"""Backend routing, startup probes and the circuit breaker"""
+
+import time
+
+import pytest
+
+import braille_api
+from braille_api import BackendRegistry, TranslationBackend
+
+GRADE_1 = 'grade1'
+
+class Flaky:
+    """Encoder that fails while `failing` is set, counting calls"""
+    def __init__(self):
+        self.calls = 0
+        self.failing = False
+
+    def __call__(self, text, standard, language):
+        self.calls += 1
+        if self.failing:
+            raise RuntimeError('backend down')
+        return f'flaky:{text}'
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(braille_api, 'BACKEND_FAILURE_THRESHOLD', 2)
+    monkeypatch.setattr(braille_api, 'BACKEND_COOLDOWN_SECONDS', 0.05)
+    flaky = TranslationBackend('flaky', Flaky())
+    flaky.verified.add((GRADE_1, False))
+    builtin = lambda text, standard, language: f'builtin:{text}'
+    fallback = TranslationBackend('builtin', builtin, builtin)
+    return BackendRegistry([flaky, fallback])
+
+def translate(registry):
+    return registry.translate('abc', GRADE_1, 'en', False)
+
+def test_failures_open_the_circuit(registry):
+    flaky = registry.backends[0]
+    assert translate(registry) == ('flaky:abc', 'flaky')
+    flaky.encode.failing = True
+    # Each failure still falls back, until the threshold opens the circuit
+    assert translate(registry) == ('builtin:abc', 'builtin')
+    assert translate(registry) == ('builtin:abc', 'builtin')
+    assert flaky.stats()['circuit'] == 'open'
+    calls = flaky.encode.calls
+    for _ in range(5):
+        assert translate(registry) == ('builtin:abc', 'builtin')
+    assert flaky.encode.calls == calls
+
+def test_one_trial_call_after_cooldown(registry):
+    flaky = registry.backends[0]
+    flaky.encode.failing = True
+    translate(registry)
+    translate(registry)
+    calls = flaky.encode.calls
+    time.sleep(0.06)
+    # Half-open: the first request tries the backend, the next ones wait
+    assert flaky.available(time.time())
+    assert not flaky.available(time.time())
+    time.sleep(0.06)
+    translate(registry)
+    translate(registry)
+    assert flaky.encode.calls == calls + 1
+    assert flaky.stats()['circuit'] == 'open'
+
+def test_successful_trial_closes_the_circuit(registry):
+    flaky = registry.backends[0]
+    flaky.encode.failing = True
+    translate(registry)
+    translate(registry)
+    flaky.encode.failing = False
+    time.sleep(0.06)
+    assert translate(registry) == ('flaky:abc', 'flaky')
+    assert flaky.stats()['circuit'] == 'closed'
+    assert translate(registry) == ('flaky:abc', 'flaky')
+
+def test_unverified_and_unsupported_backends_are_skipped(registry):
+    flaky = registry.backends[0]
+    assert registry.translate('abc', 'grade2', 'en', False) == ('builtin:abc', 'builtin')
+    assert registry.translate('⠁', GRADE_1, 'en', True) == ('builtin:⠁', 'builtin')
+    assert flaky.encode.calls == 0
+
+def test_calibration_drops_backends_that_fail_the_probe(translator):
+    wrong = TranslationBackend('wrong', lambda text, standard, language: text.upper())
+    builtin = TranslationBackend('builtin', translator.text_to_braille_basic, translator.braille_to_text_basic)
+    registry = BackendRegistry([wrong, builtin])
+    registry.calibrate(repeat=1)
+    assert [backend.name for backend in registry.backends] == ['builtin', 'wrong']
+    assert not wrong.verified
+    assert (GRADE_1, False) in builtin.verified and builtin.calibrated_ms is not None
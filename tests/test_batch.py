@@ -0,0 +1,40 @@
+"""The /api/braille/translate/batch endpoint"""
+
+import braille_api
+
+BATCH_URL = '/api/braille/translate/batch'
+
+def test_results_follow_request_order(client):
+    response = client.post(BATCH_URL, json={
+        'items': ['abc', {'text': 'the', 'standard': 'grade2'}, {'text': 'xyz'}],
+        'defaults': {'format_output': False},
+    })
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success'] is True
+    assert body['count'] == 3
+    assert [result['result'] for result in body['results']] == ['⠁⠃⠉', '⠮', '⠭⠽⠵']
+
+def test_malformed_items_get_their_own_error(client):
+    response = client.post(BATCH_URL, json={
+        'items': ['abc', 42, {'text': 'x', 'reverse': 'yes'}, {'text': 'x', 'standard': 'grade9'}, 'def'],
+    })
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success'] is False
+    results = body['results']
+    assert results[0]['success'] and results[4]['success']
+    assert results[1] == {'success': False, 'error': 'Item must be an object or a string'}
+    assert results[2] == {'success': False, 'error': "'reverse' must be true or false"}
+    assert results[3]['success'] is False and 'grade9' in results[3]['error']
+
+def test_batch_size_is_capped(client, monkeypatch):
+    monkeypatch.setattr(braille_api, 'MAX_BATCH_SIZE', 3)
+    assert client.post(BATCH_URL, json={'items': ['a'] * 3}).status_code == 200
+    response = client.post(BATCH_URL, json={'items': ['a'] * 4})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Batch too large (max 3 items)'}
+
+def test_items_must_be_a_non_empty_list(client):
+    for body in ({'items': []}, {'items': 'abc'}, {'text': 'abc'}):
+        assert client.post(BATCH_URL, json=body).status_code == 400
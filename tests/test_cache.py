@@ -0,0 +1,136 @@
+"""Translation result caches"""
+
+import json
+import time
+
+import braille_api
+from braille_api import BrailleTranslationRequest, BrailleTranslator, DiskTranslationCache, TranslationCache
+
+KEY = ('abc', 'grade1', 'en', False, True)
+
+def test_memory_cache_hit_and_miss_counters():
+    cache = TranslationCache(max_bytes=10_000)
+    assert cache.get(KEY) is None
+    cache.put(KEY, ('⠁⠃⠉', 3), 100)
+    assert cache.get(KEY) == ('⠁⠃⠉', 3)
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+    assert stats['hit_rate'] == 0.5
+
+def test_memory_cache_evicts_least_recently_used():
+    entry = TranslationCache.ENTRY_OVERHEAD + 100
+    cache = TranslationCache(max_bytes=2 * entry)
+    cache.put(('a',), 'A', 100)
+    cache.put(('b',), 'B', 100)
+    cache.get(('a',))  # 'b' is now the least recently used
+    cache.put(('c',), 'C', 100)
+    assert cache.get(('b',)) is None
+    assert cache.get(('a',)) == 'A' and cache.get(('c',)) == 'C'
+    assert cache.stats()['evictions'] == 1
+    assert cache.current_bytes == 2 * entry
+
+def test_memory_cache_entries_expire_after_ttl():
+    cache = TranslationCache(max_bytes=10_000, ttl=0.05)
+    cache.put(KEY, 'value', 10)
+    assert cache.get(KEY) == 'value'
+    time.sleep(0.1)
+    assert cache.get(KEY) is None
+    assert cache.stats()['expirations'] == 1
+    assert cache.current_bytes == 0
+
+def test_memory_cache_clear():
+    cache = TranslationCache(max_bytes=10_000)
+    cache.put(('a',), 'A', 10)
+    cache.put(('b',), 'B', 10)
+    assert cache.clear() == 2
+    assert cache.get(('a',)) is None
+    assert cache.current_bytes == 0
+
+def test_repeated_request_is_served_from_cache():
+    translator = BrailleTranslator(disk_cache_path=None, offload_workers=0)
+    req = BrailleTranslationRequest(text='Hello World', include_metadata=True)
+    first = translator.translate(req)
+    second = translator.translate(req)
+    assert first.metadata['translation_method'] == 'basic'
+    assert second.metadata['translation_method'] == 'cache'
+    assert second.result == first.result
+    # Invalid requests are not cached
+    bad = BrailleTranslationRequest(text='x', standard='grade9')
+    assert not translator.translate(bad).success
+    assert translator.cache.stats()['entries'] == 1
+
+def test_clear_endpoint_requires_the_admin_key(client, monkeypatch):
+    monkeypatch.setattr(braille_api, 'ADMIN_API_KEY', 'secret')
+    client.post('/api/braille/translate', json={'text': 'cached text'})
+    assert client.post('/api/admin/cache/clear').status_code == 403
+    response = client.post('/api/admin/cache/clear', headers={'X-API-KEY': 'secret'})
+    assert response.status_code == 200
+    assert response.get_json()['cleared'] >= 1
+    assert braille_api.translator.cache.stats()['entries'] == 0
+
+def disk_totals(cache):
+    return tuple(cache._connection().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone())
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskTranslationCache(str(tmp_path / 'cache.db'), max_bytes=1 << 20)
+    assert cache.get(KEY) is None
+    cache.put(KEY, ('⠁⠃⠉', 3))
+    assert cache.get(KEY) == ('⠁⠃⠉', 3)
+    # Another handle on the same file sees the entry, as another worker would
+    assert DiskTranslationCache(cache.path, max_bytes=1 << 20).get(KEY) == ('⠁⠃⠉', 3)
+
+def test_disk_cache_evicts_least_recently_accessed(tmp_path):
+    size = len(json.dumps(('k0',))) + len('v' * 20)
+    cache = DiskTranslationCache(str(tmp_path / 'cache.db'), max_bytes=3 * size)
+    for i in range(3):
+        cache.put((f'k{i}',), ('v' * 20, 20))
+        time.sleep(0.01)
+    cache.get(('k0',))
+    cache.flush_accesses()  # 'k1' is now the least recently accessed
+    cache.put(('k3',), ('v' * 20, 20))
+    assert cache.get(('k1',)) is None
+    assert all(cache.get((f'k{i}',)) is not None for i in (0, 2, 3))
+    assert cache.evictions == 1
+
+def test_disk_cache_meta_counts_match_table(tmp_path):
+    cache = DiskTranslationCache(str(tmp_path / 'cache.db'), max_bytes=500)
+    for i in range(60):
+        cache.put((f'key {i % 40}',), ('x' * (i % 17 + 1), 1))
+    assert cache.evictions > 0
+    stats = cache.stats()
+    assert (stats['entries'], stats['bytes']) == disk_totals(cache)
+    assert stats['bytes'] <= 500
+    # A fresh handle reads the same counts from the meta table
+    reopened = DiskTranslationCache(cache.path, max_bytes=500).stats()
+    assert (reopened['entries'], reopened['bytes']) == disk_totals(cache)
+    assert cache.clear() == stats['entries']
+    assert (cache.stats()['entries'], cache.stats()['bytes']) == (0, 0) == disk_totals(cache)
+
+def test_disk_cache_hits_are_flushed_in_batches(tmp_path):
+    cache = DiskTranslationCache(str(tmp_path / 'cache.db'), max_bytes=1 << 20)
+    cache.put(KEY, ('⠁⠃⠉', 3))
+    hits = lambda: cache._connection().execute('SELECT hits FROM entries').fetchone()[0]
+    cache._accesses_flushed = time.monotonic() + 60  # keep the time trigger out of the way
+    for _ in range(DiskTranslationCache.ACCESS_FLUSH_BATCH - 1):
+        cache.get(KEY)
+    assert hits() == 0
+    cache.get(KEY)
+    assert hits() == DiskTranslationCache.ACCESS_FLUSH_BATCH
+
+def test_memory_cache_is_warmed_from_disk(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    first = BrailleTranslator(disk_cache_path=path, offload_workers=0)
+    req = BrailleTranslationRequest(text='warm start', include_metadata=True)
+    first.translate(req)
+    first.translate(BrailleTranslationRequest(text='cold entry'))
+    for _ in range(3):
+        first.disk_cache.get((req.text, req.standard, req.language, req.reverse, req.format_output))
+    first.disk_cache.flush_accesses()
+
+    second = BrailleTranslator(disk_cache_path=path, disk_cache_warm_entries=1, offload_workers=0)
+    assert second.cache.stats()['entries'] == 1
+    response = second.translate(req)
+    assert response.metadata['cached']
+    assert response.result == first.translate(req).result
+    # Served from memory without touching the disk tier
+    assert second.disk_cache.hits == second.disk_cache.misses == 0
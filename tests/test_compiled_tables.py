@@ -0,0 +1,76 @@
+"""Compiled (.gbt) custom Braille tables"""
+
+import json
+import os
+
+import pytest
+
+TABLE = {
+    'a': '⠁',
+    'b': '⠃',
+    'c': '⠉',
+    'é': '⠿',
+    'ch': '⠡',
+    'the': '⠮',
+    'th': '⠹',
+    'thing': '⠹⠬',
+}
+
+@pytest.fixture
+def table_path(tmp_path):
+    path = tmp_path / 'custom.json'
+    path.write_text(json.dumps(TABLE, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+def test_compiled_table_matches_source(preprocess, table_path):
+    artifact = preprocess.compile_braille_table(table_path)
+    assert artifact == table_path + preprocess.BRAILLE_TABLE_SUFFIX
+    table = preprocess.BinaryBrailleTable.open(artifact)
+    assert len(table) == len(TABLE)
+    for key, value in TABLE.items():
+        assert table[key] == value and key in table
+    assert table.get('z') is None and 'thin' not in table
+    with pytest.raises(KeyError):
+        table['tho']
+
+def test_translate_prefers_longest_match(preprocess, table_path):
+    table = preprocess.load_braille_table(table_path)
+    assert table.translate('the thing') == '⠮ ⠹⠬'
+    assert table.translate('thin ache') == '⠹in ⠁⠡e'
+    assert table.translate('abc é!') == '⠁⠃⠉ ⠿!'
+    assert table.translate('t') == 't'
+
+def test_from_mapping_matches_compiled_file(preprocess, table_path):
+    opened = preprocess.BinaryBrailleTable.open(preprocess.compile_braille_table(table_path))
+    built = preprocess.BinaryBrailleTable.from_mapping(TABLE)
+    text = 'the chain of things, the abc of éclairs'
+    assert built.translate(text) == opened.translate(text)
+    assert len(built) == len(opened)
+
+def test_load_reuses_fresh_artifact(preprocess, table_path):
+    first = preprocess.load_braille_table(table_path)
+    artifact = table_path + preprocess.BRAILLE_TABLE_SUFFIX
+    assert first.path == artifact
+    compiled_at = os.path.getmtime(artifact)
+    assert preprocess.load_braille_table(table_path).path == artifact
+    assert os.path.getmtime(artifact) == compiled_at
+    # The artifact can also be loaded directly
+    assert preprocess.load_braille_table(artifact).translate('cab') == '⠉⠁⠃'
+
+def test_load_recompiles_stale_artifact(preprocess, table_path):
+    preprocess.load_braille_table(table_path)
+    with open(table_path, 'w', encoding='utf-8') as f:
+        json.dump({**TABLE, 'a': '⠂'}, f, ensure_ascii=False)
+    artifact = table_path + preprocess.BRAILLE_TABLE_SUFFIX
+    stale = os.path.getmtime(table_path) - 10
+    os.utime(artifact, (stale, stale))
+    assert preprocess.load_braille_table(table_path).translate('a') == '⠂'
+
+def test_invalid_tables_are_rejected(preprocess, tmp_path):
+    path = tmp_path / 'bad.json'
+    path.write_text(json.dumps({'a': 1}), encoding='utf-8')
+    with pytest.raises(ValueError):
+        preprocess.compile_braille_table(str(path))
+    with pytest.raises(ValueError):
+        preprocess.BinaryBrailleTable(b'\0' * 64)
+    assert preprocess.load_braille_table(str(tmp_path / 'missing.json')) is None
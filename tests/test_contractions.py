@@ -0,0 +1,28 @@
+"""Grade 2 contraction matching (ContractionTrie and its word-position rules)"""
+
+import pytest
+
+from braille_api import ContractionContext, ContractionTrie
+
+GRADE_2 = 'grade2'
+
+@pytest.mark.parametrize('text, braille', [
+    ('the child and the dog', '⠮⠀⠉⠓⠊⠇⠙⠀⠯⠀⠮⠀⠙⠕⠛'),
+    ('with thee', '⠾⠀⠮⠑'),
+    ('sing', '⠎⠬'),  # "ing" after a letter
+    ('ingot', '⠊⠝⠛⠕⠞'),  # but not at the start of a word
+    ('bread', '⠃⠗⠂⠙'),  # "ea" between letters
+    ('eat', '⠑⠁⠞'),  # but not at either end
+    ('sea', '⠎⠑⠁'),
+])
+def test_grade2_contractions(translator, text, braille):
+    assert translator.text_to_braille_basic(text, GRADE_2) == braille
+
+def test_trie_prefers_the_longest_allowed_match():
+    trie = ContractionTrie({'th': 'A', 'the': 'B', 'there': 'C', 'ea': 'D'},
+                           {'ea': ContractionContext.MEDIAL})
+    assert trie.longest_match('therefore', 0) == (5, 'C')
+    assert trie.longest_match('then', 0) == (3, 'B')
+    assert trie.longest_match('bread', 2) == (4, 'D')
+    assert trie.longest_match('each', 0) is None
+    assert trie.max_length == 5
@@ -0,0 +1,28 @@
+"""Braille-to-text decoding (number runs and the longest-match cell trie)"""
+
+import random
+
+import pytest
+
+GRADE_1 = 'grade1'
+GRADE_2 = 'grade2'
+
+@pytest.mark.parametrize('braille, standard, text', [
+    ('⠓⠑⠇⠇⠕⠀⠺⠕⠗⠇⠙', GRADE_1, 'hello world'),
+    ('⠼⠁⠃⠉⠀⠍⠁⠊⠝', GRADE_1, '123 main'),
+    ('⠮⠀⠉⠓⠊⠇⠙⠀⠯⠀⠮⠀⠙⠕⠛', GRADE_2, 'the child and the dog'),
+    # A cell that is also Grade 1 punctuation keeps its Grade 1 reading
+    ('⠃⠗⠂⠙', GRADE_2, 'br,d'),
+])
+def test_decode(translator, braille, standard, text):
+    assert translator.braille_to_text_basic(braille, standard) == text
+
+@pytest.mark.parametrize('standard', [GRADE_1, GRADE_2])
+def test_decode_round_trip(translator, standard):
+    # Words whose cells all have a single reading
+    rng = random.Random(3)
+    for _ in range(300):
+        text = ' '.join(rng.choice(['the', 'and', 'for', 'child', 'sing', 'dog', '42', 'owner'])
+                        for _ in range(rng.randint(1, 8)))
+        braille = translator.text_to_braille_basic(text, standard)
+        assert translator.braille_to_text_basic(braille, standard) == text
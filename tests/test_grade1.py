@@ -0,0 +1,24 @@
+"""Grade 1 encoding through the precompiled per-table passes"""
+
+import pytest
+
+from braille_api import TranslationTable
+
+GRADE_1 = 'grade1'
+
+@pytest.mark.parametrize('text, braille', [
+    ('Hello World', '⠓⠑⠇⠇⠕⠀⠺⠕⠗⠇⠙'),
+    ('abc xyz', '⠁⠃⠉⠀⠭⠽⠵'),
+    ('123 Main St.', '⠼⠁⠃⠉⠀⠍⠁⠊⠝⠀⠎⠞⠲'),
+    ("braille, isn't it?", '⠃⠗⠁⠊⠇⠇⠑⠂⠀⠊⠎⠝⠄⠞⠀⠊⠞⠦'),
+    ('  padded  ', '⠏⠁⠙⠙⠑⠙'),
+    ('', ''),
+])
+def test_grade1_encode(translator, text, braille):
+    assert translator.text_to_braille_basic(text, GRADE_1) == braille
+
+def test_number_sign_starts_each_digit_run(translator):
+    assert translator.text_to_braille_basic('10 to 20', GRADE_1) == '⠼⠁⠚⠀⠞⠕⠀⠼⠃⠚'
+
+def test_unknown_characters_become_blank_cells(translator):
+    assert translator.text_to_braille_basic('a~b', GRADE_1) == '⠁' + TranslationTable.BLANK_CELL + '⠃'
@@ -0,0 +1,181 @@
+"""Vectorized image renderers, checked against per-pixel references"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from braille_benchmark import legacy_image_to_braille  # noqa: E402
+
+# Odd sizes, so the last cell row and column are partial
+SHAPES = [(1, 1), (4, 2), (7, 5), (13, 30), (64, 81)]
+
+def random_binary(shape, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.where(rng.random(shape) < 0.5, 0, 255).astype(np.uint8)
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_render_braille_text_matches_per_pixel_reference(preprocess, shape):
+    img = random_binary(shape)
+    assert preprocess.render_braille_text(img) == legacy_image_to_braille(img)
+
+def test_dot_numbering(preprocess):
+    # Black pixels are raised dots; dot 1 is top left, dot 8 bottom right
+    img = np.full((4, 2), 255, dtype=np.uint8)
+    assert preprocess.render_braille_text(img) == '⠀'
+    img[0, 0] = 0
+    assert preprocess.render_braille_text(img) == '⠁'
+    img[3, 1] = 0
+    assert preprocess.render_braille_text(img) == '⢁'
+    assert preprocess.render_braille_text(np.zeros((4, 2), np.uint8)) == '⣿'
+
+def test_image_to_braille_writes_utf8(preprocess, tmp_path):
+    img = random_binary((9, 11), seed=3)
+    path = tmp_path / 'out.txt'
+    preprocess.image_to_braille(img, str(path))
+    assert path.read_text(encoding='utf-8') == legacy_image_to_braille(img)
+
+def test_cell_matrix_six_and_eight_dot_cells(preprocess):
+    # Dots 1, 5 and 6 raised in the top 2x3 cell; the 4th pixel row is dot 7
+    # of the 2x4 cell, but the first row of a second 6-dot cell
+    img = np.full((4, 2), 255, dtype=np.uint8)
+    img[0, 0] = img[1, 1] = img[2, 1] = img[3, 0] = 0
+    cells = preprocess.BrailleCellMatrix(img)
+    assert cells.dots(6).tolist() == [[0b110001], [0b000001]]
+    assert cells.dots(8).tolist() == [[0b1110001]]
+    assert ''.join(map(chr, cells.unicode(6).ravel())) == '⠱⠁'
+    assert ''.join(map(chr, cells.ascii_braille().ravel())) == ':A'
+    # Each cell size is rendered once
+    assert cells.dots(8) is cells.dots(8)
+
+def test_cell_matrix_invert(preprocess):
+    img = random_binary((8, 6), seed=1)
+    assert np.array_equal(preprocess.BrailleCellMatrix(img, invert=True).dots(8),
+                          preprocess.BrailleCellMatrix(255 - img).dots(8))
+
+def test_writers_accept_a_shared_cell_matrix(preprocess, tmp_path):
+    img = random_binary((17, 23), seed=2)
+    cells = preprocess.BrailleCellMatrix(img)
+    for writer, kwargs in [(preprocess.image_to_brf, {'header': 'H', 'footer': 'F'}),
+                           (preprocess.image_to_brf_ascii, {'line_length': 20}),
+                           (preprocess.image_to_ascii, {})]:
+        from_image, from_cells = tmp_path / 'image.out', tmp_path / 'cells.out'
+        writer(img, str(from_image), **kwargs)
+        writer(cells, str(from_cells), **kwargs)
+        assert from_image.read_bytes() == from_cells.read_bytes(), writer.__name__
+
+def test_brf_lines_are_padded_with_crlf(preprocess, tmp_path):
+    img = random_binary((12, 10), seed=4)
+    path = tmp_path / 'out.brf'
+    preprocess.image_to_brf(img, str(path), line_length=8, header='TITLE', footer='END')
+    lines = path.read_bytes().decode('utf-8').split('\r\n')
+    assert lines[0] == 'TITLE' and lines[-1] == 'END'
+    rows = legacy_image_to_braille(img).split('\n')
+    assert lines[1:-1] == [row.ljust(8) for row in rows]
+
+def test_nabcc_round_trip(preprocess):
+    assert preprocess.unicode_to_brf_ascii('⠁⠃⠉ ⠀⠼⠁\r\n') == 'ABC  #A\r\n'
+    assert preprocess.brf_ascii_to_unicode('ABC #A\r\n') == '⠁⠃⠉⠀⠼⠁\r\n'
+    assert preprocess.brf_ascii_to_unicode('abc') == '⠁⠃⠉'
+    # Every 6-dot cell survives the round trip; dots 7 and 8 are dropped
+    cells = ''.join(chr(0x2800 + pattern) for pattern in range(64))
+    assert preprocess.brf_ascii_to_unicode(preprocess.unicode_to_brf_ascii(cells)) == cells
+    assert preprocess.unicode_to_brf_ascii('⣿') == '='
+
+def test_ascii_brf_matches_unicode_six_dot_cells(preprocess):
+    cells = preprocess.BrailleCellMatrix(random_binary((30, 40), seed=5))
+    unicode = ''.join(map(chr, cells.unicode(6).ravel()))
+    ascii_braille = ''.join(map(chr, cells.ascii_braille().ravel()))
+    assert preprocess.unicode_to_brf_ascii(unicode) == ascii_braille
+
+def test_transcode_brf_file(preprocess, tmp_path):
+    source = tmp_path / 'in.brf'
+    source.write_bytes('⠓⠑⠇⠇⠕\r\n⠼⠁⠃\r\n'.encode('utf-8'))
+    ascii_path, back = tmp_path / 'ascii.brf', tmp_path / 'back.brf'
+    # A small chunk size exercises chunked conversion
+    preprocess.transcode_brf_file(str(source), str(ascii_path), to='ascii', chunk_size=3)
+    assert ascii_path.read_bytes() == b'HELLO\r\n#AB\r\n'
+    preprocess.transcode_brf_file(str(ascii_path), str(back), to='unicode')
+    assert back.read_bytes() == source.read_bytes()
+    with pytest.raises(ValueError):
+        preprocess.transcode_brf_file(str(source), str(back), to='ebcdic')
+
+def reference_ascii_art(img, invert=False):
+    black, white = (' ', '#') if invert else ('#', ' ')
+    return '\n'.join(''.join(black if value == 0 else white for value in row) for row in img)
+
+@pytest.mark.parametrize('invert', [False, True])
+@pytest.mark.parametrize('band_rows', [None, 1, 4])
+def test_image_to_ascii_matches_reference(preprocess, tmp_path, invert, band_rows):
+    img = random_binary((13, 9), seed=6)
+    img[0, 0] = 17  # Grayscale values other than 0 read as white
+    path = tmp_path / 'art.txt'
+    preprocess.image_to_ascii(img, str(path), invert=invert, band_rows=band_rows)
+    assert path.read_bytes().decode('ascii') == reference_ascii_art(img, invert)
+
+def test_ascii_art_from_memmap(preprocess, tmp_path):
+    img = random_binary((10, 7), seed=7)
+    np.save(tmp_path / 'img.npy', img)
+    pixels = np.load(tmp_path / 'img.npy', mmap_mode='r')
+    path = tmp_path / 'art.txt'
+    preprocess.image_to_ascii(pixels, str(path), band_rows=3)
+    assert path.read_bytes().decode('ascii') == reference_ascii_art(img)
+
+def write_image(path, img):
+    if path.suffix == '.npy':
+        np.save(path, img)
+    elif path.suffix == '.pgm':
+        path.write_bytes(f'P5\n# comment\n{img.shape[1]} {img.shape[0]}\n255\n'.encode('ascii') + img.tobytes())
+    elif path.suffix == '.pbm':
+        bits = np.packbits(img == 0, axis=1)
+        path.write_bytes(f'P4\n{img.shape[1]} {img.shape[0]}\n'.encode('ascii') + bits.tobytes())
+    else:
+        import cv2
+        assert cv2.imwrite(str(path), img)
+
+def whole_image_output(preprocess, img, fmt, path, header=None, footer=None):
+    if fmt == 'braille':
+        preprocess.image_to_braille(img, str(path))
+    elif fmt == 'brf':
+        preprocess.image_to_brf(img, str(path), line_length=12, header=header, footer=footer)
+    elif fmt == 'brf-ascii':
+        preprocess.image_to_brf_ascii(img, str(path), line_length=12, header=header, footer=footer)
+    else:
+        preprocess.image_to_ascii(img, str(path))
+    return path.read_bytes()
+
+@pytest.mark.parametrize('suffix', ['.npy', '.pgm', '.pbm', '.png'])
+@pytest.mark.parametrize('fmt', ['braille', 'brf', 'brf-ascii', 'ascii'])
+@pytest.mark.parametrize('strip_cells', [1, 3])
+def test_stream_render_matches_whole_image(preprocess, tmp_path, suffix, fmt, strip_cells):
+    img = random_binary((29, 19), seed=8)
+    source = tmp_path / f'scan{suffix}'
+    write_image(source, img)
+    framed = fmt in ('brf', 'brf-ascii')
+    header, footer = ('HEAD', 'FOOT') if framed else (None, None)
+    streamed = tmp_path / 'streamed.out'
+    preprocess.stream_render_image(str(source), str(streamed), fmt, line_length=12, header=header,
+                                   footer=footer, strip_cells=strip_cells, workers=2)
+    expected = whole_image_output(preprocess, img, fmt, tmp_path / 'whole.out', header, footer)
+    assert streamed.read_bytes() == expected
+
+def test_stream_render_thresholds_grayscale(preprocess, tmp_path):
+    rng = np.random.default_rng(9)
+    gray = rng.integers(0, 256, (21, 14), dtype=np.uint8)
+    write_image(tmp_path / 'gray.pgm', gray)
+    streamed = tmp_path / 'streamed.txt'
+    preprocess.stream_render_image(str(tmp_path / 'gray.pgm'), str(streamed), 'braille',
+                                   threshold=127, strip_cells=2)
+    binary = np.where(gray > 127, 255, 0).astype(np.uint8)
+    assert streamed.read_text(encoding='utf-8') == legacy_image_to_braille(binary)
+
+def test_strips_must_be_read_in_order(preprocess, tmp_path):
+    write_image(tmp_path / 'img.pbm', random_binary((8, 8)))
+    with preprocess.open_image_strips(str(tmp_path / 'img.pbm')) as (height, width, read):
+        assert (height, width) == (8, 8)
+        read(0, 4)
+        with pytest.raises(ValueError):
+            read(0, 4)
+
+def test_stream_render_rejects_unknown_format(preprocess, tmp_path):
+    with pytest.raises(ValueError):
+        preprocess.stream_render_image('in.npy', str(tmp_path / 'out'), 'pdf')
@@ -0,0 +1,68 @@
+"""Incremental retranslation for live-typing clients"""
+
+import random
+
+import pytest
+
+from fuzzing import FUZZ_WORDS, random_text
+
+INCREMENTAL_URL = '/api/braille/translate/incremental'
+
+def apply_patch(braille, patch):
+    return braille[:patch['offset']] + patch['inserted'] + braille[patch['offset'] + patch['deleted']:]
+
+@pytest.mark.parametrize('standard', ['grade1', 'grade2'])
+def test_translate_edit_matches_full_retranslation(translator, standard):
+    rng = random.Random(13)
+    local = 0
+    for _ in range(2000):
+        text = random_text(rng)
+        braille = translator.text_to_braille_basic(text, standard)
+        offset = rng.randint(0, len(text))
+        deleted = rng.randint(0, min(len(text) - offset, 6))
+        inserted = rng.choice(['', ' ', 'x', 'the ', ' and', 'ea', '9', '\n', rng.choice(FUZZ_WORDS)])
+        new_text = text[:offset] + inserted + text[offset + deleted:]
+
+        patch = translator.translate_edit(text, braille, offset, deleted, inserted, standard)
+        patched = braille[:patch.offset] + patch.inserted + braille[patch.offset + patch.deleted:]
+        assert patched == translator.text_to_braille_basic(new_text, standard), (text, offset, deleted, inserted)
+        local += not patch.full_retranslation
+    # The whole text is only retranslated when the blank count cannot be trusted
+    assert local == 2000
+
+def test_translate_edit_rejects_range_outside_text(translator):
+    with pytest.raises(ValueError):
+        translator.translate_edit('abc', '⠁⠃⠉', 2, 5, '')
+
+def test_incremental_endpoint_returns_a_patch(client, translator):
+    text = 'the child and the dog'
+    braille = translator.text_to_braille_basic(text, 'grade2')
+    response = client.post(INCREMENTAL_URL, json={
+        'text': text, 'braille': braille, 'standard': 'grade2',
+        'edit': {'offset': 4, 'deleted': 5, 'inserted': 'owner'}})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success'] and body['standard_used'] == 'grade2'
+    assert apply_patch(braille, body['patch']) == translator.text_to_braille_basic(
+        'the owner and the dog', 'grade2')
+
+@pytest.mark.parametrize('payload, error', [
+    ({'edit': {'offset': 2, 'deleted': 5}}, 'Edit range is outside the text'),
+    ({'edit': {'offset': '1'}}, "'offset' must be an integer"),
+    # JSON true is not the integer 1
+    ({'edit': {'offset': True}}, "'offset' must be an integer"),
+    ({'edit': {'offset': 0, 'deleted': False}}, "'deleted' must be an integer"),
+    ({'edit': {'offset': 0, 'inserted': 5}}, "'inserted' must be a string"),
+    ({'edit': {'deleted': 1}}, "'edit' must have an 'offset'"),
+    ({'edit': [0, 1]}, "'edit' must be an object"),
+    ({'braille': 7, 'edit': {'offset': 1}}, "'braille' must be a string"),
+    ({'edit': {'offset': 1}, 'standard': 'grade9'}, 'Unsupported standard: grade9'),
+])
+def test_incremental_endpoint_rejects_bad_edits(client, payload, error):
+    response = client.post(INCREMENTAL_URL, json={'text': 'abc', 'braille': '⠁⠃⠉', **payload})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
+
+def test_incremental_endpoint_rejects_non_object_body(client):
+    response = client.post(INCREMENTAL_URL, json=['abc'])
+    assert response.status_code == 400
@@ -0,0 +1,67 @@
+"""Prometheus metrics: sharded counters, histograms and the scrape endpoint"""
+
+import threading
+
+from braille_api import MetricsRegistry
+
+def test_counters_and_histograms_render():
+    registry = MetricsRegistry()
+    registry.counter('events_total', 'Events.')
+    registry.histogram('latency_seconds', 'Latency.', (0.1, 1.0))
+    registry.inc('events_total', kind='a')
+    registry.inc('events_total', 2, kind='b')
+    for seconds in (0.05, 0.5, 5):
+        registry.observe('latency_seconds', seconds, route='/x')
+    lines = registry.render().splitlines()
+    assert lines[:4] == ['# HELP events_total Events.', '# TYPE events_total counter',
+                         'events_total{kind="a"} 1', 'events_total{kind="b"} 2']
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/x",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/x"} 3' in lines
+
+def test_metrics_shards_are_retired_with_their_threads():
+    registry = MetricsRegistry()
+    registry.counter('events_total', 'Events.')
+    threads = [threading.Thread(target=registry.inc, args=('events_total',)) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    assert len(registry._shards) == 0
+    assert 'events_total 50' in registry.render()
+
+def test_failing_collector_is_skipped():
+    registry = MetricsRegistry()
+    registry.counter('events_total', 'Events.')
+    registry.collector(lambda: 1 / 0)
+    registry.collector(lambda: [('temperature', 'gauge', 'Heat.', {}, 21)])
+    assert registry.render().endswith('temperature 21\n')
+
+def test_scrape_endpoint_counts_requests(client):
+    client.get('/health')
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain')
+    body = response.get_data(as_text=True)
+    assert 'braille_http_requests_total{method="GET",route="/health",status="200"}' in body
+    assert '# TYPE braille_cache_entries gauge' in body
+
+def test_collector_families_are_contiguous():
+    registry = MetricsRegistry()
+    def tiers():
+        for tier in ('memory', 'disk'):
+            yield ('cache_entries', 'gauge', 'Entries.', {'tier': tier}, 1)
+            yield ('cache_bytes', 'gauge', 'Bytes.', {'tier': tier}, 2)
+    registry.collector(tiers)
+    registry.collector(lambda: [('cache_entries', 'gauge', 'Entries.', {'tier': 'other'}, 3)])
+    assert registry.render().splitlines() == [
+        '# HELP cache_entries Entries.',
+        '# TYPE cache_entries gauge',
+        'cache_entries{tier="memory"} 1',
+        'cache_entries{tier="disk"} 1',
+        'cache_entries{tier="other"} 3',
+        '# HELP cache_bytes Bytes.',
+        '# TYPE cache_bytes gauge',
+        'cache_bytes{tier="memory"} 2',
+        'cache_bytes{tier="disk"} 2',
+    ]
@@ -0,0 +1,50 @@
+"""Process-pool offload of large translations"""
+
+import pytest
+
+import braille_api
+from braille_api import BrailleTranslationRequest, BrailleTranslator, TranslationOffloader
+
+@pytest.fixture
+def offloading(monkeypatch):
+    """The deployed translator, offloading every request to a fresh pool"""
+    offloaders = []
+    def install(timeout):
+        offload = TranslationOffloader(1, timeout=timeout)
+        offloaders.append(offload)
+        monkeypatch.setattr(braille_api.translator, 'offload', offload)
+        monkeypatch.setattr(braille_api.translator, 'offload_threshold', 1)
+        return offload
+    yield install
+    for offload in offloaders:
+        offload.shutdown()
+
+def test_offloaded_translation_matches_inline(translator):
+    pooled = BrailleTranslator(cache_max_bytes=0, disk_cache_path=None, offload_workers=1, offload_threshold=1)
+    try:
+        text = 'the child and the dog, offloaded'
+        req = BrailleTranslationRequest(text=text, standard='grade2', include_metadata=True)
+        response = pooled.translate(req)
+        assert response.result == translator.translate(req).result
+        assert response.metadata['translation_method'].endswith('(offloaded)')
+        assert pooled.offload.stats()['completed'] == 1
+    finally:
+        pooled.offload.shutdown()
+
+def test_offload_timeout_is_a_503(client, offloading):
+    offload = offloading(timeout=1e-4)
+    response = client.post('/api/braille/translate', json={'text': 'too slow to wait for'})
+    assert response.status_code == 503
+    assert 'retry later' in response.get_json()['error']
+    assert offload.stats()['timeouts'] == 1
+
+def test_offload_timeout_fails_only_its_batch_item(client, offloading, monkeypatch):
+    offloading(timeout=1e-4)
+    monkeypatch.setattr(braille_api.translator, 'offload_threshold', 20)
+    response = client.post('/api/braille/translate/batch', json={
+        'items': ['short one', 'a long enough text to be offloaded', 'short two']})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert not body['success']
+    assert [result['success'] for result in body['results']] == [True, False, True]
+    assert 'retry later' in body['results'][1]['error']
@@ -0,0 +1,47 @@
+"""Per-request stage timings and admin-only profiling"""
+
+import pytest
+
+import braille_api
+
+ADMIN = {'X-API-KEY': 'secret'}
+
+@pytest.fixture(autouse=True)
+def admin_key(monkeypatch):
+    monkeypatch.setattr(braille_api, 'ADMIN_API_KEY', 'secret')
+
+def translate(client, headers=None, **payload):
+    return client.post('/api/braille/translate', json={'text': 'the child', **payload}, headers=headers or {})
+
+def test_metadata_includes_stage_timings(client):
+    response = translate(client, include_metadata=True, text='timed stages')
+    timing = response.get_json()['metadata']['timing_ms']
+    assert {'cache_lookup', 'validate', 'translate', 'postprocess'} <= set(timing)
+
+def test_profiling_requires_the_admin_key(client):
+    assert translate(client, profile=True).status_code == 403
+    assert translate(client, {'X-API-KEY': 'wrong'}, profile='cprofile').status_code == 403
+
+@pytest.mark.parametrize('mode', ['stages', 'cprofile', 'sample'])
+def test_profile_report(client, mode):
+    response = translate(client, ADMIN, profile=mode)
+    assert response.status_code == 200
+    report = response.get_json()['metadata']['profile']
+    assert report['mode'] == mode
+    # The caches are bypassed, so the translation itself is timed
+    assert 'translate' in report['stages_ms'] and 'serialize' in report['stages_ms']
+    if mode == 'cprofile':
+        assert report['top']
+
+def test_unknown_profile_mode(client):
+    response = translate(client, ADMIN, profile='perf')
+    assert response.status_code == 400
+    assert 'Unsupported profile mode' in response.get_json()['error']
+
+def test_concurrent_profiling_is_refused(client):
+    with braille_api._profile_lock:
+        response = translate(client, ADMIN, profile='cprofile')
+        assert response.status_code == 429
+        # Stage timings need no profiler and are always allowed
+        assert translate(client, ADMIN, profile='stages').status_code == 200
+    assert translate(client, ADMIN, profile='cprofile').status_code == 200
@@ -0,0 +1,55 @@
+"""Request parsing, lean responses and JSON encoding"""
+
+import json
+
+import pytest
+
+from braille_api import BrailleTranslationRequest, dumps_json
+
+def test_from_dict_defaults():
+    req = BrailleTranslationRequest.from_dict({})
+    assert req == BrailleTranslationRequest(text='')
+    req = BrailleTranslationRequest.from_dict({'text': 'x', 'reverse': None}, defaults={'standard': 'grade2'})
+    assert (req.text, req.standard, req.reverse) == ('x', 'grade2', False)
+    # Explicit fields win over the defaults
+    req = BrailleTranslationRequest.from_dict({'standard': 'grade1'}, defaults={'standard': 'grade2'})
+    assert req.standard == 'grade1'
+
+@pytest.mark.parametrize('data, error', [
+    ({'text': 42}, "'text' must be a string"),
+    ({'text': 'x', 'language': ['en']}, "'language' must be a string"),
+    ({'text': 'x', 'reverse': 'yes'}, "'reverse' must be true or false"),
+    ({'text': 'x', 'lean': 1}, "'lean' must be true or false"),
+])
+def test_from_dict_rejects_mistyped_fields(data, error):
+    with pytest.raises(ValueError, match=error):
+        BrailleTranslationRequest.from_dict(data)
+
+def test_mistyped_field_is_a_400(client):
+    response = client.post('/api/braille/translate', json={'text': 'x', 'format_output': 'no'})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == "'format_output' must be true or false"
+
+def test_lean_response_drops_echo_and_nulls(client):
+    full = client.post('/api/braille/translate', json={'text': 'lean'}).get_json()
+    lean = client.post('/api/braille/translate', json={'text': 'lean', 'lean': True}).get_json()
+    assert set(full) - set(lean) == {'original_text', 'metadata', 'error'}
+    assert {key: full[key] for key in lean} == lean
+    # Metadata that was asked for is kept
+    lean = client.post('/api/braille/translate',
+                       json={'text': 'lean', 'lean': True, 'include_metadata': True}).get_json()
+    assert 'metadata' in lean and 'original_text' not in lean
+
+def test_dumps_json_is_compact_utf8():
+    payload = {'result': '⠓⠑⠇⠇⠕', 'count': 5, 'metadata': None}
+    encoded = dumps_json(payload)
+    assert isinstance(encoded, bytes)
+    assert '⠓⠑⠇⠇⠕'.encode('utf-8') in encoded and b', ' not in encoded
+    assert json.loads(encoded) == payload
+
+@pytest.mark.parametrize('url', ['/api/braille/translate', '/api/braille/translate/batch'])
+@pytest.mark.parametrize('body', [[1], 'x', 7, True])
+def test_non_object_body_is_a_400(client, url, body):
+    response = client.post(url, json=body)
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Request body must be a JSON object'
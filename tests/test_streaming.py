@@ -0,0 +1,52 @@
+"""Streaming translation (translate_stream and /api/braille/translate/stream)"""
+
+import io
+import random
+
+import pytest
+
+from fuzzing import random_chunks, random_text
+
+GRADE_1 = 'grade1'
+GRADE_2 = 'grade2'
+STREAM_URL = '/api/braille/translate/stream'
+
+@pytest.mark.parametrize('standard', [GRADE_1, GRADE_2])
+@pytest.mark.parametrize('format_output', [False, True])
+def test_stream_matches_whole_text(translator, standard, format_output):
+    rng = random.Random(5)
+    for _ in range(500):
+        text = random_text(rng, max_words=30)
+        whole, _ = translator.postprocess(translator.text_to_braille_basic(text, standard), format_output)
+        streamed = ''.join(translator.translate_stream(random_chunks(rng, text), standard,
+                                                       format_output=format_output))
+        assert streamed == whole, text
+
+@pytest.mark.parametrize('standard', [GRADE_1, GRADE_2])
+def test_reverse_stream_matches_whole_text(translator, standard):
+    rng = random.Random(7)
+    for _ in range(500):
+        braille = translator.text_to_braille_basic(random_text(rng, max_words=30), standard)
+        streamed = ''.join(translator.translate_stream(random_chunks(rng, braille), standard, reverse=True))
+        assert streamed == translator.braille_to_text_basic(braille, standard)
+
+def test_stream_endpoint_accepts_raw_and_multipart_bodies(client):
+    text = 'the quick brown fox ' * 1000
+    expected = '⠞⠓⠑⠀⠟⠥⠊⠉⠅⠀⠃⠗⠕⠺⠝⠀⠋⠕⠭⠀' * 999 + '⠞⠓⠑⠀⠟⠥⠊⠉⠅⠀⠃⠗⠕⠺⠝⠀⠋⠕⠭'
+    raw = client.post(STREAM_URL, data=text.encode('utf-8'), content_type='application/octet-stream')
+    assert raw.status_code == 200
+    assert raw.get_data(as_text=True) == expected
+    upload = client.post(STREAM_URL, data={'file': (io.BytesIO(text.encode('utf-8')), 'book.txt')},
+                         content_type='multipart/form-data')
+    assert upload.get_data(as_text=True) == expected
+
+def test_stream_endpoint_reads_form_urlencoded_body_as_text(client, translator):
+    # What curl -d sends; the body must not be parsed as form fields
+    text = 'fish & chips = dinner'
+    response = client.post(STREAM_URL, data=text.encode('utf-8'),
+                           content_type='application/x-www-form-urlencoded')
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == translator.text_to_braille_basic(text, 'grade1')
+
+def test_stream_endpoint_rejects_unknown_standard(client):
+    assert client.post(STREAM_URL + '?standard=grade9', data=b'abc').status_code == 400
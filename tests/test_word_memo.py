@@ -0,0 +1,32 @@
+"""Word-level memoization in the Grade 2 translation table"""
+
+import random
+
+from braille_api import TranslationTable, WordMemo
+from fuzzing import random_text
+
+def test_word_memo_matches_unmemoized(translator):
+    memoized = translator.get_table('grade2')
+    assert memoized.memo is not None
+    plain = TranslationTable(memoized.standard, memoized.language, memoized.char_map,
+                             translator.grade2_contractions, translator.grade2_contexts)
+    assert plain.memo is None
+    rng = random.Random(12)
+    for _ in range(1000):
+        text = random_text(rng).lower()
+        # Twice, so the second call is served from the memo
+        assert memoized.encode(text) == plain.encode(text)
+        assert memoized.encode(text) == plain.encode(text)
+
+def test_word_memo_is_bounded_and_counts_hits():
+    memo = WordMemo(max_entries=2)
+    encoded = []
+    def encode_words(words):
+        encoded.extend(words)
+        return [word.upper() for word in words]
+    assert memo.translate('ab cd ab', encode_words) == 'AB CD AB'
+    # Each distinct token is encoded once, separators included
+    assert sorted(encoded) == [' ', 'ab', 'cd']
+    assert memo.translate('cd', encode_words) == 'CD'
+    stats = memo.stats()
+    assert (stats['entries'], stats['hits'], stats['misses'], stats['evictions']) == (2, 1, 3, 1)